@@ -0,0 +1,91 @@
+"""Compares ways of serving tax estimates from asyncio under many concurrent clients.
+
+Each client sends its requests one after another, as a web handler awaiting each estimate would, and the latency of
+every request is recorded. Run from the project root:
+
+    python3 benchmarks/aio.py
+    python3 benchmarks/aio.py --clients 1000 --requests 50 --processes 4
+"""
+# Standard Library Imports
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Local Imports
+import easytax
+from easytax.aio.MicroBatcher import MicroBatcher
+from easytax.utils.Constants import MARRIED_FILING_JOINTLY, GEORGIA
+
+
+def make_household(rng: random.Random):
+    return [{
+        "salaries_and_wages": round(rng.uniform(20000, 400000), 2),
+        "long_term_capital_gains": round(rng.uniform(0, 50000), 2),
+    }]
+
+
+async def inline(household):
+    # Blocks the event loop for the whole calculation
+    return easytax.compute(household, 2024, MARRIED_FILING_JOINTLY, GEORGIA)
+
+
+async def run_in_executor(household):
+    return await asyncio.get_running_loop().run_in_executor(None, easytax.compute, household, 2024, MARRIED_FILING_JOINTLY, GEORGIA)
+
+
+async def load(estimate, clients: int, requests: int):
+    latencies = []
+
+    async def client(seed: int):
+        rng = random.Random(seed)
+        for _ in range(requests):
+            household = make_household(rng)
+            start = time.perf_counter()
+            await estimate(household)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(seed) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, latencies
+
+
+async def measure(label: str, estimate, clients: int, requests: int):
+    # A single request on an idle server, then the full load
+    _, idle = await load(estimate, 1, 200)
+    rate, latencies = await load(estimate, clients, requests)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{label:<28} {rate:>10,.0f} req/s   idle p50 {statistics.median(idle) * 1e3:>6.2f} ms   "
+        f"loaded p50 {quantiles[49] * 1e3:>8.2f} ms   p99 {quantiles[98] * 1e3:>8.2f} ms")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=500, help="Concurrent clients.")
+    parser.add_argument("--requests", type=int, default=40, help="Requests each client sends.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Worker processes of the process-pool backend.")
+    args = parser.parse_args()
+
+    # Resolve the tax tables before timing
+    easytax.compute(make_household(random.Random(0)), 2024, MARRIED_FILING_JOINTLY, GEORGIA)
+
+    await measure("inline", inline, args.clients, args.requests)
+    await measure("run_in_executor per call", run_in_executor, args.clients, args.requests)
+
+    async with MicroBatcher() as batcher:
+        await measure("MicroBatcher, thread", lambda household: batcher.estimate(household, 2024, MARRIED_FILING_JOINTLY, GEORGIA), args.clients, args.requests)
+
+    with ProcessPoolExecutor(args.processes) as executor:
+        async with MicroBatcher(executor=executor, max_concurrent_batches=args.processes) as batcher:
+            await measure(f"MicroBatcher, {args.processes} processes", lambda household: batcher.estimate(household, 2024, MARRIED_FILING_JOINTLY, GEORGIA), args.clients, args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
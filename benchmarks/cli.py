@@ -0,0 +1,74 @@
+"""Measures the throughput and peak memory of `easytax compute` as the input file grows.
+
+Writes CSV files of random households, then runs the command on each in a fresh process, so the peak resident
+memory of each run can be compared. With --columnar, each file is converted once with `easytax convert` first, and
+the command is run on the columnar directory instead, as a repeat run over the same households would be.
+Run from the project root:
+
+    python3 benchmarks/cli.py
+    python3 benchmarks/cli.py --households 100000 1000000 --processes 4
+    python3 benchmarks/cli.py --columnar
+"""
+# Standard Library Imports
+import argparse
+import csv
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def write_households(path: str, households: int):
+    rng = random.Random(0)
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["tax_year", "filing_status", "state", "state_data.exemptions", "salaries_and_wages", "long_term_capital_gains", "taxes_paid"])
+        for _ in range(households):
+            writer.writerow([2024, rng.choice(["Single", "Married_Filing_Jointly"]), rng.choice(["Georgia", "Florida"]), rng.randint(0, 3),
+                round(rng.uniform(20000, 400000), 2), round(rng.uniform(0, 50000), 2), round(rng.uniform(0, 20000), 2)])
+
+
+def convert(path: str, columns: str):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "easytax", "convert", path, columns], env=dict(os.environ, PYTHONPATH=SRC), check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def run(path: str, processes: int):
+    # A fresh wrapper process per run, so the RUSAGE_CHILDREN peak it reports is of this run's command alone
+    code = ("import resource, subprocess, sys; "
+        "subprocess.run(sys.argv[1:], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL); "
+        "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)")
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", code, sys.executable, "-m", "easytax", "compute", path, "--processes", str(processes)],
+        env=dict(os.environ, PYTHONPATH=SRC), check=True, capture_output=True, text=True).stdout
+    return time.perf_counter() - start, int(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--households", type=int, nargs="+", default=[20000, 200000], help="Sizes of input to compare.")
+    parser.add_argument("--processes", type=int, default=1, help="Processes calculating households.")
+    parser.add_argument("--columnar", action="store_true", help="Also convert each file to columns once, and run on those.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for households in args.households:
+            path = os.path.join(directory, f"households-{households}.csv")
+            write_households(path, households)
+            elapsed, peak = run(path, args.processes)
+            size = os.path.getsize(path) / 2**20
+            print(f"{households:>10,} households  {size:>8.1f} MiB  {households / elapsed:>10,.0f} households/s   peak RSS {peak / 1024:>6.1f} MiB")
+            if args.columnar:
+                columns = os.path.join(directory, f"households-{households}.columns")
+                converted = convert(path, columns)
+                elapsed, peak = run(columns, args.processes)
+                print(f"{'columnar':>21}  {'':>12}{households / elapsed:>10,.0f} households/s   peak RSS {peak / 1024:>6.1f} MiB   converted once in {converted:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compares the throughput and peak memory of TaxHandler.compute_many with a loop of TaxHandler objects.
+
+Run from the project root:
+
+    python3 benchmarks/compute_many.py
+    python3 benchmarks/compute_many.py --households 200000
+"""
+# Standard Library Imports
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Local Imports
+from easytax.handler.TaxHandler import TaxHandler
+from easytax.utils.Constants import MARRIED_FILING_JOINTLY, GEORGIA
+
+
+def make_households(count: int):
+    rng = random.Random(0)
+    return [[{
+        "salaries_and_wages": round(rng.uniform(20000, 400000), 2),
+        "long_term_capital_gains": round(rng.uniform(0, 50000), 2),
+        "interest_income": round(rng.uniform(0, 5000), 2),
+    }] for _ in range(count)]
+
+
+def per_object_loop(households):
+    # The loop batch jobs ran before: every handler is kept alive to report its summary
+    handlers = [TaxHandler(2024, MARRIED_FILING_JOINTLY, GEORGIA, household) for household in households]
+    return sum(handler.summary_json()["total_tax_owed"] for handler in handlers)
+
+
+def streamed(households):
+    return sum(summary["total_tax_owed"] for summary in TaxHandler.compute_many(households, tax_year=2024, filing_status=MARRIED_FILING_JOINTLY, state=GEORGIA))
+
+
+def measure(label: str, function, households):
+    start = time.perf_counter()
+    total = function(households)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(households)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} {len(households) / elapsed:>12,.0f} households/s {peak / 2**20:>10.1f} MiB peak")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--households", type=int, default=50000, help="Households to calculate.")
+    args = parser.parse_args()
+
+    households = make_households(args.households)
+    expected = measure("TaxHandler loop", per_object_loop, households)
+    total = measure("compute_many", streamed, households)
+    if total != expected:
+        raise SystemExit(f"compute_many disagrees with TaxHandler: {total} != {expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Measures the import time of each easytax subpackage in a fresh interpreter.
+
+Each module is imported in its own process with `python -X importtime`, so nothing is cached between measurements.
+Run from the project root:
+
+    python3 benchmarks/import_time.py
+    python3 benchmarks/import_time.py --repeat 20 --budget-ms 50
+"""
+# Standard Library Imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+MODULES = [
+    "easytax",
+    "easytax.handler",
+    "easytax.brackets",
+    "easytax.deductions",
+    "easytax.data.TaxData",
+    "easytax.brackets.FederalIncomeTaxBrackets",
+    "easytax.income.FederalIncomeHandler",
+    "easytax.handler.FederalTaxHandler",
+    "easytax.handler.TaxHandler",
+    "easytax.handler.TotalTaxCurve",
+]
+
+
+def measure(module: str):
+    """Returns the cumulative import time of a module in microseconds, and the self time of every module it imported."""
+    env = dict(os.environ, PYTHONPATH=SOURCE_DIRECTORY)
+    # Measure imports from cached bytecode, as an installed package would. The first run writes the cache.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], env=env, capture_output=True, text=True, check=True)
+
+    self_times = {}
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative_time, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        self_times[name] = int(self_time)
+        if name == module:
+            cumulative = int(cumulative_time)
+    return cumulative, self_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters per module. The median is reported.")
+    parser.add_argument("--top", type=int, default=3, help="Slowest imported modules to list for each module.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Exit non-zero if any module takes longer to import.")
+    args = parser.parse_args()
+
+    # Modules every interpreter imports at startup are not the cost of importing easytax
+    _, startup_modules = measure("sys")
+
+    over_budget = []
+    print(f"{'module':<45} {'median ms':>10}  slowest imports (self ms)")
+    for module in MODULES:
+        measure(module)
+        runs = [measure(module) for _ in range(args.repeat)]
+        median_ms = statistics.median(cumulative for cumulative, _ in runs) / 1000
+        imported = {name: self_time for name, self_time in runs[-1][1].items() if name not in startup_modules}
+        slowest = sorted(imported.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        print(f"{module:<45} {median_ms:>10.2f}  " + ", ".join(f"{name} {self_time / 1000:.2f}" for name, self_time in slowest))
+
+        if args.budget_ms is not None and median_ms > args.budget_ms:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Over the {args.budget_ms}ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Measures the cost of turning JSONL records into FederalIncomeHandlers, compared with the tax math on them.
+
+Run from the project root:
+
+    python3 benchmarks/ingestion.py
+    python3 benchmarks/ingestion.py --records 1000000 --fields 8
+"""
+# Standard Library Imports
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Local Imports
+from easytax.income.FederalIncomeBatch import FederalIncomeBatch
+from easytax.income.FederalIncomeHandler import FederalIncomeHandler
+from easytax.utils.Constants import SINGLE
+
+
+def make_lines(count: int, fields: int):
+    rng = random.Random(0)
+    # A handful of fields, as exported by a payroll system, in the same order on every line
+    names = rng.sample(FederalIncomeHandler.INCOME_FIELDS + FederalIncomeHandler.DEDUCTION_FIELDS, fields)
+    return [json.dumps({name: round(rng.uniform(0, 100000), 2) for name in names}) for _ in range(count)]
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<45} {time.perf_counter() - start:>8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200000, help="Lines of JSONL to ingest.")
+    parser.add_argument("--fields", type=int, default=6, help="Incomes and deductions on each line.")
+    args = parser.parse_args()
+
+    lines = make_lines(args.records, args.fields)
+    records = timed("json.loads", lambda: [json.loads(line) for line in lines])
+    fixed = {"tax_year": 2024, "filing_status": SINGLE}
+
+    timed("from_dict(record | fixed) per record", lambda: [FederalIncomeHandler.from_dict(record | fixed) for record in records])
+    timed("from_records(records, **fixed)", lambda: FederalIncomeHandler.from_records(records, **fixed))
+
+    try:
+        timed("FederalIncomeBatch.from_records(records)", lambda: FederalIncomeBatch.from_records(records, **fixed))
+    except ImportError as e:
+        print(f"Skipping FederalIncomeBatch: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Load tests `easytax serve` with many keep-alive clients.
+
+Starts the server on a free port, then has each client thread send single-household requests over one connection,
+recording the latency of every request, and finally times the batch endpoint. Run from the project root:
+
+    python3 benchmarks/load_test.py
+    python3 benchmarks/load_test.py --clients 64 --requests 500 --processes 4 --batch 100000
+"""
+# Standard Library Imports
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def make_record(rng: random.Random):
+    return {
+        "tax_year": 2024,
+        "filing_status": "Married_Filing_Jointly",
+        "state": "Georgia",
+        "incomes_adjustments_and_deductions": [{
+            "salaries_and_wages": round(rng.uniform(20000, 400000), 2),
+            "long_term_capital_gains": round(rng.uniform(0, 50000), 2),
+        }],
+    }
+
+
+def start_server(processes: int):
+    server = subprocess.Popen([sys.executable, "-m", "easytax", "serve", "--port", "0", "--processes", str(processes)],
+        env=dict(os.environ, PYTHONPATH=SRC), stderr=subprocess.PIPE, text=True)
+    # "Serving easytax on http://host:port with N process(es)"
+    address = server.stderr.readline().split()[3]
+    host, port = address.removeprefix("http://").rsplit(":", 1)
+    return server, host, int(port)
+
+
+def client(host: str, port: int, seed: int, requests: int, latencies: list):
+    rng = random.Random(seed)
+    bodies = [json.dumps(make_record(rng)).encode() for _ in range(requests)]
+    connection = http.client.HTTPConnection(host, port)
+    for body in bodies:
+        start = time.perf_counter()
+        connection.request("POST", "/v1/tax", body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            raise RuntimeError(f"Expected 200, recieved: {response.status}")
+    connection.close()
+
+
+def single(host: str, port: int, clients: int, requests: int):
+    latencies = []
+    threads = [threading.Thread(target=client, args=(host, port, seed, requests, latencies)) for seed in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"POST /v1/tax        {clients} clients  {len(latencies) / elapsed:>10,.0f} req/s   "
+        f"p50 {quantiles[49] * 1e3:>7.2f} ms   p99 {quantiles[98] * 1e3:>7.2f} ms")
+
+
+def batch(host: str, port: int, households: int):
+    rng = random.Random(0)
+    body = b"\n".join(json.dumps(make_record(rng)).encode() for _ in range(households))
+    connection = http.client.HTTPConnection(host, port)
+    start = time.perf_counter()
+    connection.request("POST", "/v1/tax:batch", body=body, headers={"Content-Type": "application/x-ndjson"})
+    response = connection.getresponse()
+    first = None
+    lines = 0
+    for _ in response:
+        if first is None:
+            first = time.perf_counter() - start
+        lines += 1
+    elapsed = time.perf_counter() - start
+    connection.close()
+    print(f"POST /v1/tax:batch  {households:,} households  {lines / elapsed:>10,.0f} households/s   "
+        f"first line {first * 1e3:>7.2f} ms   total {elapsed:>6.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent keep-alive clients.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests each client sends.")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Server processes.")
+    parser.add_argument("--batch", type=int, default=20000, help="Households in the batch request.")
+    args = parser.parse_args()
+
+    server, host, port = start_server(args.processes)
+    try:
+        # Warm every connection path before timing
+        single(host, port, 1, 20)
+        single(host, port, args.clients, args.requests)
+        batch(host, port, args.batch)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
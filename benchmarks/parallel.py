@@ -0,0 +1,69 @@
+"""Measures how TaxHandler.compute_many scales across worker processes, compared with a single process.
+
+Run from the project root:
+
+    python3 benchmarks/parallel.py
+    python3 benchmarks/parallel.py --households 1000000 --workers 1 2 4 8 --chunk-size 5000
+"""
+# Standard Library Imports
+import argparse
+import os
+import pickle
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Local Imports
+from easytax.handler.ParallelTaxEngine import ParallelTaxEngine, DEFAULT_CHUNK_SIZE
+from easytax.handler.TaxHandler import TaxHandler
+from easytax.utils.Constants import MARRIED_FILING_JOINTLY, GEORGIA
+
+
+def make_households(count: int):
+    rng = random.Random(0)
+    return [[{
+        "salaries_and_wages": round(rng.uniform(20000, 400000), 2),
+        "long_term_capital_gains": round(rng.uniform(0, 50000), 2),
+        "interest_income": round(rng.uniform(0, 5000), 2),
+    }] for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--households", type=int, default=200000, help="Households to calculate.")
+    parser.add_argument("--workers", type=int, nargs="+", default=None, help="Worker counts to measure. Defaults to powers of two up to the CPU count.")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Households sent to a worker at a time.")
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    workers = args.workers or sorted({2 ** i for i in range(cpus.bit_length()) if 2 ** i <= cpus} | {cpus})
+    households = make_households(args.households)
+    arguments = {"tax_year": 2024, "filing_status": MARRIED_FILING_JOINTLY, "state": GEORGIA}
+
+    # What a worker is sent for each household, and what it sends back
+    summary = next(TaxHandler.compute_many(households[:1], **arguments))
+    print(f"pickled household: {len(pickle.dumps(households[0]))} bytes, summary: {len(pickle.dumps(summary))} bytes, "
+        f"TaxHandler: {len(pickle.dumps(TaxHandler(arguments['tax_year'], arguments['filing_status'], arguments['state'], households[0])))} bytes")
+
+    start = time.perf_counter()
+    expected = sum(summary["total_tax_owed"] for summary in TaxHandler.compute_many(households, **arguments))
+    serial = args.households / (time.perf_counter() - start)
+    print(f"{'1 process':<12} {serial:>12,.0f} households/s")
+
+    for count in workers:
+        with ParallelTaxEngine(max_workers=count, chunk_size=args.chunk_size) as engine:
+            # Start the workers before timing, as a long-running service would have
+            list(engine.compute_many(households[:count], **arguments))
+            start = time.perf_counter()
+            total = sum(summary["total_tax_owed"] for summary in engine.compute_many(households, **arguments))
+            rate = args.households / (time.perf_counter() - start)
+        if total != expected:
+            raise SystemExit(f"{count} workers disagree with a single process: {total} != {expected}")
+        print(f"{f'{count} workers':<12} {rate:>12,.0f} households/s {rate / serial:>6.2f}x")
+    print(f"({cpus} CPUs available)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Compares TaxEngine.sweep with a loop of TaxHandler objects over the same what-if grid.
+
+The grid sweeps ira_deductions from 0 to 7,000 in $100 steps for each of charitable_contributions from 0 to 50,000.
+Run from the project root:
+
+    python3 benchmarks/sweep.py
+    python3 benchmarks/sweep.py --charity-step 100
+"""
+# Standard Library Imports
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Third Party Imports
+import numpy as np
+
+# Local Imports
+from easytax.handler.TaxEngine import TaxEngine
+from easytax.handler.TaxHandler import TaxHandler
+from easytax.utils.Constants import SINGLE, GEORGIA
+
+HOUSEHOLD = [{"salaries_and_wages": 180000.0, "long_term_capital_gains": 15000.0, "taxes_paid": 14000.0, "use_standard_deduction": False}]
+
+
+def handler_loop(ira_deductions, charitable_contributions):
+    taxes = np.zeros((len(ira_deductions), len(charitable_contributions)))
+    for i, ira in enumerate(ira_deductions):
+        for j, charity in enumerate(charitable_contributions):
+            household = [dict(HOUSEHOLD[0], ira_deductions=float(ira), charitable_contributions=float(charity))]
+            taxes[i, j] = TaxHandler(2023, SINGLE, GEORGIA, household, {"exemptions": 1}).summary_json()["total_tax_owed"]
+    return taxes
+
+
+def sweep(ira_deductions, charitable_contributions):
+    axes = {"ira_deductions": ira_deductions, "charitable_contributions": charitable_contributions}
+    return TaxEngine().sweep(HOUSEHOLD, axes, 2023, SINGLE, GEORGIA, {"exemptions": 1})["total_tax_owed"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--charity-step", type=float, default=1000, help="Step of the charitable_contributions axis.")
+    args = parser.parse_args()
+
+    ira_deductions = np.arange(0, 7000 + 1, 100.0)
+    charitable_contributions = np.arange(0, 50000 + 1, args.charity_step)
+    points = len(ira_deductions) * len(charitable_contributions)
+
+    results = []
+    for label, function in [("TaxHandler loop", handler_loop), ("TaxEngine.sweep", sweep)]:
+        start = time.perf_counter()
+        results.append(function(ira_deductions, charitable_contributions))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20} {points:>10,} points {elapsed * 1000:>10.1f} ms {points / elapsed:>14,.0f} points/s")
+    if not np.allclose(*results, rtol=1e-12, atol=1e-6):
+        raise SystemExit("TaxEngine.sweep disagrees with TaxHandler")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measures the throughput of easytax.compute called from a pool of threads.
+
+On a regular build of Python the GIL lets only one thread calculate at a time. On a free-threaded build
+(python3.13t and later), the threads share the read-only tax tables and should scale with the number of cores.
+Run from the project root:
+
+    python3 benchmarks/threads.py
+    python3.13t -X gil=0 benchmarks/threads.py --households 200000 --threads 1 2 4 8
+"""
+# Standard Library Imports
+import argparse
+import os
+import random
+import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+# Local Imports
+import easytax
+from easytax.utils.Constants import MARRIED_FILING_JOINTLY, GEORGIA
+
+
+def make_households(count: int):
+    rng = random.Random(0)
+    return [[{
+        "salaries_and_wages": round(rng.uniform(20000, 400000), 2),
+        "long_term_capital_gains": round(rng.uniform(0, 50000), 2),
+        "interest_income": round(rng.uniform(0, 5000), 2),
+    }] for _ in range(count)]
+
+
+def compute_slice(households):
+    return sum(easytax.compute(household, 2024, MARRIED_FILING_JOINTLY, GEORGIA).total_tax_owed for household in households)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--households", type=int, default=100000, help="Households to calculate.")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8], help="Thread counts to measure.")
+    args = parser.parse_args()
+
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil_enabled = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {free_threaded}, GIL enabled: {gil_enabled}, {os.cpu_count()} CPUs")
+
+    households = make_households(args.households)
+    # Resolve the tax tables before timing
+    expected = compute_slice(households)
+
+    baseline = None
+    for threads in args.threads:
+        # One contiguous slice per thread, so the threads contend only on the shared tax tables
+        size = -(-len(households) // threads)
+        slices = [households[i:i + size] for i in range(0, len(households), size)]
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start = time.perf_counter()
+            totals = list(executor.map(compute_slice, slices))
+            rate = args.households / (time.perf_counter() - start)
+        if abs(sum(totals) - expected) > 1e-6 * abs(expected):
+            raise SystemExit(f"{threads} threads disagree with one: {sum(totals)} != {expected}")
+        baseline = baseline or rate
+        print(f"{f'{threads} threads':<12} {rate:>12,.0f} households/s {rate / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,6 @@ taxHandler = TaxHandler.TaxHandler(
     ],
 )
 
-taxHandler.calculate_taxes()
+# Taxes are calculated on first use and cached, so there is no need to call calculate_taxes
 taxHandler.display_tax_summary()
 print(json.dumps(taxHandler.summary_json(), indent=4))
\ No newline at end of file
@@ -0,0 +1,25 @@
+# Subpackages are imported on first use, so `import easytax` stays cheap for short-lived processes
+from .utils.LazyImport import lazy_submodules
+
+SUBPACKAGES = ["aio", "base", "brackets", "credits", "data", "deductions", "files", "handler", "income", "server", "utils"]
+__all__ = SUBPACKAGES + ["compute"]
+__getattr__, __dir__ = lazy_submodules(__name__, SUBPACKAGES)
+
+
+def compute(incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+    """Returns the TaxResult of a household, holding the same taxes as the summary_json of a TaxHandler built from the same arguments.
+
+    The TaxResult is built straight from the calculated taxes, without a summary dict in between. Nothing is stored
+    between calls, the inputs are only read, and the TaxResult is immutable, so compute is safe to call from many
+    threads at once, including on free-threaded builds of Python.
+
+    Keyword arguments:
+    incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+    tax_year: int - The year for tax filling.
+    filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+    state: str - The state that you will be filing.
+    state_data: dict - information relevant to the selected state
+    """
+    # Imported here, so the tax tables are only loaded by the first calculation
+    from .handler.TaxEngine import compute
+    return compute(incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data)
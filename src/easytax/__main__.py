@@ -0,0 +1,6 @@
+# Runs the command line interface, as `python -m easytax`
+from .cli import main
+
+
+if __name__ == "__main__":
+    main()
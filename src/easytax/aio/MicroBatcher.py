@@ -0,0 +1,165 @@
+# Standard Library Imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Local Imports
+from ..handler.TaxEngine import compute
+
+
+def _calculate_batch(requests: list):
+    # Runs in the executor. Each request gets its own result or error, so one bad request cannot fail its whole batch.
+    outcomes = []
+    for request in requests:
+        try:
+            outcomes.append((compute(*request), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+
+class MicroBatcher:
+
+    """
+    Calculates the TaxResults of concurrent asyncio requests in batches, off the event loop.
+
+    Requests wait in a bounded queue, so callers are slowed down rather than queueing without limit when the backend
+    falls behind. A batch is flushed once it holds max_batch_size requests, or once max_delay has passed since its first
+    request. While a batch is running, new requests collect into the next one, so batches grow with the load without
+    holding back a lone request.
+    """
+
+    def __init__(self, max_batch_size: int = 256, max_delay: float = 0.0, max_pending: int = 10000, executor = None, max_concurrent_batches: int = 1):
+        """Create a MicroBatcher object. It must be used from a single event loop, and closed with close.
+
+        Keyword arguments:
+        max_batch_size: int - The most requests calculated in one batch
+        max_delay: float - The seconds a batch waits for more requests after its first. 0 flushes as soon as the queue is empty.
+        max_pending: int - The most requests waiting for a batch. estimate waits for room once this is reached.
+        executor: concurrent.futures.Executor - Runs the batches, such as a ProcessPoolExecutor. Defaults to a single
+         thread, which the MicroBatcher shuts down when closed.
+        max_concurrent_batches: int - The most batches running at once. Raise this to the number of workers of the executor.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, recieved: {max_batch_size}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay cannot be negative, recieved: {max_delay}")
+        if max_concurrent_batches < 1:
+            raise ValueError(f"max_concurrent_batches must be at least 1, recieved: {max_concurrent_batches}")
+
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._owns_executor = executor is None
+        self._executor = ThreadPoolExecutor(max_workers=1) if executor is None else executor
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._slots = asyncio.Semaphore(max_concurrent_batches)
+        self._running = set()
+        self._consumer = None
+        self._closed = False
+        return
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+        return False
+
+
+    async def estimate(self, incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+        """Returns the TaxResult of a household, as easytax.compute does, once the batch it joins has been calculated.
+
+        Keyword arguments:
+        incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+        tax_year: int - The year for tax filling.
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+        state: str - The state that you will be filing.
+        state_data: dict - information relevant to the selected state
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data), future))
+        return await future
+
+
+    async def close(self):
+        """Finishes the batches already running, cancels the requests still queued, and stops the default executor."""
+        self._closed = True
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+        return
+
+
+    def _start(self):
+        # Returns the task that gathers batches, creating it on the running loop if it is not running yet
+        if self._consumer is None:
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+        return self._consumer
+
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        batch = []
+        while True:
+            # A batch is only gathered once it can run, so requests arriving while every slot is busy join it
+            await self._slots.acquire()
+            try:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed while gathering a batch that never started
+                self._slots.release()
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+            task = loop.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+            batch = []
+
+
+    async def _run(self, batch: list):
+        try:
+            requests = [request for request, _ in batch]
+            try:
+                outcomes = await asyncio.get_running_loop().run_in_executor(self._executor, _calculate_batch, requests)
+            except Exception as e:
+                # The executor itself failed, such as a worker process dying, so every request in the batch fails
+                outcomes = [(None, e)] * len(batch)
+            for (_, future), (result, error) in zip(batch, outcomes):
+                if future.done():
+                    # The caller stopped waiting
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+        finally:
+            self._slots.release()
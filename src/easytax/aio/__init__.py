@@ -0,0 +1,46 @@
+# Standard Library Imports
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import weakref
+
+# Local Imports
+from ..utils.LazyImport import lazy_submodules
+
+# The asyncio front end. Its modules are imported on first use, like every other subpackage's.
+SUBMODULES = ["MicroBatcher"]
+__all__ = SUBMODULES + ["estimate"]
+__getattr__, __dir__ = lazy_submodules(__name__, SUBMODULES)
+
+# The MicroBatcher behind estimate, one per event loop, as asyncio queues belong to the loop they are used from
+_batchers = weakref.WeakKeyDictionary()
+
+# The thread every default MicroBatcher calculates on. A batcher of a loop that has closed is never closed itself,
+# so one executor is shared across loops rather than leaving a thread behind for each.
+_executor = None
+
+
+async def estimate(incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+    """Returns the TaxResult of a household, as easytax.compute does, without blocking the event loop.
+
+    Concurrent calls are calculated together in batches by a MicroBatcher with the default settings. Create a
+    MicroBatcher directly to choose its batch size, deadline, queue bound or executor.
+
+    Keyword arguments:
+    incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+    tax_year: int - The year for tax filling.
+    filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+    state: str - The state that you will be filing.
+    state_data: dict - information relevant to the selected state
+    """
+    from .MicroBatcher import MicroBatcher
+    global _executor
+    loop = asyncio.get_running_loop()
+    batcher = _batchers.get(loop)
+    if batcher is None:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="easytax-estimate")
+        batcher = _batchers[loop] = MicroBatcher(executor=_executor)
+        # The batcher's task holds its loop, so the entry would never be dropped by itself. asyncio.run cancels the
+        # task as the loop shuts down, and the entry is dropped then.
+        batcher._start().add_done_callback(lambda _: _batchers.pop(loop, None) if _batchers.get(loop) is batcher else None)
+    return await batcher.estimate(incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data)
@@ -1,25 +1,15 @@
 # Local Imports
 from . import FlatTaxBracket
-from .Tax import Tax
+from .PiecewiseLinearTax import PiecewiseLinearTax
 
-class FlatTax(Tax):
+class FlatTax(PiecewiseLinearTax):
 
     def __init__(self, flat_tax_bracket: FlatTaxBracket):
-        """Create a FlatTax object.
+        """Create a FlatTax object, compiled into a single-segment tax curve.
 
         Keyword arguments:
         flat_tax_bracket -- The FlatTaxBracket
         """
         self.rate = flat_tax_bracket.rate
+        super().__init__(breakpoints = [0], slopes = [self.rate])
         return
-
-    def calculate_taxes(self, taxable_income):
-        """Calculates the taxes for a given Adjusted Gross Income.
-
-        Keyword arguments:
-        adjusted_gross_income -- The Adjusted Gross Income
-        """
-        if taxable_income <= 0:
-            return 0
-
-        return taxable_income * self.rate
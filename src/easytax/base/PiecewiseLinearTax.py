@@ -0,0 +1,254 @@
+# Standard Library Imports
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Local Imports
+from .Tax import Tax
+from ..utils.OptionalDependencies import import_numpy
+
+
+class PiecewiseLinearTax(Tax):
+
+    # The BracketSpec a BracketRegistry interned this from, if any
+    spec = None
+
+    def __init__(self, breakpoints: list[float], slopes: list[float], intercepts: list[float] | None = None):
+        """Create a PiecewiseLinearTax object.
+
+        The tax on an income in (breakpoints[i], breakpoints[i + 1]] is intercepts[i] + (income - breakpoints[i]) * slopes[i].
+        The last segment is unbounded, and incomes at or below zero owe no tax.
+
+        Keyword arguments:
+        breakpoints -- ASC ordered list of the lower bound of each segment, starting at 0
+        slopes -- The marginal tax rate within each segment
+        intercepts -- The tax owed at each breakpoint. Accumulated from the slopes when omitted.
+        """
+        if len(breakpoints) == 0 or len(breakpoints) != len(slopes):
+            raise ValueError(f"Recieved {len(slopes)} slopes but expected one per breakpoint for the following breakpoints {breakpoints}")
+
+        if breakpoints[0] != 0:
+            raise ValueError(f"breakpoints must start at 0, recieved: {breakpoints[0]}")
+
+        if sorted(breakpoints) != list(breakpoints):
+            raise ValueError(f"breakpoints must be monotonically increasing. Recieved: {breakpoints}.")
+
+        if min(slopes) < 0:
+            raise ValueError(f"slopes cannot be negative, recieved: {min(slopes)}")
+
+        if intercepts is None:
+            intercepts = [0]
+            for lower_breakpoint, breakpoint, slope in zip(breakpoints, breakpoints[1:], slopes):
+                intercepts.append(intercepts[-1] + (breakpoint - lower_breakpoint) * slope)
+        elif len(intercepts) != len(breakpoints):
+            raise ValueError(f"Recieved {len(intercepts)} intercepts but expected one per breakpoint for the following breakpoints {breakpoints}")
+
+        # Compact double buffers, shared zero-copy with numpy by the batch API
+        self.breakpoints = array('d', breakpoints)
+        self.slopes = array('d', slopes)
+        self.intercepts = array('d', intercepts)
+        self._net_incomes = None
+        return
+
+
+    def calculate_taxes(self, taxable_income):
+        """Calculates the taxes for a given taxable income.
+
+        Keyword arguments:
+        taxable_income -- The taxable income
+        """
+        if taxable_income <= 0:
+            return 0
+
+        # Incomes sitting exactly on a breakpoint belong to the lower segment
+        index = bisect_left(self.breakpoints, taxable_income) - 1
+        return self.intercepts[index] + (taxable_income - self.breakpoints[index]) * self.slopes[index]
+
+
+    def calculate_taxes_batch(self, taxable_incomes):
+        """Calculates the taxes for an array of taxable incomes, returning an ndarray of the same shape.
+
+        Keyword arguments:
+        taxable_incomes -- array-like of taxable incomes
+        """
+        np = import_numpy()
+        taxable_incomes = np.asarray(taxable_incomes, dtype=float)
+        breakpoints = np.frombuffer(self.breakpoints, dtype=float)
+        slopes = np.frombuffer(self.slopes, dtype=float)
+        intercepts = np.frombuffer(self.intercepts, dtype=float)
+
+        # Incomes at or below zero index the last segment here, but are masked out below
+        index = np.searchsorted(breakpoints, taxable_incomes, side='left') - 1
+        taxes = intercepts[index] + (taxable_incomes - breakpoints[index]) * slopes[index]
+        return np.where(taxable_incomes > 0, taxes, 0.0)
+
+
+    def marginal_rate(self, taxable_income):
+        """Returns the rate at which the next dollar of taxable income is taxed.
+
+        Keyword arguments:
+        taxable_income -- The taxable income
+        """
+        if taxable_income < 0:
+            return 0
+
+        return self.slopes[self._segment_at(taxable_income)]
+
+
+    def effective_rate(self, taxable_income):
+        """Returns the taxes owed as a fraction of the taxable income.
+
+        Keyword arguments:
+        taxable_income -- The taxable income
+        """
+        if taxable_income <= 0:
+            return 0
+
+        return self.calculate_taxes(taxable_income) / taxable_income
+
+
+    def calculate_taxes_on_slice(self, lower_income, upper_income):
+        """Calculates the taxes on the income stacked between two incomes, such as long term capital gains stacked on top of ordinary income.
+
+        Walks only the segments the slice overlaps, rather than subtracting the taxes on two large incomes.
+
+        Keyword arguments:
+        lower_income -- The income the slice is stacked on top of
+        upper_income -- The income at the top of the slice
+        """
+        if upper_income < lower_income:
+            # A negative slice, such as a capital loss, reduces the tax
+            return -self.calculate_taxes_on_slice(upper_income, lower_income)
+
+        lower_income = max(lower_income, 0)
+        if upper_income <= lower_income:
+            return 0
+
+        index = self._segment_at(lower_income)
+        # Incomes sitting exactly on a breakpoint belong to the lower segment
+        upper_index = bisect_left(self.breakpoints, upper_income) - 1
+
+        taxes = 0
+        while index < upper_index:
+            breakpoint = self.breakpoints[index + 1]
+            taxes += (breakpoint - lower_income) * self.slopes[index]
+            lower_income = breakpoint
+            index += 1
+
+        return taxes + (upper_income - lower_income) * self.slopes[index]
+
+
+    def calculate_taxes_on_slice_batch(self, lower_incomes, upper_incomes):
+        """Calculates the taxes on the income stacked between two arrays of incomes, returning an ndarray of their broadcast shape.
+
+        Keyword arguments:
+        lower_incomes -- array-like of incomes each slice is stacked on top of
+        upper_incomes -- array-like of incomes at the top of each slice
+        """
+        np = import_numpy()
+        lower_incomes = np.asarray(lower_incomes, dtype=float)
+        upper_incomes = np.asarray(upper_incomes, dtype=float)
+        sign = np.where(upper_incomes < lower_incomes, -1.0, 1.0)
+        lower_incomes, upper_incomes = np.minimum(lower_incomes, upper_incomes), np.maximum(lower_incomes, upper_incomes)
+
+        # Sum the overlap of every slice with every segment. There are only a handful of segments.
+        taxes = np.zeros(np.broadcast(lower_incomes, upper_incomes).shape)
+        upper_breakpoints = list(self.breakpoints[1:]) + [float('inf')]
+        for breakpoint, upper_breakpoint, slope in zip(self.breakpoints, upper_breakpoints, self.slopes):
+            overlap = np.minimum(upper_incomes, upper_breakpoint) - np.maximum(lower_incomes, breakpoint)
+            taxes += np.maximum(overlap, 0) * slope
+        return sign * taxes
+
+
+    def inverse(self, tax_amount: float):
+        """Returns the smallest taxable income owing exactly the given amount of tax.
+
+        Keyword arguments:
+        tax_amount -- The tax owed
+        """
+        if tax_amount <= 0:
+            return 0
+
+        # Taxes never decrease as income grows, so the intercepts are sorted
+        index = bisect_left(self.intercepts, tax_amount) - 1
+        if index == len(self.intercepts) - 1 and self.slopes[-1] == 0:
+            raise ValueError(f"No income owes {tax_amount} in taxes, the most that can be owed is {self.intercepts[-1]}")
+
+        return self.breakpoints[index] + (tax_amount - self.intercepts[index]) / self.slopes[index]
+
+
+    def gross_up(self, net_income: float):
+        """Returns the smallest taxable income left with exactly the given income after taxes.
+
+        Keyword arguments:
+        net_income -- The income remaining after taxes
+        """
+        if net_income <= 0:
+            return net_income
+
+        if self._net_incomes is None:
+            if max(self.slopes) > 1:
+                raise ValueError(f"Cannot gross up when a marginal tax rate exceeds 100%, recieved: {max(self.slopes)}")
+            self._net_incomes = array('d', [b - c for b, c in zip(self.breakpoints, self.intercepts)])
+
+        # With every marginal rate at most 100%, income after taxes never decreases as income grows
+        index = bisect_left(self._net_incomes, net_income) - 1
+        if index == len(self._net_incomes) - 1 and self.slopes[-1] == 1:
+            raise ValueError(f"No income leaves {net_income} after taxes, the most that can be kept is {self._net_incomes[-1]}")
+
+        return self.breakpoints[index] + (net_income - self._net_incomes[index]) / (1 - self.slopes[index])
+
+
+    def __reduce_ex__(self, protocol):
+        if self.spec is not None:
+            # Imported here, as the registry builds on this class
+            from ..brackets.BracketRegistry import interned
+            # Pickled as its spec alone, so each process unpickles into the one Tax its own registry interned
+            return (interned, (self.spec,))
+        return super().__reduce_ex__(protocol)
+
+
+    def shift(self, offset: float):
+        """Returns the curve that taxes an income the way this one taxes (income - offset), such as after a deduction.
+
+        Keyword arguments:
+        offset -- The non-negative amount to shift the curve by
+        """
+        if offset < 0:
+            raise ValueError(f"offset cannot be negative, recieved: {offset}")
+
+        if offset == 0:
+            return self
+
+        return PiecewiseLinearTax(
+            breakpoints = [0] + [b + offset for b in self.breakpoints],
+            slopes = [0] + list(self.slopes),
+            intercepts = [0] + list(self.intercepts))
+
+
+    def __add__(self, other):
+        """Returns the curve owing the sum of both curves' taxes on every income."""
+        if not isinstance(other, PiecewiseLinearTax):
+            return NotImplemented
+
+        breakpoints = sorted(set(self.breakpoints) | set(other.breakpoints))
+        segments = [(self._segment_at(b), other._segment_at(b)) for b in breakpoints]
+        return PiecewiseLinearTax(
+            breakpoints = breakpoints,
+            slopes = [self.slopes[i] + other.slopes[j] for i, j in segments],
+            intercepts = [self._value_on_segment(i, b) + other._value_on_segment(j, b) for b, (i, j) in zip(breakpoints, segments)])
+
+
+    def __radd__(self, other):
+        # Allows sum() over a list of curves, which starts from 0
+        if other == 0:
+            return self
+        return self.__add__(other)
+
+
+    def _segment_at(self, income):
+        # The segment applying to the dollar just above this income
+        return bisect_right(self.breakpoints, income) - 1
+
+
+    def _value_on_segment(self, index, income):
+        return self.intercepts[index] + (income - self.breakpoints[index]) * self.slopes[index]
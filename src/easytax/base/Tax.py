@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+# Local Imports
+from ..utils.OptionalDependencies import import_numpy
+
 
 class Tax(ABC):
 
@@ -11,3 +14,29 @@ class Tax(ABC):
         taxable_income -- The taxable income
         """
         pass
+
+
+    def calculate_taxes_batch(self, taxable_incomes):
+        """Calculates the taxes for an array of taxable incomes, returning an ndarray of the same shape.
+
+        Subclasses should override this with a vectorized implementation. This default evaluates each income in turn.
+
+        Keyword arguments:
+        taxable_incomes -- array-like of taxable incomes
+        """
+        np = import_numpy()
+        taxable_incomes = np.asarray(taxable_incomes, dtype=float)
+        taxes = np.fromiter((self.calculate_taxes(i) for i in taxable_incomes.ravel().tolist()), dtype=float, count=taxable_incomes.size)
+        return taxes.reshape(taxable_incomes.shape)
+
+
+    def calculate_taxes_on_slice(self, lower_income, upper_income):
+        """Calculates the taxes on the income stacked between two incomes, such as long term capital gains stacked on top of ordinary income.
+
+        Subclasses should override this to avoid evaluating the tax twice.
+
+        Keyword arguments:
+        lower_income -- The income the slice is stacked on top of
+        upper_income -- The income at the top of the slice
+        """
+        return self.calculate_taxes(upper_income) - self.calculate_taxes(lower_income)
@@ -0,0 +1,174 @@
+# Standard Library Imports
+from collections import namedtuple
+from collections.abc import Mapping
+from threading import Lock
+
+# Local Imports
+from ..base.ProgressiveTax import ProgressiveTax
+from ..base.ProgressiveTaxBracket import ProgressiveTaxBracket
+from ..base.RegressiveTax import RegressiveTax
+from ..base.RegressiveTaxBracket import RegressiveTaxBracket
+from ..base.FlatTax import FlatTax
+from ..base.FlatTaxBracket import FlatTaxBracket
+
+
+PROGRESSIVE = "progressive"
+REGRESSIVE = "regressive"
+FLAT = "flat"
+
+# A hashable description of a tax schedule. Identical schedules have equal specs, so they share one Tax.
+BracketSpec = namedtuple('BracketSpec', ['kind', 'tax_rates', 'income_thresholds'])
+
+
+def progressive(tax_rates: list[float], income_thresholds: list[float]):
+    """Describe a ProgressiveTax, built on first use."""
+    return BracketSpec(PROGRESSIVE, tuple(tax_rates), tuple(income_thresholds))
+
+
+def regressive(tax_rates: list[float], income_thresholds: list[float]):
+    """Describe a RegressiveTax, built on first use."""
+    return BracketSpec(REGRESSIVE, tuple(tax_rates), tuple(income_thresholds))
+
+
+def flat(tax_rate: float):
+    """Describe a FlatTax, built on first use."""
+    return BracketSpec(FLAT, (tax_rate,), ())
+
+
+class BracketRegistry:
+
+    """
+    Registry of every tax schedule, keyed by (jurisdiction, tax_year, filing_status).
+
+    Schedules are registered as BracketSpecs and only built into Tax objects the first time they are requested.
+    Built schedules are memoized, and identical schedules are interned so each appears once in memory.
+    """
+
+    def __init__(self):
+        self._specs = {}
+        self._materialized = {}
+        self._interned = {}
+        self._lock = Lock()
+        return
+
+
+    def register(self, jurisdiction: str, specs: dict):
+        """Register a jurisdiction's schedules and return a LazyBracketTable over them.
+
+        Keyword arguments:
+        jurisdiction -- The name of the tax, such as "FederalIncome"
+        specs -- dict of tax year to BracketSpec, or of tax year to a dict of filing status to BracketSpec
+        """
+        for tax_year, value in specs.items():
+            if isinstance(value, dict):
+                for filing_status, spec in value.items():
+                    self._specs[(jurisdiction, tax_year, filing_status)] = spec
+            else:
+                self._specs[(jurisdiction, tax_year, None)] = value
+
+        return LazyBracketTable(self, jurisdiction, specs)
+
+
+    def get(self, jurisdiction: str, tax_year: int, filing_status: str | None = None):
+        """Return the Tax for a jurisdiction, year and filing status, building it on first use.
+
+        Keyword arguments:
+        jurisdiction -- The name of the tax, such as "FederalIncome"
+        tax_year -- The tax year
+        filing_status -- The filing status, or None for taxes that do not depend on it
+        """
+        key = (jurisdiction, tax_year, filing_status)
+        tax = self._materialized.get(key)
+        if tax is None:
+            if key not in self._specs:
+                raise ValueError(f"Unsupported combination of status: {filing_status}, year {tax_year}, jurisdiction: {jurisdiction}")
+            tax = self.intern(self._specs[key])
+            self._materialized[key] = tax
+        return tax
+
+
+    def intern(self, spec: BracketSpec):
+        """Return the one shared Tax built from this spec.
+
+        Keyword arguments:
+        spec -- The BracketSpec to build
+        """
+        tax = self._interned.get(spec)
+        if tax is None:
+            with self._lock:
+                tax = self._interned.get(spec)
+                if tax is None:
+                    tax = self._interned[spec] = self._build(spec)
+                    tax.spec = spec
+        return tax
+
+
+    def is_materialized(self, jurisdiction: str, tax_year: int, filing_status: str | None = None):
+        return (jurisdiction, tax_year, filing_status) in self._materialized
+
+
+    @staticmethod
+    def _build(spec: BracketSpec):
+        if spec.kind == PROGRESSIVE:
+            return ProgressiveTax(ProgressiveTaxBracket(
+                tax_rates = list(spec.tax_rates),
+                income_thresholds = list(spec.income_thresholds)))
+        elif spec.kind == REGRESSIVE:
+            return RegressiveTax(RegressiveTaxBracket(
+                tax_rates = list(spec.tax_rates),
+                income_thresholds = list(spec.income_thresholds)))
+        elif spec.kind == FLAT:
+            return FlatTax(FlatTaxBracket(tax_rate = spec.tax_rates[0]))
+        else:
+            raise ValueError(f"Unsupported kind of tax schedule: {spec.kind}")
+
+
+class LazyBracketTable(Mapping):
+
+    """
+    Read-only view of a jurisdiction's schedules, indexed like the bracket dicts: brackets[tax_year] or brackets[tax_year][filing_status].
+    Each Tax is built by the registry the first time it is looked up.
+    """
+
+    def __init__(self, registry: BracketRegistry, jurisdiction: str, specs: dict, tax_year: int | None = None):
+        self._registry = registry
+        self._jurisdiction = jurisdiction
+        self._specs = specs
+        self._tax_year = tax_year
+        self._tables_by_year = {}
+        return
+
+
+    def __getitem__(self, key):
+        value = self._specs[key]
+        if isinstance(value, dict):
+            table = self._tables_by_year.get(key)
+            if table is None:
+                table = self._tables_by_year[key] = LazyBracketTable(self._registry, self._jurisdiction, value, tax_year=key)
+            return table
+        elif self._tax_year is None:
+            return self._registry.get(self._jurisdiction, key)
+        else:
+            return self._registry.get(self._jurisdiction, self._tax_year, key)
+
+
+    def __contains__(self, key):
+        # Checking support must not build the schedule
+        return key in self._specs
+
+
+    def __iter__(self):
+        return iter(self._specs)
+
+
+    def __len__(self):
+        return len(self._specs)
+
+
+# The registry shared by every module in easytax.brackets
+registry = BracketRegistry()
+
+
+def interned(spec: BracketSpec):
+    """Returns the shared registry's Tax for a spec. Interned Taxes are pickled as a call to this."""
+    return registry.intern(spec)
@@ -1,31 +1,9 @@
 # Local Imports
-from ..base import RegressiveTax
-from ..base import RegressiveTaxBracket
+from .BracketRegistry import registry
+from ..data import TaxData
 
 
-brackets = {
-    # Source: https://payroll.org/news-resources/news/news-detail/2024/10/10/social-security-wage-base-increases-to-$176-100-for-2025
-    2025: RegressiveTax.RegressiveTax(
-        RegressiveTaxBracket.RegressiveTaxBracket(
-            tax_rates = [0.062, 0.0],
-            income_thresholds = [176100])
-    ),
-    # Source: https://www.ssa.gov/news/press/factsheets/colafacts2024.pdf
-    2024: RegressiveTax.RegressiveTax(
-    RegressiveTaxBracket.RegressiveTaxBracket(
-        tax_rates = [0.062, 0.0],
-        income_thresholds = [168600])
-    ),
-    # Source: https://www.ssa.gov/oact/cola/cbb.html#:~:text=The%20OASDI%20tax%20rate%20for,for%20employees%20and%20employers%2C%20each.
-    2023: RegressiveTax.RegressiveTax(
-    RegressiveTaxBracket.RegressiveTaxBracket(
-        tax_rates = [0.062, 0.0],
-        income_thresholds = [160200])
-    ),
-    # Source: https://www.ssa.gov/oact/cola/cbb.html#:~:text=The%20OASDI%20tax%20rate%20for,for%20employees%20and%20employers%2C%20each.
-    2022: RegressiveTax.RegressiveTax(
-    RegressiveTaxBracket.RegressiveTaxBracket(
-        tax_rates = [0.062, 0.0],
-        income_thresholds = [147000])
-    )
-}
+JURISDICTION = "SocialSecurity"
+
+# Schedules and their sources live in data/SocialSecurityIncomeTaxBrackets.json
+brackets = registry.register(JURISDICTION, TaxData.load_bracket_specs("SocialSecurityIncomeTaxBrackets"))
@@ -0,0 +1,13 @@
+# Tax tables are imported on first use, so loading one table does not load the others
+from ..utils.LazyImport import lazy_submodules
+
+__all__ = [
+    "BracketRegistry",
+    "FederalIncomeTaxBrackets",
+    "FederalLongTermCapitalGainsTaxBrackets",
+    "MedicareIncomeTaxBrackets",
+    "NetInvestmentIncomeTaxBrackets",
+    "SocialSecurityIncomeTaxBrackets",
+    "states",
+]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
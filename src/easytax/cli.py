@@ -0,0 +1,232 @@
+"""The easytax command line interface.
+
+    easytax compute households.csv --output taxes.csv --processes 4
+    easytax convert households.csv households.columns && easytax compute households.columns --output taxes.csv
+    easytax serve --port 8080 --processes 4
+"""
+# Standard Library Imports
+import argparse
+from collections import deque
+from contextlib import ExitStack
+import os
+import signal
+import sys
+
+# Files are read and written through buffers this large, as inputs can run to many gigabytes
+BUFFER_SIZE = 2**20
+
+
+def compute(args):
+    # Imported here, so other commands do not load the tax tables until they need them
+    from .files.HouseholdReader import format_of, CSV, NDJSON
+
+    if args.processes < 1:
+        raise SystemExit(f"--processes must be at least 1, recieved: {args.processes}")
+    columnar = os.path.isdir(args.input)
+    input_format = None if columnar else args.input_format or format_of(args.input, CSV)
+    output_format = args.output_format or format_of(args.output, NDJSON if input_format in ("jsonl", NDJSON) else CSV)
+
+    try:
+        with _open(args.output, "w") as destination:
+            if columnar:
+                households = _compute_columnar(args, destination, output_format)
+            else:
+                households = _compute_records(args, input_format, destination, output_format)
+    except BrokenPipeError:
+        # The output was closed early, as by `| head`. Python's own flush of stdout at exit must not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise SystemExit(1)
+    print(f"Calculated {households} household(s)", file=sys.stderr)
+    return
+
+
+def _compute_records(args, input_format: str, destination, output_format: str):
+    # Streams households from a CSV or JSONL file through compute_many
+    from .files.HouseholdReader import HouseholdReader
+    from .files.ResultWriter import ResultWriter
+    from .handler.ParallelTaxEngine import ParallelTaxEngine, DEFAULT_CHUNK_SIZE
+    from .handler.TaxEngine import TaxEngine
+
+    index = 0
+    with ExitStack() as stack:
+        source = stack.enter_context(_open(args.input, "r"))
+        try:
+            reader = HouseholdReader(source, input_format)
+        except ValueError as e:
+            raise SystemExit(f"easytax: {args.input}: {e}")
+        writer = ResultWriter(destination, output_format, reader.has_household_ids)
+
+        # The ids of the households read but not yet written, a chunk or so per worker at most
+        household_ids = deque()
+        def records():
+            for household_id, record in reader:
+                household_ids.append(household_id)
+                yield record
+
+        if args.processes > 1:
+            engine = stack.enter_context(ParallelTaxEngine(args.processes, args.chunk_size or DEFAULT_CHUNK_SIZE))
+        else:
+            engine = TaxEngine()
+        summaries = engine.compute_many(records(), tax_year=args.tax_year, filing_status=args.filing_status, state=args.state)
+        try:
+            for summary in summaries:
+                writer.write(index, household_ids.popleft(), summary)
+                index += 1
+        except (ValueError, TypeError, KeyError) as e:
+            raise SystemExit(f"easytax: {args.input}: household {index}: {_message(e)}")
+    return index
+
+
+def _compute_columnar(args, destination, output_format: str):
+    # Calculates a ColumnarHouseholds directory a chunk of households at a time, straight from its mapped columns
+    from .files.ColumnarHouseholds import ColumnarHouseholds
+    from .files.ResultWriter import ResultWriter
+    from .handler.ParallelTaxEngine import ParallelTaxEngine, DEFAULT_COLUMNAR_CHUNK_SIZE
+    from .handler.TaxEngine import TaxEngine
+
+    chunk_size = args.chunk_size or DEFAULT_COLUMNAR_CHUNK_SIZE
+    try:
+        households = ColumnarHouseholds(args.input)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"easytax: {args.input}: {e}")
+    writer = ResultWriter(destination, output_format, households.has_household_ids)
+
+    def write(start: int, taxes: dict):
+        writer.write_batch(start, taxes, households.household_ids(start, start + len(taxes["total_tax_owed"])))
+
+    start = 0
+    try:
+        if args.processes > 1:
+            with ParallelTaxEngine(args.processes) as engine:
+                for start, taxes in engine.compute_columnar(args.input, chunk_size):
+                    write(start, taxes)
+        else:
+            engine = TaxEngine()
+            for start in range(0, len(households), chunk_size):
+                write(start, households.compute(engine, start, start + chunk_size))
+    except (ValueError, TypeError) as e:
+        raise SystemExit(f"easytax: {args.input}: households from {start}: {e}")
+    return len(households)
+
+
+def convert(args):
+    # Imported here, so other commands do not load numpy
+    from .files.ColumnarHouseholds import ColumnarHouseholds
+    from .files.HouseholdReader import HouseholdReader, format_of, CSV
+
+    with _open(args.input, "r") as source:
+        try:
+            reader = HouseholdReader(source, args.input_format or format_of(args.input, CSV))
+            records = reader if reader.has_household_ids else (record for _, record in reader)
+            households = ColumnarHouseholds.write(args.output, records,
+                tax_year=args.tax_year, filing_status=args.filing_status, state=args.state, household_ids=reader.has_household_ids)
+        except (ValueError, TypeError, KeyError) as e:
+            raise SystemExit(f"easytax: {args.input}: {_message(e)}")
+    print(f"Wrote {len(households)} household(s) to {args.output}", file=sys.stderr)
+    return
+
+
+def _message(error: Exception):
+    if isinstance(error, KeyError):
+        return f"Missing key {error}"
+    return str(error)
+
+
+def _open(path: str, mode: str):
+    # - is stdin or stdout, left open once the command is done
+    if path == "-":
+        return open((sys.stdin if mode == "r" else sys.stdout).fileno(), mode, buffering=BUFFER_SIZE, encoding="utf-8", newline="", closefd=False)
+    return open(path, mode, buffering=BUFFER_SIZE, encoding="utf-8", newline="")
+
+
+def serve(args):
+    # Imported here, so other commands do not load http.server
+    import gc
+    from .server.TaxServer import TaxServer
+
+    if args.processes > 1 and not hasattr(os, "fork"):
+        raise SystemExit("--processes above 1 needs os.fork, which this platform does not have")
+
+    server = TaxServer((args.host, args.port), access_log=args.access_log)
+    host, port = server.server_address[:2]
+    print(f"Serving easytax on http://{host}:{port} with {args.processes} process(es)", file=sys.stderr, flush=True)
+
+    # The tax tables are loaded before forking, and frozen out of the garbage collector's reach, so every process
+    # shares the parent's copy of them rather than each touching, and so copying, its pages.
+    gc.freeze()
+    # Stopping with SIGTERM, as a process manager does, still stops the children and closes the socket
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    children = []
+    for _ in range(args.processes - 1):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os._exit(0)
+        children.append(pid)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            os.waitpid(pid, 0)
+        server.server_close()
+    return
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="easytax", description="Calculate personal income taxes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compute_parser = commands.add_parser("compute", help="Calculate the taxes of every household in a CSV or JSONL file.",
+        description="Calculate the taxes of every household in a CSV or JSONL file, streaming them out in the same order. "
+            "See easytax.files.HouseholdReader for the columns of a CSV, and easytax.files.ResultWriter for the output.")
+    compute_parser.add_argument("input", nargs="?", default="-", help="The file of households, - for stdin, or a directory written by convert. Defaults to stdin.")
+    compute_parser.add_argument("--output", "-o", default="-", help="The file to write the taxes to, or - for stdout. Defaults to stdout.")
+    compute_parser.add_argument("--input-format", choices=["csv", "jsonl", "ndjson"], help="Defaults to the input's extension, or csv.")
+    compute_parser.add_argument("--output-format", choices=["csv", "jsonl", "ndjson"], help="Defaults to the output's extension, or csv for a csv input and ndjson otherwise. "
+        "From a directory written by convert, an ndjson line holds the columns of the csv rather than the household's whole summary.")
+    compute_parser.add_argument("--tax-year", type=int, help="The tax year of every household without one.")
+    compute_parser.add_argument("--filing-status", help="The filing status of every household without one.")
+    compute_parser.add_argument("--state", help="The state of every household without one.")
+    compute_parser.add_argument("--processes", type=int, default=1, help="Processes calculating households. Defaults to 1.")
+    compute_parser.add_argument("--chunk-size", type=int, help="Households calculated at a time by a process, with --processes above 1 or from a directory written by convert. Defaults to 2000, or 131072 from a directory.")
+    compute_parser.set_defaults(run=compute)
+
+    convert_parser = commands.add_parser("convert", help="Write a CSV or JSONL file of households as memory-mapped columns.",
+        description="Write a CSV or JSONL file of households as a directory of memory-mapped columns, which compute reads "
+            "without parsing. See easytax.files.ColumnarHouseholds.")
+    convert_parser.add_argument("input", help="The file of households, or - for stdin.")
+    convert_parser.add_argument("output", help="The directory to write.")
+    convert_parser.add_argument("--input-format", choices=["csv", "jsonl", "ndjson"], help="Defaults to the input's extension, or csv.")
+    convert_parser.add_argument("--tax-year", type=int, help="The tax year of every household without one.")
+    convert_parser.add_argument("--filing-status", help="The filing status of every household without one.")
+    convert_parser.add_argument("--state", help="The state of every household without one.")
+    convert_parser.set_defaults(run=convert)
+
+    serve_parser = commands.add_parser("serve", help="Serve tax calculations over HTTP.",
+        description="Serve POST /v1/tax and POST /v1/tax:batch, see easytax.server.TaxRequestHandler.")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="The address to listen on. Defaults to 127.0.0.1.")
+    serve_parser.add_argument("--port", type=int, default=8080, help="The port to listen on, 0 for any free port. Defaults to 8080.")
+    serve_parser.add_argument("--processes", type=int, default=1, help="Processes accepting connections on the port, each with a thread per connection. Defaults to 1.")
+    serve_parser.add_argument("--access-log", action="store_true", help="Log every request to stderr.")
+    serve_parser.set_defaults(run=serve)
+    return parser
+
+
+def main(argv: list[str] | None = None):
+    """Runs the command line interface.
+
+    Keyword arguments:
+    argv -- The arguments, without the program name. Defaults to sys.argv[1:].
+    """
+    args = build_parser().parse_args(argv)
+    args.run(args)
+    return
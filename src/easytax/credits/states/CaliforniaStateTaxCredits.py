@@ -1,3 +1,12 @@
+from ...data.ParameterStore import (
+    parameters,
+    CALIFORNIA_EARNED_INCOME_CREDIT_MAXIMUM,
+    CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_IN_RATE,
+    CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_START,
+    CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_RATE,
+    CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_END,
+    CALIFORNIA_DEPENDENT_EXEMPTION_CREDIT,
+)
 from ...utils.Constants import *
 
 class CaliforniaStateTaxCredits:
@@ -48,50 +57,16 @@ class CaliforniaStateTaxCredits:
     def _calculate_cal_eitc(self, taxable_income: float) -> float:
         """Calculate California Earned Income Tax Credit."""
         # CalEITC income limits and credit amounts
-        if self.tax_year == 2025:
-            if self.filing_status in [SINGLE, MARRIED_FILING_SEPARATELY, HEAD_OF_HOUSEHOLD]:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 25220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-            elif self.filing_status == MARRIED_FILING_JOINTLY:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 31220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-        elif self.tax_year == 2024:
-            if self.filing_status in [SINGLE, MARRIED_FILING_SEPARATELY, HEAD_OF_HOUSEHOLD]:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 25220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-            elif self.filing_status == MARRIED_FILING_JOINTLY:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 31220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-        elif self.tax_year == 2023:
-            if self.filing_status in [SINGLE, MARRIED_FILING_SEPARATELY, HEAD_OF_HOUSEHOLD]:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 25220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-            elif self.filing_status == MARRIED_FILING_JOINTLY:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 31220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-        elif self.tax_year == 2022:
-            if self.filing_status in [SINGLE, MARRIED_FILING_SEPARATELY, HEAD_OF_HOUSEHOLD]:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 25220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
-            elif self.filing_status == MARRIED_FILING_JOINTLY:
-                if taxable_income <= 7000:
-                    return min(255, taxable_income * 0.085)
-                elif taxable_income <= 31220:
-                    return max(0, 255 - (taxable_income - 7000) * 0.0596)
+        phase_out_end = parameters.get(CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_END, self.tax_year, self.filing_status)
+        if phase_out_end is None:
+            return 0.0
+
+        maximum_credit = parameters.get(CALIFORNIA_EARNED_INCOME_CREDIT_MAXIMUM, self.tax_year, self.filing_status)
+        phase_out_start = parameters.get(CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_START, self.tax_year, self.filing_status)
+        if taxable_income <= phase_out_start:
+            return min(maximum_credit, taxable_income * parameters.get(CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_IN_RATE, self.tax_year, self.filing_status))
+        elif taxable_income <= phase_out_end:
+            return max(0, maximum_credit - (taxable_income - phase_out_start) * parameters.get(CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_RATE, self.tax_year, self.filing_status))
         
         return 0.0
     
@@ -100,16 +75,11 @@ class CaliforniaStateTaxCredits:
         dependents = self.state_data.get('dependents', 0)
         
         # California dependent exemption
-        if self.tax_year == 2025:
-            return dependents * 158
-        elif self.tax_year == 2024:
-            return dependents * 154
-        elif self.tax_year == 2023:
-            return dependents * 151
-        elif self.tax_year == 2022:
-            return dependents * 148
-            
-        return 0.0
+        credit = parameters.get(CALIFORNIA_DEPENDENT_EXEMPTION_CREDIT, self.tax_year, self.filing_status)
+        if credit is None:
+            return 0.0
+
+        return dependents * credit
     
     def _calculate_other_credits(self, taxable_income: float) -> float:
         """Calculate other California-specific credits."""
@@ -0,0 +1,113 @@
+# Local Imports
+from . import TaxData
+from ..utils.OptionalDependencies import import_numpy
+
+
+# Parameter names, as written in the data files
+FEDERAL_STANDARD_DEDUCTION = "FederalStandardDeduction"
+NET_INVESTMENT_INCOME_THRESHOLD = "NetInvestmentIncomeThreshold"
+CALIFORNIA_STANDARD_DEDUCTION = "CaliforniaStandardDeduction"
+CALIFORNIA_EARNED_INCOME_CREDIT_MAXIMUM = "CaliforniaEarnedIncomeCreditMaximum"
+CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_IN_RATE = "CaliforniaEarnedIncomeCreditPhaseInRate"
+CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_START = "CaliforniaEarnedIncomeCreditPhaseOutStart"
+CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_RATE = "CaliforniaEarnedIncomeCreditPhaseOutRate"
+CALIFORNIA_EARNED_INCOME_CREDIT_PHASE_OUT_END = "CaliforniaEarnedIncomeCreditPhaseOutEnd"
+CALIFORNIA_DEPENDENT_EXEMPTION_CREDIT = "CaliforniaDependentExemptionCredit"
+
+
+class ParameterStore:
+
+    """
+    Index of every tax parameter, such as standard deductions and thresholds, keyed by (jurisdiction, tax_year, filing_status).
+
+    A lookup is one dict access however many years are supported. The batch APIs gather a parameter for every row
+    with a single index into a dense (tax year, filing status) array.
+    """
+
+    def __init__(self, parameters: dict):
+        """Create a ParameterStore object.
+
+        Keyword arguments:
+        parameters -- dict of jurisdiction to tax year to filing status to value
+        """
+        self._values = {}
+        self._tax_years = {}
+        for jurisdiction, years in parameters.items():
+            self._tax_years[jurisdiction] = frozenset(years)
+            for tax_year, amounts in years.items():
+                for filing_status, amount in amounts.items():
+                    self._values[(jurisdiction, tax_year, filing_status)] = amount
+        self._dense = {}
+        return
+
+
+    def get(self, jurisdiction: str, tax_year: int, filing_status: str):
+        """Returns a parameter's value, or None when the combination is not supported.
+
+        Keyword arguments:
+        jurisdiction -- The name of the parameter, such as FEDERAL_STANDARD_DEDUCTION
+        tax_year -- The tax year
+        filing_status -- The filing status
+        """
+        return self._values.get((jurisdiction, tax_year, filing_status))
+
+
+    def tax_years(self, jurisdiction: str):
+        """Returns the tax years a parameter is defined for."""
+        return self._tax_years.get(jurisdiction, frozenset())
+
+
+    def gather(self, jurisdiction: str, tax_years, filing_statuses):
+        """Returns an ndarray of a parameter's value for every row, broadcasting the tax years against the filing statuses.
+
+        Keyword arguments:
+        jurisdiction -- The name of the parameter, such as FEDERAL_STANDARD_DEDUCTION
+        tax_years -- int or array-like of tax years
+        filing_statuses -- str or array-like of filing statuses
+        """
+        np = import_numpy()
+        first_year, statuses, table = self._dense_table(jurisdiction)
+
+        tax_years = np.asarray(tax_years)
+        filing_statuses = np.asarray(filing_statuses)
+        # One comparison per known filing status, rather than sorting the rows to find the distinct ones
+        status_indexes = np.full(filing_statuses.shape, -1, dtype=np.intp)
+        for status, index in statuses.items():
+            status_indexes[filing_statuses == status] = index
+        year_indexes = tax_years.astype(np.intp) - first_year
+
+        # Unsupported rows index the nan cell appended after the table
+        supported = (year_indexes >= 0) & (year_indexes < table.shape[0]) & (status_indexes >= 0)
+        indexes = np.where(supported, year_indexes * table.shape[1] + status_indexes, table.size)
+        values = np.append(table, np.nan).take(indexes)
+
+        unsupported = np.isnan(values)
+        if unsupported.any():
+            row = tuple(np.argwhere(unsupported)[0])
+            tax_year = np.broadcast_to(tax_years, unsupported.shape)[row]
+            filing_status = np.broadcast_to(filing_statuses, unsupported.shape)[row]
+            raise ValueError(f"Unsupported combination of status: {filing_status}, year {tax_year}, jurisdiction: {jurisdiction}")
+        return values
+
+
+    def _dense_table(self, jurisdiction: str):
+        # A (tax year, filing status) array of the parameter, with nan where a combination is not defined
+        dense = self._dense.get(jurisdiction)
+        if dense is None:
+            np = import_numpy()
+            tax_years = self.tax_years(jurisdiction)
+            if not tax_years:
+                raise ValueError(f"Unsupported parameter: {jurisdiction}")
+
+            first_year = min(tax_years)
+            statuses = {status: i for i, status in enumerate(TaxData.FILING_STATUSES)}
+            table = np.full((max(tax_years) - first_year + 1, len(statuses)), np.nan)
+            for (name, tax_year, filing_status), amount in self._values.items():
+                if name == jurisdiction:
+                    table[tax_year - first_year, statuses[filing_status]] = amount
+            dense = self._dense[jurisdiction] = (first_year, statuses, table)
+        return dense
+
+
+# The store shared by every module in easytax
+parameters = ParameterStore(TaxData.load_parameters())
@@ -0,0 +1,323 @@
+# Standard Library Imports
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+# Local Imports
+from ..brackets.BracketRegistry import BracketRegistry, BracketSpec, PROGRESSIVE, REGRESSIVE, FLAT
+from ..utils.Constants import *
+
+
+DATA_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# The compiled snapshot is written to the user's cache directory unless EASYTAX_CACHE_DIR points elsewhere,
+# such as a writable layer of a serverless image. The package directory is often read-only, or shared between users.
+# Every install shares the cache directory, so each names its snapshot after a hash of its data directory.
+SNAPSHOT_NAME = "parameters.bin"
+
+BRACKET_TABLES = (
+    "FederalIncomeTaxBrackets",
+    "FederalLongTermCapitalGainsTaxBrackets",
+    "MedicareIncomeTaxBrackets",
+    "SocialSecurityIncomeTaxBrackets",
+    "NetInvestmentIncomeTaxBrackets",
+    "CaliforniaStateIncomeTaxBrackets",
+    "GeorgiaStateIncomeTaxBrackets",
+)
+
+# Files of named parameters, such as standard deductions, each keyed by tax year and filing status
+PARAMETER_TABLES = (
+    "FederalStandardDeductions",
+    "CaliforniaStandardDeductions",
+    "CaliforniaStateTaxCredits",
+    "NetInvestmentIncomeTaxThresholds",
+)
+
+FILING_STATUSES = (MARRIED_FILING_JOINTLY, MARRIED_FILING_SEPARATELY, SINGLE, HEAD_OF_HOUSEHOLD)
+PARAMETER = "parameter"
+
+# Snapshot layout, all little-endian:
+#   header   - magic, format version, record count, length of the string table
+#   strings  - newline separated: the fingerprint of the data files, then every name the records refer to
+#   records  - one per schedule or parameter: table or parameter name, year, filing status, kind, offset into the values, value counts
+#   values   - float64 tax rates followed by income thresholds, or the single parameter value, 8-byte aligned
+_MAGIC = b"EZTXSNAP"
+_VERSION = 2
+_HEADER = struct.Struct("<8sIII")
+_RECORD = struct.Struct("<HHHHIHH")
+_NO_STATUS = ""
+
+BRACKETS = "brackets"
+PARAMETERS = "parameters"
+
+_tables = None
+
+
+def load_bracket_specs(name: str):
+    """Returns a bracket table as a dict of tax year to BracketSpec, or of tax year to a dict of filing status to BracketSpec.
+
+    Keyword arguments:
+    name -- The name of the table, such as "FederalIncomeTaxBrackets"
+    """
+    if name not in BRACKET_TABLES:
+        raise ValueError(f"Unsupported bracket table: {name}")
+    return _load_tables()[BRACKETS][name]
+
+
+def load_parameters():
+    """Returns every parameter, such as standard deductions, as a dict of parameter name to tax year to filing status to value."""
+    return _load_tables()[PARAMETERS]
+
+
+def load_parameter(name: str):
+    """Returns one parameter as a dict of tax year to a dict of filing status to value.
+
+    Keyword arguments:
+    name -- The name of the parameter, such as "FederalStandardDeduction"
+    """
+    parameters = load_parameters()
+    if name not in parameters:
+        raise ValueError(f"Unsupported parameter: {name}")
+    return parameters[name]
+
+
+def compile_snapshot(path: str | None = None):
+    """Validates the data files and compiles them into a binary snapshot, returning the path written.
+
+    Keyword arguments:
+    path -- Where to write the snapshot. Defaults to the snapshot path read at startup.
+    """
+    path = path or snapshot_path()
+    tables = _read_sources()
+    _write_snapshot(path, _fingerprint(), tables)
+    return path
+
+
+def snapshot_path():
+    cache_directory = os.environ.get("EASYTAX_CACHE_DIR")
+    if not cache_directory:
+        user_cache_directory = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_directory = os.path.join(user_cache_directory, "easytax")
+    name, extension = os.path.splitext(SNAPSHOT_NAME)
+    return os.path.join(cache_directory, f"{name}-{zlib.crc32(DATA_DIRECTORY.encode()):08x}{extension}")
+
+
+def _load_tables():
+    global _tables
+    if _tables is None:
+        fingerprint = _fingerprint()
+        path = snapshot_path()
+        tables = _read_snapshot(path, fingerprint)
+        if tables is None:
+            tables = _read_sources()
+            try:
+                _write_snapshot(path, fingerprint, tables)
+            except OSError:
+                # Like a .pyc, the snapshot is only a cache. Read-only installs parse the data files on each start.
+                pass
+        _tables = tables
+    return _tables
+
+
+def _fingerprint():
+    # Stat, rather than read, the data files so a fresh snapshot can be trusted without parsing them.
+    # The snapshot also records which data directory it was built from, should two installs' names collide.
+    parts = [DATA_DIRECTORY]
+    for name in BRACKET_TABLES + PARAMETER_TABLES:
+        stat = os.stat(os.path.join(DATA_DIRECTORY, f"{name}.json"))
+        parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return ";".join(parts)
+
+
+def _read_sources():
+    # json, and the re and enum modules it pulls in, are only imported when the snapshot is missing or stale
+    import json
+
+    tables = {BRACKETS: {}, PARAMETERS: {}}
+    for name in BRACKET_TABLES + PARAMETER_TABLES:
+        with open(os.path.join(DATA_DIRECTORY, f"{name}.json")) as f:
+            data = json.load(f)
+        try:
+            if name in BRACKET_TABLES:
+                tables[BRACKETS][name] = _parse_bracket_table(data)
+            else:
+                for parameter, values in _parse_parameter_table(data).items():
+                    if parameter in tables[PARAMETERS]:
+                        raise ValueError(f"{parameter} is defined in more than one file")
+                    tables[PARAMETERS][parameter] = values
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid tax data in {name}.json: {e}") from e
+    return tables
+
+
+def _parse_bracket_table(data: dict):
+    by_filing_status = data["by_filing_status"]
+    table = {}
+    for tax_year, schedules in data["schedules"].items():
+        if by_filing_status:
+            table[_parse_year(tax_year)] = {_parse_filing_status(status): _parse_spec(schedule) for status, schedule in schedules.items()}
+        else:
+            table[_parse_year(tax_year)] = _parse_spec(schedules)
+    return table
+
+
+def _parse_spec(schedule: dict):
+    kind = schedule["kind"]
+    if kind == FLAT:
+        spec = BracketSpec(FLAT, (_parse_number(schedule["tax_rate"]),), ())
+    elif kind in (PROGRESSIVE, REGRESSIVE):
+        spec = BracketSpec(kind,
+            tuple(_parse_number(rate) for rate in schedule["tax_rates"]),
+            tuple(_parse_number(threshold) for threshold in schedule["income_thresholds"]))
+    else:
+        raise ValueError(f"Unsupported kind of tax schedule: {kind}")
+
+    # Validate once, with the same rules the brackets enforce, so a snapshot never holds a bad schedule
+    BracketRegistry._build(spec)
+    return spec
+
+
+def _parse_parameter_table(data: dict):
+    parameters = {}
+    for parameter, years in data["parameters"].items():
+        parameters[parameter] = {
+            _parse_year(tax_year): {_parse_filing_status(status): _parse_amount(amount) for status, amount in amounts.items()}
+            for tax_year, amounts in years.items()
+        }
+    return parameters
+
+
+def _parse_year(tax_year: str):
+    if not tax_year.isdigit():
+        raise ValueError(f"tax year must be a number, recieved: {tax_year}")
+    return int(tax_year)
+
+
+def _parse_filing_status(filing_status: str):
+    if filing_status not in FILING_STATUSES:
+        raise ValueError(f"Unsupported filing status: {filing_status}")
+    return filing_status
+
+
+def _parse_number(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Expected a number, recieved: {value}")
+    return float(value)
+
+
+def _parse_amount(value):
+    amount = _parse_number(value)
+    if amount < 0:
+        raise ValueError(f"amounts cannot be negative, recieved: {value}")
+    return _as_int_if_whole(amount)
+
+
+def _as_int_if_whole(amount: float):
+    # Whole dollar amounts stay ints, as they were when written as Python literals
+    return int(amount) if amount.is_integer() else amount
+
+
+def _write_snapshot(path: str, fingerprint: str, tables: dict):
+    strings = [fingerprint]
+    index = {}
+    records = []
+    values = []
+
+    def string_index(string):
+        if string not in index:
+            index[string] = len(strings)
+            strings.append(string)
+        return index[string]
+
+    def add(name, tax_year, filing_status, kind, rates, thresholds):
+        records.append(_RECORD.pack(string_index(name), tax_year, string_index(filing_status), string_index(kind), len(values), len(rates), len(thresholds)))
+        values.extend(rates)
+        values.extend(thresholds)
+
+    for name, table in tables[BRACKETS].items():
+        for tax_year, value in table.items():
+            specs = value.items() if isinstance(value, dict) else [(_NO_STATUS, value)]
+            for filing_status, spec in specs:
+                add(name, tax_year, filing_status, spec.kind, spec.tax_rates, spec.income_thresholds)
+
+    for parameter, years in tables[PARAMETERS].items():
+        for tax_year, amounts in years.items():
+            for filing_status, amount in amounts.items():
+                add(parameter, tax_year, filing_status, PARAMETER, (amount,), ())
+
+    strings = "\n".join(strings).encode("utf-8")
+    strings += b"\0" * (-(_HEADER.size + len(strings)) % 8)
+    body = b"".join(records)
+    body += b"\0" * (-len(body) % 8)
+
+    # Write to a uniquely named file then rename, so a concurrent reader never sees a partial snapshot,
+    # and threads or processes writing at once never share a temporary file
+    import tempfile
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temporary_path = tempfile.mkstemp(prefix=f"{SNAPSHOT_NAME}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(records), len(strings)))
+            f.write(strings)
+            f.write(body)
+            f.write(struct.pack(f"<{len(values)}d", *values))
+        # mkstemp only lets its creator read the file, but a baked snapshot may be read by another user
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+    return
+
+
+def _read_snapshot(path: str, fingerprint: str):
+    # Returns None when the snapshot is missing, from another format version or older than the data files
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+            return _decode_snapshot(snapshot, fingerprint)
+    except (OSError, ValueError, struct.error, IndexError, TypeError):
+        # IndexError and TypeError come from offsets or lengths that do not fit the file, such as a truncated snapshot
+        return None
+
+
+def _decode_snapshot(snapshot, fingerprint: str):
+    magic, version, record_count, strings_length = _HEADER.unpack_from(snapshot, 0)
+    if magic != _MAGIC or version != _VERSION or sys.byteorder != "little":
+        return None
+
+    strings = bytes(snapshot[_HEADER.size:_HEADER.size + strings_length]).rstrip(b"\0").decode("utf-8").split("\n")
+    if strings[0] != fingerprint:
+        return None
+
+    records_offset = _HEADER.size + strings_length
+    values_offset = records_offset + record_count * _RECORD.size
+    values_offset += -values_offset % 8
+
+    tables = {BRACKETS: {name: {} for name in BRACKET_TABLES}, PARAMETERS: {}}
+    with memoryview(snapshot) as view, view[values_offset:].cast("d") as values:
+        for i in range(record_count):
+            table, tax_year, filing_status, kind, offset, rate_count, threshold_count = _RECORD.unpack_from(snapshot, records_offset + i * _RECORD.size)
+            name, filing_status, kind = strings[table], strings[filing_status], strings[kind]
+            # Slicing past the end would quietly give short schedules, so a record must lie within the values
+            if offset + rate_count + threshold_count > len(values):
+                raise ValueError(f"Snapshot record {i} points past the end of its values")
+            if kind == PARAMETER:
+                tables[PARAMETERS].setdefault(name, {}).setdefault(tax_year, {})[filing_status] = _as_int_if_whole(values[offset])
+                continue
+
+            thresholds_offset = offset + rate_count
+            spec = BracketSpec(kind, tuple(values[offset:thresholds_offset]), tuple(values[thresholds_offset:thresholds_offset + threshold_count]))
+            if filing_status == _NO_STATUS:
+                tables[BRACKETS][name][tax_year] = spec
+            else:
+                tables[BRACKETS][name].setdefault(tax_year, {})[filing_status] = spec
+    return tables
+
+
+if __name__ == "__main__":
+    # Bake the snapshot into a build, such as a serverless image: python -m easytax.data.TaxData
+    print(compile_snapshot())
@@ -1,49 +1,27 @@
-# 2025 Married Filing Jointly
-# Source: https://www.nerdwallet.com/taxes/learn/standard-deduction
-married_filing_jointly_2025_deduction = 31500
+# Local Imports
+from ..data import TaxData
+from ..utils.Constants import *
 
-# 2025 Married Filing Separately
-# Source: https://www.nerdwallet.com/taxes/learn/standard-deduction
-married_filing_separately_2025_deduction = 15750
 
-# 2025 Single Filer
-# Source: https://www.nerdwallet.com/taxes/learn/standard-deduction
-single_filer_2025_deduction = 15750
+# Amounts and their sources live in data/FederalStandardDeductions.json
+standard_deductions = TaxData.load_parameter("FederalStandardDeduction")
 
+# 2025
+married_filing_jointly_2025_deduction = standard_deductions[2025][MARRIED_FILING_JOINTLY]
+married_filing_separately_2025_deduction = standard_deductions[2025][MARRIED_FILING_SEPARATELY]
+single_filer_2025_deduction = standard_deductions[2025][SINGLE]
 
-# 2024 Married Filing Jointly
-# Source: https://www.irs.gov/newsroom/irs-provides-tax-inflation-adjustments-for-tax-year-2024
-married_filing_jointly_2024_deduction = 29200
+# 2024
+married_filing_jointly_2024_deduction = standard_deductions[2024][MARRIED_FILING_JOINTLY]
+married_filing_separately_2024_deduction = standard_deductions[2024][MARRIED_FILING_SEPARATELY]
+single_filer_2024_deduction = standard_deductions[2024][SINGLE]
 
-# 2024 Married Filing Separately
-# Source: https://www.irs.gov/newsroom/irs-provides-tax-inflation-adjustments-for-tax-year-2024
-married_filing_separately_2024_deduction = 14600
+# 2023
+married_filing_jointly_2023_deduction = standard_deductions[2023][MARRIED_FILING_JOINTLY]
+married_filing_separately_2023_deduction = standard_deductions[2023][MARRIED_FILING_SEPARATELY]
+single_filer_2023_deduction = standard_deductions[2023][SINGLE]
 
-# 2024 Single Filer
-# Source: https://www.irs.gov/newsroom/irs-provides-tax-inflation-adjustments-for-tax-year-2024
-single_filer_2024_deduction = 14600
-
-
-# 2023 Married Filing Jointly
-# Source: https://www.nerdwallet.com/article/taxes/standard-deduction
-married_filing_jointly_2023_deduction = 27700
-
-# 2023 Married Filing Seperatlely
-# Source: https://www.nerdwallet.com/article/taxes/standard-deduction
-married_filing_separately_2023_deduction = 13850
-
-# 2023 Single Filer
-# Source: https://www.nerdwallet.com/article/taxes/standard-deduction
-single_filer_2023_deduction = 13850
-
-# 2022 Married Filing Jointly
-# Source: https://apps.irs.gov/app/vita/content/00/00_13_005.jsp
-married_filing_jointly_2022_deduction = 25900 
-
-# 2022 Married Filing Seperatlely
-# Source: hhttps://apps.irs.gov/app/vita/content/00/00_13_005.jsp
-married_filing_separately_2022_deduction = 12950
-
-# 2022 Single Filer
-# Source: https://apps.irs.gov/app/vita/content/00/00_13_005.jsp
-single_filer_2022_deduction = 12950
\ No newline at end of file
+# 2022
+married_filing_jointly_2022_deduction = standard_deductions[2022][MARRIED_FILING_JOINTLY]
+married_filing_separately_2022_deduction = standard_deductions[2022][MARRIED_FILING_SEPARATELY]
+single_filer_2022_deduction = standard_deductions[2022][SINGLE]
@@ -0,0 +1,5 @@
+# Deduction tables are imported on first use
+from ..utils.LazyImport import lazy_submodules
+
+__all__ = ["FederalStandardDeductions", "states"]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1,36 +1,12 @@
+from ...data import TaxData
+from ...data.ParameterStore import parameters, CALIFORNIA_STANDARD_DEDUCTION
 from ...utils.Constants import *
 
 class CaliforniaStandardDeductions:
     """California standard deduction amounts by tax year and filing status."""
     
-    # California standard deduction amounts
-    STANDARD_DEDUCTIONS = {
-        # Source: https://www.nerdwallet.com/taxes/learn/california-state-tax
-        2025: {
-            SINGLE: 5706,
-            MARRIED_FILING_JOINTLY: 11412,
-            MARRIED_FILING_SEPARATELY: 5706,
-            HEAD_OF_HOUSEHOLD: 11412
-        },
-        2024: {
-            SINGLE: 5540,
-            MARRIED_FILING_JOINTLY: 11080,
-            MARRIED_FILING_SEPARATELY: 5540,
-            HEAD_OF_HOUSEHOLD: 11080
-        },
-        2023: {
-            SINGLE: 5363,
-            MARRIED_FILING_JOINTLY: 10726,
-            MARRIED_FILING_SEPARATELY: 5363,
-            HEAD_OF_HOUSEHOLD: 10726
-        },
-        2022: {
-            SINGLE: 5202,
-            MARRIED_FILING_JOINTLY: 10404,
-            MARRIED_FILING_SEPARATELY: 5202,
-            HEAD_OF_HOUSEHOLD: 10404
-        }
-    }
+    # California standard deduction amounts. Amounts and their sources live in data/CaliforniaStandardDeductions.json
+    STANDARD_DEDUCTIONS = TaxData.load_parameter(CALIFORNIA_STANDARD_DEDUCTION)
     
     @classmethod
     def get_standard_deduction(cls, tax_year: int, filing_status: str) -> float:
@@ -47,10 +23,10 @@ class CaliforniaStandardDeductions:
         Raises:
             ValueError: If tax year or filing status is not supported
         """
-        if tax_year not in cls.STANDARD_DEDUCTIONS:
-            raise ValueError(f"Tax year {tax_year} not supported for California standard deductions")
-            
-        if filing_status not in cls.STANDARD_DEDUCTIONS[tax_year]:
+        standard_deduction = parameters.get(CALIFORNIA_STANDARD_DEDUCTION, tax_year, filing_status)
+        if standard_deduction is None:
+            if tax_year not in parameters.tax_years(CALIFORNIA_STANDARD_DEDUCTION):
+                raise ValueError(f"Tax year {tax_year} not supported for California standard deductions")
             raise ValueError(f"Filing status '{filing_status}' not supported for California standard deductions")
             
-        return cls.STANDARD_DEDUCTIONS[tax_year][filing_status] 
\ No newline at end of file
+        return standard_deduction 
\ No newline at end of file
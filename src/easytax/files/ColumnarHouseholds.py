@@ -0,0 +1,290 @@
+# Standard Library Imports
+import json
+import mmap
+import os
+
+# Local Imports
+from ..handler.TaxEngine import TaxEngine, RECORD_KEYS, BATCH_COLUMNS, PERSON_FIELDS, EXEMPTIONS_NOT_GIVEN
+from ..income.FederalIncomeBatch import FederalIncomeBatch
+from ..income.FederalIncomeHandler import FederalIncomeHandler
+from ..utils.InputValidator import InputValidator
+from ..utils.OptionalDependencies import import_numpy
+
+
+# The layout version, so a file written by another layout is refused rather than misread
+FORMAT_VERSION = 2
+
+# The file describing the columns, written last so a directory without one was never finished
+MANIFEST = "manifest.json"
+
+# One file per column, one value per person. Little-endian, so a file reads the same on every machine.
+# filing_status and state are codes into tables kept in the manifest. An exemptions of EXEMPTIONS_NOT_GIVEN was not given.
+# Incomes, adjustments and deductions that no household gives are not kept, and are 0 when calculating.
+COLUMN_DTYPES = {
+    "household": "<i8",
+    "tax_year": "<i2",
+    "filing_status": "|u1",
+    "state": "|u1",
+    "exemptions": "<i2",
+    "dependents": "<i2",
+    "use_standard_deduction": "|b1",
+}
+COLUMN_DTYPES.update((field, "<f8") for field in FederalIncomeBatch.COLUMN_FIELDS)
+
+# The household_id of each household, when the households had them: the UTF-8 text of every id, one after another,
+# and the offset of each household's id in that text, with one more offset for the end of the last id.
+HOUSEHOLD_IDS = "household_id.bin"
+HOUSEHOLD_ID_OFFSETS = "household_id_offsets.bin"
+
+# People written to the column files at a time
+WRITE_CHUNK_SIZE = 2**16
+
+
+class ColumnarHouseholds:
+
+    """
+    Households stored column by column in a directory, one fixed-type binary file per column, opened with numpy.memmap.
+
+    Write a file of households once with write, then open it as often as needed: opening parses nothing, and
+    calculating reads the columns straight from the operating system's page cache, which every process that opens
+    the same directory shares. Every row is one person, numbered with the household it belongs to.
+    """
+
+    def __init__(self, path: str):
+        """Open a ColumnarHouseholds directory written by write. The columns are memory-mapped read-only.
+
+        Keyword arguments:
+        path: str - The directory
+        """
+        np = import_numpy()
+        with open(os.path.join(path, MANIFEST)) as file:
+            manifest = json.load(file)
+        if manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported format_version {manifest.get('format_version')} of {path}, expected: {FORMAT_VERSION}")
+
+        self.path = path
+        self.rows = manifest["rows"]
+        self.households = manifest["households"]
+        self.filing_statuses = manifest["filing_statuses"]
+        self.states = manifest["states"]
+        self.has_household_ids = manifest.get("household_ids", False)
+        if self.has_household_ids:
+            self._household_id_offsets = np.memmap(os.path.join(path, HOUSEHOLD_ID_OFFSETS), dtype="<i8", mode="r", shape=(self.households + 1,))
+            with open(os.path.join(path, HOUSEHOLD_IDS), "rb") as file:
+                # An empty file cannot be mapped, and is left as no text
+                self._household_id_text = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(file.fileno()).st_size else b""
+        self.columns = {}
+        for name, dtype in manifest["columns"].items():
+            if self.rows:
+                self.columns[name] = np.memmap(os.path.join(path, f"{name}.bin"), dtype=dtype, mode="r", shape=(self.rows,))
+            else:
+                # An empty file cannot be mapped
+                self.columns[name] = np.zeros(0, dtype=dtype)
+        return
+
+
+    def __len__(self):
+        return self.households
+
+
+    def household_ids(self, start: int = 0, stop: int | None = None):
+        """Returns the household_id of households start to stop as a list, or None if the households were written without them.
+
+        Keyword arguments:
+        start: int - The first household
+        stop: int - The household after the last. Defaults to the number of households.
+        """
+        if not self.has_household_ids:
+            return None
+        stop = self.households if stop is None else min(stop, self.households)
+        if start >= stop:
+            return []
+        offsets = self._household_id_offsets[start:stop + 1].tolist()
+        text = self._household_id_text[offsets[0]:offsets[-1]]
+        return [text[first - offsets[0]:last - offsets[0]].decode("utf-8") for first, last in zip(offsets, offsets[1:])]
+
+
+    @classmethod
+    def write(cls, path: str, records, tax_year: int | None = None, filing_status: str | None = None, state: str | None = None, household_ids: bool = False):
+        """Writes households to a ColumnarHouseholds directory, one at a time, and returns it opened.
+
+        Each household's tax_year, filing_status and state are validated as they are written, so opening the
+        directory later needs no checks. Every value is checked to fit its column's type, rather than being rounded
+        or wrapped into it. The only state_data written is Georgia's exemptions.
+
+        Keyword arguments:
+        path: str - The directory, created if it does not exist. Any ColumnarHouseholds already in it is replaced.
+        records: iterable - Each household, either as its incomes_adjustments_and_deductions list, or as a dict of TaxHandler arguments
+        tax_year: int - The tax year of every household that does not give its own
+        filing_status: str - The filing status of every household that does not give its own
+        state: str - The state of every household that does not give its own
+        household_ids: bool - Whether each of records is a (household_id, record) pair, as HouseholdReader returns them, whose household_id is kept
+        """
+        np = import_numpy()
+        os.makedirs(path, exist_ok=True)
+        manifest_path = os.path.join(path, MANIFEST)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        dtype = np.dtype(list(COLUMN_DTYPES.items()))
+        filing_statuses, states = {}, {}
+        validated = set()
+        defaults = tuple(FederalIncomeHandler.SCHEMA.defaults[field] for field in PERSON_FIELDS)
+        positions = {field: position for position, field in enumerate(PERSON_FIELDS)}
+        given = set()
+        dependents_range = np.iinfo(COLUMN_DTYPES["dependents"])
+        exemptions_range = np.iinfo(COLUMN_DTYPES["exemptions"])
+        files = {name: open(os.path.join(path, f"{name}.bin"), "wb") for name in COLUMN_DTYPES}
+        if household_ids:
+            files[HOUSEHOLD_IDS] = open(os.path.join(path, HOUSEHOLD_IDS), "wb")
+            files[HOUSEHOLD_ID_OFFSETS] = open(os.path.join(path, HOUSEHOLD_ID_OFFSETS), "wb")
+        rows, households, buffer = 0, 0, []
+        household_id_offsets, household_id_end = [0], 0
+
+        def flush():
+            table = np.array(buffer, dtype=dtype)
+            for name in COLUMN_DTYPES:
+                table[name].tofile(files[name])
+            buffer.clear()
+            if household_ids:
+                np.array(household_id_offsets, dtype="<i8").tofile(files[HOUSEHOLD_ID_OFFSETS])
+                household_id_offsets.clear()
+
+        try:
+            for index, record in enumerate(records):
+                if household_ids:
+                    household_id, record = record
+                    encoded = ("" if household_id is None else household_id).encode("utf-8")
+                    files[HOUSEHOLD_IDS].write(encoded)
+                    household_id_end += len(encoded)
+                    household_id_offsets.append(household_id_end)
+                if not isinstance(record, dict):
+                    record = {"incomes_adjustments_and_deductions": record}
+                for key in record:
+                    if key not in RECORD_KEYS:
+                        raise ValueError(f"Unsupported key {key} in household {index}, expected any of: {InputValidator.alphabetize_set(RECORD_KEYS)}")
+                household_tax_year = record.get("tax_year", tax_year)
+                household_filing_status = record.get("filing_status", filing_status)
+                household_state = record.get("state", state)
+                if (household_tax_year, household_filing_status, household_state) not in validated:
+                    try:
+                        InputValidator.validate_tax_year(household_tax_year)
+                        InputValidator.validate_filing_status(household_filing_status)
+                        InputValidator.validate_state(household_state)
+                    except ValueError as e:
+                        raise ValueError(f"{e}, in household {index}") from None
+                    validated.add((household_tax_year, household_filing_status, household_state))
+
+                state_data = record.get("state_data") or {}
+                for key in state_data:
+                    if key != "exemptions":
+                        raise ValueError(f"Unsupported state_data key {key} in household {index}, expected any of: ['exemptions']")
+                exemptions = state_data.get("exemptions")
+                if exemptions is not None and type(exemptions) is not int:
+                    raise TypeError(f"state_data specified invalid type for 'exemptions': {type(exemptions)}")
+                # The smallest value is EXEMPTIONS_NOT_GIVEN
+                if exemptions is not None and not exemptions_range.min < exemptions <= exemptions_range.max:
+                    raise ValueError(f"exemptions must be between {exemptions_range.min + 1} and {exemptions_range.max}, recieved: {exemptions}, in household {index}")
+
+                people = record["incomes_adjustments_and_deductions"]
+                if not people:
+                    raise ValueError(f"Household {index} has no incomes_adjustments_and_deductions")
+                try:
+                    InputValidator.validate_household(people, record.get("state_data"))
+                except TypeError as e:
+                    raise TypeError(f"{e}, in household {index}") from None
+                household = (households,
+                    household_tax_year,
+                    filing_statuses.setdefault(household_filing_status, len(filing_statuses)),
+                    states.setdefault(household_state, len(states)),
+                    EXEMPTIONS_NOT_GIVEN if exemptions is None else exemptions)
+                for person in people:
+                    values = list(defaults)
+                    for key, value in person.items():
+                        position = positions.get(key)
+                        if position is None:
+                            raise ValueError(f"Unsupported income for key {key} in household {index}")
+                        if key == "use_standard_deduction":
+                            if type(value) is not bool:
+                                raise TypeError(f"Unsupported type {type(value)} for use_standard_deduction in household {index}")
+                        elif key == "dependents":
+                            if type(value) is not int:
+                                raise TypeError(f"Unsupported type {type(value)} for dependents in household {index}")
+                            if not dependents_range.min <= value <= dependents_range.max:
+                                raise ValueError(f"dependents must be between {dependents_range.min} and {dependents_range.max}, recieved: {value}, in household {index}")
+                        elif type(value) not in (int, float):
+                            raise TypeError(f"Unsupported income type {type(value)} for {key} in household {index}")
+                        values[position] = value
+                    given.update(person)
+                    buffer.append(household + tuple(values))
+                rows += len(people)
+                households += 1
+                if len(buffer) >= WRITE_CHUNK_SIZE:
+                    flush()
+            if buffer or household_id_offsets:
+                flush()
+        finally:
+            for file in files.values():
+                file.close()
+
+        columns = {name: dtype for name, dtype in COLUMN_DTYPES.items() if name not in PERSON_FIELDS or name in given}
+        for name in COLUMN_DTYPES.keys() - columns.keys():
+            os.remove(os.path.join(path, f"{name}.bin"))
+        if not household_ids:
+            # Left by an earlier write to the same directory
+            for name in (HOUSEHOLD_IDS, HOUSEHOLD_ID_OFFSETS):
+                if os.path.exists(os.path.join(path, name)):
+                    os.remove(os.path.join(path, name))
+        with open(manifest_path, "w") as file:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "rows": rows,
+                "households": households,
+                "columns": columns,
+                "filing_statuses": list(filing_statuses),
+                "states": list(states),
+                "household_ids": household_ids,
+            }, file, indent=4)
+        return cls(path)
+
+
+    def compute(self, engine: TaxEngine | None = None, start: int = 0, stop: int | None = None):
+        """Returns the taxes of households start to stop, as TaxEngine.compute_batch returns them.
+
+        The rows are grouped by tax_year, filing_status and state, and each group is calculated in one
+        compute_batch. A range of households sharing all three is calculated straight from the mapped columns.
+
+        Keyword arguments:
+        engine: TaxEngine - The engine to calculate with. Defaults to a new one.
+        start: int - The first household
+        stop: int - The household after the last. Defaults to the number of households.
+        """
+        np = import_numpy()
+        engine = TaxEngine() if engine is None else engine
+        stop = self.households if stop is None else min(stop, self.households)
+        columns = self.columns
+        household = columns["household"]
+        # The rows of households start to stop, found by bisecting the household numbers
+        first, last = np.searchsorted(household, [start, stop])
+        if first == last:
+            return {name: np.zeros(0) for name in BATCH_COLUMNS}
+        rows = {name: column[first:last] for name, column in columns.items()}
+
+        starts = np.concatenate(([0], np.flatnonzero(rows["household"][1:] != rows["household"][:-1]) + 1))
+        keys = [rows[name][starts] for name in ("tax_year", "filing_status", "state")]
+        groups, group_of_household = np.unique(np.stack(keys), axis=1, return_inverse=True)
+        group_of_household = group_of_household.reshape(-1)
+        people = np.diff(np.append(starts, last - first))
+
+        taxes = {name: np.zeros(len(starts)) for name in BATCH_COLUMNS}
+        for group, (tax_year, filing_status, state) in enumerate(groups.T.tolist()):
+            if groups.shape[1] == 1:
+                selected, in_group = rows, slice(None)
+            else:
+                in_group = group_of_household == group
+                selected = {name: column[np.repeat(in_group, people)] for name, column in rows.items()}
+            group_taxes = engine.compute_batch(tax_year, self.filing_statuses[filing_status], self.states[state],
+                household=selected["household"], exemptions=selected["exemptions"], **{field: selected[field] for field in PERSON_FIELDS if field in selected})
+            for name in BATCH_COLUMNS:
+                taxes[name][in_group] = group_taxes[name]
+        return taxes
@@ -0,0 +1,191 @@
+# Standard Library Imports
+import csv
+import json
+import os
+
+# Local Imports
+from ..income.FederalIncomeHandler import FederalIncomeHandler
+from ..utils.InputValidator import InputValidator
+
+
+def _parse_bool(value: str):
+    lowered = value.lower()
+    if lowered in ("true", "1", "yes"):
+        return True
+    if lowered in ("false", "0", "no"):
+        return False
+    raise ValueError(f"Expected true or false, recieved: {value}")
+
+
+def _parse_number(value: str):
+    # State data such as Georgia's exemptions must be whole numbers
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+# File formats. JSONL and NDJSON are the same format, one JSON object per line.
+CSV = "csv"
+JSONL = "jsonl"
+NDJSON = "ndjson"
+FORMATS = {CSV, JSONL, NDJSON}
+
+# Consecutive CSV rows with the same household_id are the people of one household. Rows without one are alone.
+HOUSEHOLD_ID = "household_id"
+
+# CSV columns describing the household, rather than one of its people. Empty cells take the defaults given to the engine.
+HOUSEHOLD_COLUMNS = {"tax_year": int, "filing_status": str, "state": str}
+
+# CSV columns named state_data.<key> become the key of the household's state_data, such as state_data.exemptions
+STATE_DATA_PREFIX = "state_data."
+
+# CSV columns of one person's incomes, adjustments and deductions: every FederalIncomeHandler field but the household's
+PERSON_COLUMNS = {field: float for field in FederalIncomeHandler.SCHEMA.fields if field not in HOUSEHOLD_COLUMNS}
+PERSON_COLUMNS.update(dependents=int, use_standard_deduction=_parse_bool)
+
+
+def format_of(path: str, default: str):
+    """Returns the format of a file from its extension, such as csv for households.csv.
+
+    Keyword arguments:
+    path: str - The path of the file, or - for stdin or stdout
+    default: str - The format of a path without a known extension
+    """
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    return extension if extension in FORMATS else default
+
+
+class HouseholdReader:
+
+    """
+    Reads households, one at a time, from a CSV or JSONL file, as the records TaxEngine.compute_many takes.
+
+    A JSONL line is a JSON object of TaxHandler arguments. A CSV row is one person: its columns are any of tax_year,
+    filing_status, state, state_data.<key> and the fields of FederalIncomeHandler.from_dict, where salaries_and_wages
+    is required. A person's empty cells take the FederalIncomeHandler defaults. When there is a household_id column,
+    consecutive rows with the same, non-empty, household_id are one household, whose tax_year, filing_status, state
+    and state_data are those of its first row.
+
+    Nothing is kept once a household has been returned, so a file of any size is read in constant memory.
+    """
+
+    def __init__(self, file, format: str = CSV):
+        """Create a HouseholdReader object. The header of a CSV file is read and validated straight away.
+
+        Keyword arguments:
+        file: file - The text file to read, opened with newline=''
+        format: str - csv, or jsonl (also called ndjson)
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported format {format}, expected any of: {InputValidator.alphabetize_set(FORMATS)}")
+        self.file = file
+        self.format = format
+        self.has_household_ids = False
+        if format == CSV:
+            self._rows = csv.reader(file)
+            self._compile(next(self._rows, []))
+        return
+
+
+    def __iter__(self):
+        """Returns a generator of (household_id, record) for every household. household_id is None without that column."""
+        if self.format == CSV:
+            return self._csv_households()
+        return self._jsonl_households()
+
+
+    def _compile(self, header: list[str]):
+        # Works out, once, which record key each column fills and how its cells are converted
+        self.width = len(header)
+        self._household_columns = []
+        self._state_data_columns = []
+        self._person_columns = []
+        self._household_id_column = None
+        for column, name in enumerate(header):
+            if name == HOUSEHOLD_ID:
+                self._household_id_column = column
+                self.has_household_ids = True
+            elif name in HOUSEHOLD_COLUMNS:
+                self._household_columns.append((column, name, HOUSEHOLD_COLUMNS[name]))
+            elif name.startswith(STATE_DATA_PREFIX) and len(name) > len(STATE_DATA_PREFIX):
+                self._state_data_columns.append((column, name, name[len(STATE_DATA_PREFIX):]))
+            elif name in PERSON_COLUMNS:
+                self._person_columns.append((column, name, PERSON_COLUMNS[name], FederalIncomeHandler.SCHEMA.defaults[name]))
+            else:
+                supported = set(HOUSEHOLD_COLUMNS) | set(PERSON_COLUMNS) | {HOUSEHOLD_ID, STATE_DATA_PREFIX + "<key>"}
+                raise ValueError(f"Unsupported column {name}, expected any of: {InputValidator.alphabetize_set(supported)}")
+        if "salaries_and_wages" not in header:
+            raise ValueError("salaries_and_wages is a required column")
+        return
+
+
+    def _csv_households(self):
+        rows = self._rows
+        household_id_column = self._household_id_column
+        household_id, record = None, None
+        for row in rows:
+            if not row:
+                continue
+            if len(row) != self.width:
+                raise ValueError(f"Line {rows.line_num} has {len(row)} columns, expected: {self.width}")
+            if household_id_column is not None and record is not None and household_id and row[household_id_column] == household_id:
+                record["incomes_adjustments_and_deductions"].append(self._person(row, rows.line_num))
+                continue
+            if record is not None:
+                yield household_id, record
+            household_id = None if household_id_column is None else row[household_id_column]
+            record = self._household(row, rows.line_num)
+        if record is not None:
+            yield household_id, record
+
+
+    def _household(self, row: list[str], line: int):
+        record = {}
+        for column, name, convert in self._household_columns:
+            if row[column]:
+                record[name] = self._convert(convert, row[column], name, line)
+        if self._state_data_columns:
+            state_data = {key: self._convert(_parse_number, row[column], name, line) for column, name, key in self._state_data_columns if row[column]}
+            if state_data:
+                record["state_data"] = state_data
+        record["incomes_adjustments_and_deductions"] = [self._person(row, line)]
+        return record
+
+
+    def _person(self, row: list[str], line: int):
+        try:
+            return {name: convert(row[column]) if row[column] else default for column, name, convert, default in self._person_columns}
+        except ValueError:
+            # Converted again, one cell at a time, to name the invalid one
+            for column, name, convert, default in self._person_columns:
+                if row[column]:
+                    self._convert(convert, row[column], name, line)
+            raise
+
+
+    @staticmethod
+    def _convert(convert, value: str, name: str, line: int):
+        try:
+            return convert(value)
+        except ValueError:
+            raise ValueError(f"Invalid {name} on line {line}, recieved: {value}") from None
+
+
+    def _jsonl_households(self):
+        for line, text in enumerate(self.file, 1):
+            if not text.strip():
+                continue
+            try:
+                record = json.loads(text)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON on line {line}: {e}") from None
+            if not isinstance(record, dict):
+                raise ValueError(f"Expected a JSON object of TaxHandler arguments on line {line}, recieved: {type(record).__name__}")
+            try:
+                # A missing incomes_adjustments_and_deductions is reported when the household is calculated
+                if "incomes_adjustments_and_deductions" in record:
+                    InputValidator.validate_household(record["incomes_adjustments_and_deductions"], record.get("state_data"))
+            except (TypeError, ValueError) as e:
+                raise type(e)(f"{e}, on line {line}") from None
+            yield None, record
@@ -0,0 +1,98 @@
+# Standard Library Imports
+import csv
+import json
+
+# Local Imports
+from ..utils.InputValidator import InputValidator
+from .HouseholdReader import CSV, NDJSON, FORMATS, HOUSEHOLD_ID
+
+
+# The columns of a CSV of results, after index and household_id. Each is the (tax, amount) summed over the household's people.
+CSV_COLUMNS = {
+    "federal_income_tax_owed": ("federal", "income_tax_owed"),
+    "federal_long_term_capital_gains_tax_owed": ("federal", "long_term_capital_gains_tax_owed"),
+    "state_income_tax_owed": ("state", "income_tax_owed"),
+    "state_long_term_capital_gains_tax_owed": ("state", "long_term_capital_gains_tax_owed"),
+    "social_security_tax_owed": ("social_security", "income_tax_owed"),
+    "medicare_tax_owed": ("medicare", "income_tax_owed"),
+    "niit_owed": ("niit", "income_tax_owed"),
+}
+
+
+class ResultWriter:
+
+    """
+    Writes the summary_json of each household to a CSV or NDJSON file, as it is calculated.
+
+    A CSV row is the household's index in the input, its household_id when the households had them, each tax in
+    CSV_COLUMNS summed over the household's people, and total_tax_owed. An NDJSON line written by write is the
+    household's summary_json, with its household_id when the households had them. Taxes calculated in batches have no
+    per-person summary, so an NDJSON line written by write_batch holds the same fields as a CSV row instead.
+    """
+
+    def __init__(self, file, format: str = NDJSON, household_ids: bool = False):
+        """Create a ResultWriter object. The header of a CSV file is written straight away.
+
+        Keyword arguments:
+        file: file - The text file to write, opened with newline=''
+        format: str - csv, or ndjson (also called jsonl)
+        household_ids: bool - Whether each household has a household_id to write alongside its taxes
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unsupported format {format}, expected any of: {InputValidator.alphabetize_set(FORMATS)}")
+        self.file = file
+        self.format = format
+        self.household_ids = household_ids
+        if format == CSV:
+            self._rows = csv.writer(file, lineterminator="\n")
+            self._rows.writerow(["index"] + ([HOUSEHOLD_ID] if household_ids else []) + list(CSV_COLUMNS) + ["total_tax_owed"])
+        return
+
+
+    def write(self, index: int, household_id: str | None, summary: dict):
+        """Writes the taxes of one household.
+
+        Keyword arguments:
+        index: int - The household's position in the input
+        household_id: str - The household's household_id, ignored unless the writer was created with household_ids
+        summary: dict - The household's summary_json
+        """
+        if self.format == CSV:
+            row = [index, household_id] if self.household_ids else [index]
+            row.extend(sum(summary[tax][amount]) for tax, amount in CSV_COLUMNS.values())
+            row.append(summary["total_tax_owed"])
+            self._rows.writerow(row)
+        else:
+            if self.household_ids:
+                summary = dict(summary, household_id=household_id)
+            self.file.write(json.dumps(summary))
+            self.file.write("\n")
+        return
+
+
+    def write_batch(self, start: int, taxes: dict, household_ids: list | None = None):
+        """Writes the taxes of consecutive households, as TaxEngine.compute_batch and ColumnarHouseholds.compute return them.
+
+        A CSV row is the same as write's. An NDJSON line holds the same fields as the CSV row, by the CSV's column names.
+
+        Keyword arguments:
+        start: int - The position in the input of the first household
+        taxes: dict - Each of the CSV's tax columns and total_tax_owed, to an array with one value per household
+        household_ids: list - The household_id of each household, required if the writer was created with household_ids
+        """
+        names = list(CSV_COLUMNS) + ["total_tax_owed"]
+        columns = [taxes[name].tolist() for name in names]
+        indexes = range(start, start + len(columns[0]))
+        if self.household_ids:
+            if household_ids is None or len(household_ids) != len(indexes):
+                raise ValueError(f"Expected a household_id for each of the {len(indexes)} households, recieved: {None if household_ids is None else len(household_ids)}")
+            columns.insert(0, household_ids)
+            names.insert(0, HOUSEHOLD_ID)
+        if self.format == CSV:
+            self._rows.writerows(zip(indexes, *columns))
+        else:
+            names.insert(0, "index")
+            for row in zip(indexes, *columns):
+                self.file.write(json.dumps(dict(zip(names, row))))
+                self.file.write("\n")
+        return
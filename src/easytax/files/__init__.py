@@ -0,0 +1,9 @@
+# Reading households from, and writing their taxes to, files. Its modules are imported on first use.
+from ..utils.LazyImport import lazy_submodules
+
+__all__ = [
+    "ColumnarHouseholds",
+    "HouseholdReader",
+    "ResultWriter",
+]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
@@ -1,7 +1,8 @@
 
 # Local Imports
-from ..utils.Logger import logger
+from ..utils.Logger import get_logger
 from ..base.Tax import Tax
+from .IndividualTaxResult import IndividualTaxResult
 
 
 # Each handler can have its own AGI / MAGI
@@ -44,13 +45,26 @@ class IndividualIncomeTaxHandlerBase(metaclass=ForceRequiredAttributeDefinitionM
 
 
     def calculate_taxes(self):
-        self.income_tax_owed = [self.income_tax_brackets.calculate_taxes(i) for i in self.taxable_incomes]
+        self.income_tax_owed = self.taxes_owed(self.income_tax_brackets, self.taxable_incomes)
+        self.income_marginal_rates = [self.income_tax_brackets.marginal_rate(i) for i in self.taxable_incomes]
         return
+
+
+    @staticmethod
+    def taxes_owed(income_tax_brackets: Tax, taxable_incomes: list):
+        """Returns the tax owed by each person, as a list. The one calculation shared by calculate_taxes and TaxEngine.
+
+        Keyword arguments:
+        income_tax_brackets: Tax - The tax
+        taxable_incomes: list[float] - The taxable income of each person
+        """
+        return [income_tax_brackets.calculate_taxes(i) for i in taxable_incomes]
     
 
     def display_tax_summary(self):
 
         try:            
+            logger = get_logger()
             logger.info(f'{self.tax_name} Tax Summary')
             logger.info(f'{self.tax_name} Modified Adjusted Gross Incomes: {", ".join([f"${i:,.0f}" for i in self.taxable_incomes])}')
             logger.info(f'{self.tax_name} Income Tax owed: {", ".join([f"${i:,.0f}" for i in self.income_tax_owed])}\n')
@@ -59,12 +73,14 @@ class IndividualIncomeTaxHandlerBase(metaclass=ForceRequiredAttributeDefinitionM
         return
 
 
-    def summary_json(self):
-
+    def result(self):
+        """Returns the calculated taxes as an immutable IndividualTaxResult, which shares none of the handler's lists."""
         try:
-            return {
-                    'taxable_incomes': self.taxable_incomes,
-                    'income_tax_owed': self.income_tax_owed,
-                }
+            return IndividualTaxResult(self.taxable_incomes, self.income_tax_owed)
         except AttributeError as e:
             raise AttributeError(f"{e}. Ensure you call 'calculate_taxes' before attempting to call this method.")
+
+
+    def summary_json(self):
+        # Fresh lists, so changing the summary cannot change the handler
+        return self.result().to_dict()
@@ -0,0 +1,36 @@
+# Local Imports
+from .TaxResultBase import TaxResultBase
+
+
+class IndividualTaxResult(TaxResultBase):
+
+    """
+    The taxes of an IndividualIncomeTaxHandlerBase, such as Social Security or Medicare, with one entry per person.
+
+    Each field is a tuple, returned as-is by its accessor, so reading a result never copies it.
+    """
+
+    FIELDS = ("taxable_incomes", "income_tax_owed")
+    __slots__ = FIELDS
+
+    def __init__(self, taxable_incomes: tuple, income_tax_owed: tuple):
+        """Create an IndividualTaxResult object.
+
+        Keyword arguments:
+        taxable_incomes -- The taxable income of each person
+        income_tax_owed -- The tax owed by each person
+        """
+        # Slots are set through object, as this class refuses every other assignment
+        object.__setattr__(self, "taxable_incomes", tuple(taxable_incomes))
+        object.__setattr__(self, "income_tax_owed", tuple(income_tax_owed))
+        return
+
+
+    def to_dict(self):
+        """Returns the same dict as IndividualIncomeTaxHandlerBase.summary_json, with fresh lists the caller may change."""
+        return {'taxable_incomes': list(self.taxable_incomes), 'income_tax_owed': list(self.income_tax_owed)}
+
+
+    def to_tuple(self):
+        """Returns the fields as a tuple, in the order of FIELDS."""
+        return (self.taxable_incomes, self.income_tax_owed)
@@ -0,0 +1,211 @@
+# Standard Library Imports
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+import os
+
+# Local Imports
+from .TaxEngine import TaxEngine
+
+
+# Households sent to a worker at a time. Large enough that pickling and scheduling are a small share of each chunk.
+DEFAULT_CHUNK_SIZE = 2000
+
+# Households of a ColumnarHouseholds calculated by a worker at a time. Only their range is sent, and their taxes returned.
+DEFAULT_COLUMNAR_CHUNK_SIZE = 2**17
+
+# The TaxEngine of a worker process, created by _start_worker
+_engine = None
+
+# The ColumnarHouseholds a worker process has opened, by path
+_columnar = {}
+
+
+def _start_worker(warm):
+    # Runs once in each worker, so every chunk it calculates reuses brackets that are already resolved
+    global _engine
+    _engine = TaxEngine()
+    _engine.preload(warm)
+
+
+def _compute_chunk(start: int, records: list, tax_year, filing_status, state, state_data):
+    # The summaries before an invalid household are still returned, alongside its error
+    summaries = []
+    try:
+        summaries.extend(_engine.compute_many(records, tax_year=tax_year, filing_status=filing_status, state=state, state_data=state_data))
+    except Exception as e:
+        return start, summaries, e
+    return start, summaries, None
+
+
+def _compute_columnar_chunk(path: str, start: int, stop: int):
+    # Each worker maps the directory once, and reads its pages from the page cache every process shares
+    from ..files.ColumnarHouseholds import ColumnarHouseholds
+    households = _columnar.get(path)
+    if households is None:
+        households = _columnar[path] = ColumnarHouseholds(path)
+    return households.compute(_engine, start, stop)
+
+
+class ParallelTaxEngine:
+
+    """
+    Calculates the taxes of many households across worker processes, reporting each exactly as TaxEngine.compute_many would.
+
+    Records are sent to the workers in chunks, and only a few chunks per worker are in flight at once, so a stream of
+    households is calculated in bounded memory. Each worker resolves the tax brackets once, when it starts.
+    """
+
+    def __init__(self, max_workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, warm = None, mp_context = None):
+        """Create a ParallelTaxEngine object. Call shutdown, or use it as a context manager, to stop its workers.
+
+        Keyword arguments:
+        max_workers: int - The number of worker processes. Defaults to the number of CPUs.
+        chunk_size: int - The number of households sent to a worker at a time
+        warm: iterable - The (tax_year, filing_status, state) combinations each worker resolves when it starts. Defaults to every supported combination.
+        mp_context: multiprocessing context - How the workers are started, as accepted by ProcessPoolExecutor
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, recieved: {chunk_size}")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(self.max_workers, mp_context=mp_context, initializer=_start_worker, initargs=(None if warm is None else list(warm),))
+        return
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        return False
+
+
+    def shutdown(self):
+        """Stops the worker processes, once they finish the chunks already sent to them."""
+        self._executor.shutdown(cancel_futures=True)
+        return
+
+
+    def compute_many(self, records, tax_year: int | None = None, filing_status: str | None = None, state: str | None = None, state_data = None, ordered: bool = True):
+        """Returns a generator of the summary_json of each household, as TaxHandler.compute_many documents.
+
+        An invalid household, or an error reading records, is raised once every household before it has been returned,
+        as compute_many would. Unordered, households after it whose chunks had already finished may be returned too.
+
+        Keyword arguments:
+        records: iterable - Each household, either as its incomes_adjustments_and_deductions list, or as a dict of TaxHandler arguments
+        tax_year: int - The year for tax filling of every household that does not give its own
+        filing_status: str - The type of filling of every household that does not give its own
+        state: str - The state of every household that does not give its own
+        state_data: dict - information relevant to the state of every household that does not give its own
+        ordered: bool - Whether to return the summaries in the order of the records. Otherwise (index, summary) is
+         returned for each household as soon as its chunk finishes, where index is the household's position in records.
+        """
+        records = iter(records)
+        arguments = (tax_year, filing_status, state, state_data)
+        # A couple of chunks per worker, so no worker waits on the next chunk to be pickled
+        window = 2 * self.max_workers
+        # Each chunk's future, in the order of the records, with the start of its chunk
+        pending = deque() if ordered else {}
+        start = 0
+        # The first error, either reading the records or from a chunk, as (start of its chunk, error).
+        # Once there is one no more chunks are sent, and it is raised once the chunks before it are returned.
+        failure = None
+
+        def submit():
+            nonlocal start, failure
+            if failure is not None:
+                return False
+            chunk = []
+            try:
+                chunk.extend(islice(records, self.chunk_size))
+            except Exception as e:
+                # The households read before the error are still calculated
+                failure = (start + len(chunk), e)
+            if not chunk:
+                return False
+            future = self._executor.submit(_compute_chunk, start, chunk, *arguments)
+            if ordered:
+                pending.append(future)
+            else:
+                pending[future] = start
+            start += len(chunk)
+            return True
+
+        def fail(chunk_start, error):
+            nonlocal failure
+            if failure is None or chunk_start < failure[0]:
+                failure = (chunk_start, error)
+            if not ordered:
+                # Chunks after the error are not needed, and those before it still are
+                for future, future_start in list(pending.items()):
+                    if future_start > chunk_start and future.cancel():
+                        del pending[future]
+
+        try:
+            while len(pending) < window and submit():
+                pass
+            while pending:
+                if ordered:
+                    _, summaries, error = pending.popleft().result()
+                    submit()
+                    yield from summaries
+                    if error is not None:
+                        raise error
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    # Every finished chunk is returned, even when another in the same set failed
+                    for future in done:
+                        del pending[future]
+                        chunk_start, summaries, error = future.result()
+                        yield from enumerate(summaries, chunk_start)
+                        if error is not None:
+                            fail(chunk_start, error)
+                    while len(pending) < window and submit():
+                        pass
+            if failure is not None:
+                raise failure[1]
+        finally:
+            # Stops chunks nobody will read, should the caller stop early or a chunk fail
+            for future in pending:
+                future.cancel()
+
+
+    def compute_columnar(self, path: str, chunk_size: int = DEFAULT_COLUMNAR_CHUNK_SIZE):
+        """Returns a generator of (start, taxes) for each chunk of the households of a ColumnarHouseholds directory, in order.
+
+        taxes is the dict ColumnarHouseholds.compute returns for households start to start + chunk_size. Only the
+        path and range are sent to each worker, which maps the directory itself.
+
+        Keyword arguments:
+        path: str - The ColumnarHouseholds directory
+        chunk_size: int - The number of households each worker calculates at a time
+        """
+        from ..files.ColumnarHouseholds import ColumnarHouseholds
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, recieved: {chunk_size}")
+
+        starts = iter(range(0, len(ColumnarHouseholds(path)), chunk_size))
+        pending = deque()
+
+        def submit():
+            start = next(starts, None)
+            if start is None:
+                return False
+            pending.append((start, self._executor.submit(_compute_columnar_chunk, path, start, start + chunk_size)))
+            return True
+
+        try:
+            while len(pending) < 2 * self.max_workers and submit():
+                pass
+            while pending:
+                start, future = pending.popleft()
+                taxes = future.result()
+                submit()
+                yield start, taxes
+        finally:
+            for _, future in pending:
+                future.cancel()
@@ -1,8 +1,9 @@
 
 # Local Imports
-from ..utils.Logger import logger
+from ..utils.Logger import get_logger
 from ..utils.Constants import *
 from ..base.Tax import Tax
+from .RegionalTaxResult import RegionalTaxResult
 
 
 # Each handler can have its own AGI / MAGI
@@ -66,35 +67,48 @@ class RegionalTaxHandlerBase(metaclass=ForceRequiredAttributeDefinitionMeta):
         elif self.filing_status == MARRIED_FILING_JOINTLY and len(self.long_term_capital_gains) != 1:
             raise ValueError(f"Unsupported number of long_term_capital_gains for MARRIED_FILING_JOINTLY. Got '{len(self.long_term_capital_gains)}', expected: '1'")        
         elif self.filing_status in {MARRIED_FILING_JOINTLY, MARRIED_FILING_SEPARATELY}:
-            self.income_tax_owed = []
-            self.long_term_capital_gains_tax_owed = []
-            for i, ltcg in zip(self.taxable_incomes, self.long_term_capital_gains):
-                self.income_tax_owed.append(self.income_tax_brackets.calculate_taxes(i))
-                # LTCG's tax brackets include the addition of taxable income plus long term capital gains.
-                # Income is only used to offset the tax brackets used for computing LTCG. This is achieved
-                # by introducing a "basis".
-                ltcg_basis = self.long_term_capital_gains_tax_brackets.calculate_taxes(i)
-                ltcg_tax = self.long_term_capital_gains_tax_brackets.calculate_taxes(i + ltcg)
-                self.long_term_capital_gains_tax_owed.append(ltcg_tax - ltcg_basis)
+            self._calculate_taxes_and_marginal_rates()
         elif self.filing_status == SINGLE:
-            self.income_tax_owed = []
-            self.long_term_capital_gains_tax_owed = []
-            for i, ltcg in zip(self.taxable_incomes, self.long_term_capital_gains):
-                self.income_tax_owed.append(self.income_tax_brackets.calculate_taxes(i))
-                # LTCG's tax brackets include the addition of taxable income plus long term capital gains.
-                # Income is only used to offset the tax brackets used for computing LTCG. This is achieved
-                # by introducing a "basis".
-                ltcg_basis = self.long_term_capital_gains_tax_brackets.calculate_taxes(i)
-                ltcg_tax = self.long_term_capital_gains_tax_brackets.calculate_taxes(i + ltcg)
-                self.long_term_capital_gains_tax_owed.append(ltcg_tax - ltcg_basis)
+            self._calculate_taxes_and_marginal_rates()
         else:
             raise Exception(f"Unexpected filing_status {self.filing_status}")
         return
     
 
+    def _calculate_taxes_and_marginal_rates(self):
+        self.income_tax_owed, self.long_term_capital_gains_tax_owed = self.taxes_owed(
+            self.income_tax_brackets, self.long_term_capital_gains_tax_brackets, self.taxable_incomes, self.long_term_capital_gains)
+        self.income_marginal_rates = [self.income_tax_brackets.marginal_rate(i) for i in self.taxable_incomes]
+        self.long_term_capital_gains_marginal_rates = [self.long_term_capital_gains_tax_brackets.marginal_rate(i + ltcg)
+            for i, ltcg in zip(self.taxable_incomes, self.long_term_capital_gains)]
+        return
+
+
+    @staticmethod
+    def taxes_owed(income_tax_brackets: Tax, long_term_capital_gains_tax_brackets: Tax, taxable_incomes: list, long_term_capital_gains: list):
+        """Returns the income tax and long term capital gains tax owed by each person, as lists.
+
+        The one calculation of a region's taxes, shared by calculate_taxes and TaxEngine.
+
+        Keyword arguments:
+        income_tax_brackets: Tax - The region's income tax
+        long_term_capital_gains_tax_brackets: Tax - The region's long term capital gains tax
+        taxable_incomes: list[float] - The taxable income of each person
+        long_term_capital_gains: list[float] - The long term capital gains of each person
+        """
+        income_tax_owed = [income_tax_brackets.calculate_taxes(i) for i in taxable_incomes]
+        # LTCG's tax brackets include the addition of taxable income plus long term capital gains.
+        # Income is only used to offset the tax brackets used for computing LTCG, so the gains are
+        # taxed as a slice stacked on top of the taxable income.
+        long_term_capital_gains_tax_owed = [long_term_capital_gains_tax_brackets.calculate_taxes_on_slice(i, i + ltcg)
+            for i, ltcg in zip(taxable_incomes, long_term_capital_gains)]
+        return income_tax_owed, long_term_capital_gains_tax_owed
+
+
     def display_tax_summary(self):
 
         try:
+            logger = get_logger()
             logger.info(f'{self.region} Tax Summary')
             logger.info(f'{self.region} Taxable Incomes: {", ".join([f"${i:,.0f}" for i in self.taxable_incomes])}')
             logger.info(f'{self.region} Long term capital gains: {", ".join([f"${i:,.0f}" for i in self.long_term_capital_gains])}')
@@ -105,14 +119,14 @@ class RegionalTaxHandlerBase(metaclass=ForceRequiredAttributeDefinitionMeta):
         return
 
 
-    def summary_json(self):
-
+    def result(self):
+        """Returns the calculated taxes as an immutable RegionalTaxResult, which shares none of the handler's lists."""
         try:
-            return {
-                    'taxable_incomes': self.taxable_incomes,
-                    'long_term_capital_gains': self.long_term_capital_gains,
-                    'income_tax_owed': self.income_tax_owed,
-                    'long_term_capital_gains_tax_owed': self.long_term_capital_gains_tax_owed
-                }
+            return RegionalTaxResult(self.taxable_incomes, self.long_term_capital_gains, self.income_tax_owed, self.long_term_capital_gains_tax_owed)
         except AttributeError as e:
             raise AttributeError(f"{e}. Ensure you call 'calculate_taxes' before attempting to call this method.")
+
+
+    def summary_json(self):
+        # Fresh lists, so changing the summary cannot change the handler
+        return self.result().to_dict()
@@ -0,0 +1,45 @@
+# Local Imports
+from .TaxResultBase import TaxResultBase
+
+
+class RegionalTaxResult(TaxResultBase):
+
+    """
+    The taxes of a RegionalTaxHandlerBase, such as the federal or a state's taxes, with one entry per person.
+
+    Each field is a tuple, returned as-is by its accessor, so reading a result never copies it.
+    """
+
+    FIELDS = ("taxable_incomes", "long_term_capital_gains", "income_tax_owed", "long_term_capital_gains_tax_owed")
+    __slots__ = FIELDS
+
+    def __init__(self, taxable_incomes: tuple, long_term_capital_gains: tuple, income_tax_owed: tuple, long_term_capital_gains_tax_owed: tuple):
+        """Create a RegionalTaxResult object.
+
+        Keyword arguments:
+        taxable_incomes -- The taxable income of each person
+        long_term_capital_gains -- The long term capital gains of each person
+        income_tax_owed -- The income tax owed by each person
+        long_term_capital_gains_tax_owed -- The long term capital gains tax owed by each person
+        """
+        # Slots are set through object, as this class refuses every other assignment
+        object.__setattr__(self, "taxable_incomes", tuple(taxable_incomes))
+        object.__setattr__(self, "long_term_capital_gains", tuple(long_term_capital_gains))
+        object.__setattr__(self, "income_tax_owed", tuple(income_tax_owed))
+        object.__setattr__(self, "long_term_capital_gains_tax_owed", tuple(long_term_capital_gains_tax_owed))
+        return
+
+
+    def to_dict(self):
+        """Returns the same dict as RegionalTaxHandlerBase.summary_json, with fresh lists the caller may change."""
+        return {
+            'taxable_incomes': list(self.taxable_incomes),
+            'long_term_capital_gains': list(self.long_term_capital_gains),
+            'income_tax_owed': list(self.income_tax_owed),
+            'long_term_capital_gains_tax_owed': list(self.long_term_capital_gains_tax_owed),
+        }
+
+
+    def to_tuple(self):
+        """Returns the fields as a tuple, in the order of FIELDS."""
+        return (self.taxable_incomes, self.long_term_capital_gains, self.income_tax_owed, self.long_term_capital_gains_tax_owed)
@@ -2,8 +2,7 @@
 from . import RegionalTaxHandlerBase
 from ..utils.InputValidator import InputValidator
 from ..income.FederalIncomeHandler import FederalIncomeHandler
-from ..base import FlatTax
-from ..base import FlatTaxBracket
+from ..brackets.BracketRegistry import registry, flat
 
 
 # Each handler can have its own AGI / MAGI
@@ -28,7 +27,7 @@ class StateWithoutTaxHandler(RegionalTaxHandlerBase.RegionalTaxHandlerBase):
         self.region = state
         self.taxable_incomes = [0 for _ in federal_income_handlers]
         self.long_term_capital_gains = [0 for _ in federal_income_handlers]
-        self.income_tax_brackets =  FlatTax.FlatTax(FlatTaxBracket.FlatTaxBracket(0.0)) # Zero Income Tax
-        self.long_term_capital_gains_tax_brackets = FlatTax.FlatTax(FlatTaxBracket.FlatTaxBracket(0.0)) # Zero Capital Gains Tax
+        self.income_tax_brackets = registry.intern(flat(0.0)) # Zero Income Tax
+        self.long_term_capital_gains_tax_brackets = registry.intern(flat(0.0)) # Zero Capital Gains Tax
         return
     
\ No newline at end of file
@@ -0,0 +1,467 @@
+# Standard Library Imports
+import itertools
+
+# Local Imports
+from ..brackets import FederalIncomeTaxBrackets
+from ..brackets import FederalLongTermCapitalGainsTaxBrackets
+from ..brackets import SocialSecurityIncomeTaxBrackets
+from ..brackets import MedicareIncomeTaxBrackets
+from ..brackets.states import GeorgiaStateIncomeTaxBrackets
+from ..brackets.states import GeorgiaStateLongTermCapitalGainsTaxBrackets
+from ..brackets.BracketRegistry import registry, flat
+from ..income.FederalIncomeBatch import FederalIncomeBatch
+from ..income.FederalIncomeHandler import FederalIncomeHandler
+from ..utils.InputValidator import InputValidator
+from ..utils.OptionalDependencies import import_numpy
+from ..utils.Constants import *
+from .IndividualIncomeTaxHandlerBase import IndividualIncomeTaxHandlerBase
+from .NetInvestmentIncomeTaxHandler import NetInvestmentIncomeTaxHandler
+from .RegionalTaxHandlerBase import RegionalTaxHandlerBase
+from .states.GeorgiaTaxHandler import GeorgiaTaxHandler
+from .TaxHandler import TaxHandler
+from .TaxResult import TaxResult
+from .RegionalTaxResult import RegionalTaxResult
+from .IndividualTaxResult import IndividualTaxResult
+
+
+# The keys a household record can have, when given as a dict
+RECORD_KEYS = {"tax_year", "filing_status", "state", "state_data", "incomes_adjustments_and_deductions"}
+
+# The fields of one person's dict of incomes_adjustments_and_deductions that compute_batch takes as columns
+PERSON_FIELDS = ("dependents", "use_standard_deduction") + FederalIncomeBatch.COLUMN_FIELDS
+
+# The household arguments a sweep axis can vary, each calculated by its own compute_batch rather than as a column
+SWEEP_HOUSEHOLD_KEYS = ("tax_year", "filing_status", "state")
+
+# The exemptions compute_batch takes for a household whose state_data does not give them. Every other value, negative
+# ones included, is passed to the state's deduction as TaxHandler would pass it.
+EXEMPTIONS_NOT_GIVEN = -2**15
+
+# The taxes compute_batch returns for each household, each summed over the household's people
+BATCH_COLUMNS = (
+    "federal_income_tax_owed",
+    "federal_long_term_capital_gains_tax_owed",
+    "state_income_tax_owed",
+    "state_long_term_capital_gains_tax_owed",
+    "social_security_tax_owed",
+    "medicare_tax_owed",
+    "niit_owed",
+    "total_tax_owed",
+)
+
+
+class TaxEngine:
+
+    """
+    Calculates the taxes of many households, reporting each exactly as TaxHandler.summary_json would.
+
+    The tax brackets of each (tax_year, filing_status, state) are validated and resolved once, then reused for every
+    household that shares them. No handler objects are kept per household, so a stream of households is calculated in
+    constant memory.
+    """
+
+    def __init__(self):
+        """Create a TaxEngine object."""
+        self._brackets = {}
+        return
+
+
+    def preload(self, combinations = None):
+        """Resolves the brackets of each (tax_year, filing_status, state) now, rather than for the first household that needs them.
+
+        Keyword arguments:
+        combinations: iterable - (tax_year, filing_status, state) tuples. Defaults to every supported combination.
+         Unsupported combinations are skipped, and reported by the households that use them.
+        """
+        if combinations is None:
+            combinations = [(tax_year, filing_status, state)
+                for tax_year in sorted(SUPPORTED_TAX_YEARS)
+                for filing_status in sorted(SUPPORTED_FILING_STATUSES)
+                for state in sorted(SUPPORTED_STATES)]
+        for tax_year, filing_status, state in combinations:
+            if (tax_year, filing_status, state) not in self._brackets:
+                try:
+                    self._resolve(tax_year, filing_status, state)
+                except ValueError:
+                    pass
+        return
+
+
+    def compute(self, incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+        """Returns the summary_json of a TaxHandler built from the same arguments.
+
+        Keyword arguments:
+        incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+        tax_year: int - The year for tax filling.
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+        state: str - The state that you will be filing.
+        state_data: dict - information relevant to the selected state
+        """
+        taxable_incomes, long_term_capital_gains, federal_tax_owed, federal_long_term_capital_gains_tax_owed, \
+            wages, social_security_tax_owed, medicare_tax_owed, \
+            state_taxable_incomes, state_long_term_capital_gains, state_tax_owed, state_long_term_capital_gains_tax_owed, \
+            niit_incomes, niit_tax_owed, total_tax_owed = self._calculate(incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data)
+        return {
+            'federal': {
+                'taxable_incomes': taxable_incomes,
+                'long_term_capital_gains': long_term_capital_gains,
+                'income_tax_owed': federal_tax_owed,
+                'long_term_capital_gains_tax_owed': federal_long_term_capital_gains_tax_owed,
+            },
+            'social_security': {'taxable_incomes': wages, 'income_tax_owed': social_security_tax_owed},
+            # Its own list of wages, as in a TaxHandler's summary
+            'medicare': {'taxable_incomes': list(wages), 'income_tax_owed': medicare_tax_owed},
+            'state': {
+                'taxable_incomes': state_taxable_incomes,
+                'long_term_capital_gains': state_long_term_capital_gains,
+                'income_tax_owed': state_tax_owed,
+                'long_term_capital_gains_tax_owed': state_long_term_capital_gains_tax_owed,
+            },
+            'niit': {'taxable_incomes': niit_incomes, 'income_tax_owed': niit_tax_owed},
+            'total_tax_owed': total_tax_owed,
+        }
+
+
+    def result(self, incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+        """Returns the TaxResult of a household, holding the same taxes as compute returns.
+
+        The TaxResult is built straight from the calculated taxes, with no summary dict and no tax handlers in between.
+        Nothing is mutated but the engine's cache of resolved brackets, whose entries are only ever added, so one
+        engine can be shared by many threads.
+
+        Keyword arguments:
+        incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+        tax_year: int - The year for tax filling.
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+        state: str - The state that you will be filing.
+        state_data: dict - information relevant to the selected state
+        """
+        taxable_incomes, long_term_capital_gains, federal_tax_owed, federal_long_term_capital_gains_tax_owed, \
+            wages, social_security_tax_owed, medicare_tax_owed, \
+            state_taxable_incomes, state_long_term_capital_gains, state_tax_owed, state_long_term_capital_gains_tax_owed, \
+            niit_incomes, niit_tax_owed, total_tax_owed = self._calculate(incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data)
+        return TaxResult(
+            RegionalTaxResult(taxable_incomes, long_term_capital_gains, federal_tax_owed, federal_long_term_capital_gains_tax_owed),
+            IndividualTaxResult(wages, social_security_tax_owed),
+            IndividualTaxResult(wages, medicare_tax_owed),
+            RegionalTaxResult(state_taxable_incomes, state_long_term_capital_gains, state_tax_owed, state_long_term_capital_gains_tax_owed),
+            IndividualTaxResult(niit_incomes, niit_tax_owed),
+            total_tax_owed,
+        )
+
+
+    def compute_many(self, records, tax_year: int | None = None, filing_status: str | None = None, state: str | None = None, state_data = None):
+        """Returns a generator of the summary_json of each household, as TaxHandler.compute_many documents."""
+        return self._calculate_many(self.compute, records, tax_year, filing_status, state, state_data)
+
+
+    def result_many(self, records, tax_year: int | None = None, filing_status: str | None = None, state: str | None = None, state_data = None):
+        """Returns a generator of the TaxResult of each household, taking records as TaxHandler.compute_many documents.
+
+        TaxResults are far smaller than summary dicts, so a batch can keep them and convert them only where they leave the program.
+        """
+        return self._calculate_many(self.result, records, tax_year, filing_status, state, state_data)
+
+
+    def compute_batch(self, tax_year: int, filing_status: str, state: str, household = None, exemptions = None, dependents = 0, use_standard_deduction = True, **columns):
+        """Returns the taxes of a batch of households held as columns, as a dict of BATCH_COLUMNS to an ndarray with one value per household.
+
+        Each row is one person, as one dict of incomes_adjustments_and_deductions would be. Every household in the batch
+        shares the tax_year, filing_status and state, so their brackets are resolved once and each tax is calculated over
+        whole columns. The columns are only read, so they can be views of a memory-mapped file. Each tax matches the sum
+        of the same tax in compute's summary, to within floating point rounding.
+
+        Keyword arguments:
+        tax_year: int - The year for tax filling of every household
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc) of every household
+        state: str - The state of every household
+        household: array-like - The household number of each row, never decreasing. Rows with the same number are one household. Defaults to a household per row.
+        exemptions: int or array-like - The state_data exemptions of each household, read from its first row. EXEMPTIONS_NOT_GIVEN where not given, the default.
+        dependents: int or array-like - The number of dependents of each row
+        use_standard_deduction: bool or array-like - Whether each row takes the standard deduction
+        columns: array-like - A column for any of the FederalIncomeHandler income, adjustment and deduction fields. Omitted fields are 0.
+        """
+        np = import_numpy()
+        brackets = self._brackets.get((tax_year, filing_status, state))
+        if brackets is None:
+            brackets = self._resolve(tax_year, filing_status, state)
+        federal_brackets, federal_long_term_capital_gains_brackets, state_brackets, state_long_term_capital_gains_brackets, \
+            social_security_brackets, medicare_brackets, niit_brackets = brackets
+
+        for key in columns:
+            if key not in FederalIncomeBatch.COLUMN_FIELDS:
+                raise ValueError(f"Unsupported income for key {key}")
+        columns = {key: np.asarray(column) for key, column in columns.items()}
+        dependents = np.asarray(dependents)
+        use_standard_deduction = np.asarray(use_standard_deduction, dtype=bool)
+        shape = np.broadcast_shapes(np.shape(household), np.shape(exemptions), dependents.shape, use_standard_deduction.shape, *(column.shape for column in columns.values()))
+        if len(shape) > 1:
+            raise ValueError(f"columns must be one-dimensional, recieved shape: {shape}")
+        rows = shape[0] if shape else 1
+        if rows == 0:
+            return {name: np.zeros(0) for name in BATCH_COLUMNS}
+
+        # The first row of each household, and its number of people
+        if household is None:
+            starts = np.arange(rows)
+        else:
+            household = np.asarray(household)
+            if np.any(household[1:] < household[:-1]):
+                raise ValueError("household must never decrease, so the rows of a household are together")
+            starts = np.concatenate(([0], np.flatnonzero(household[1:] != household[:-1]) + 1))
+        people = np.diff(np.append(starts, rows))
+
+        def full(column):
+            return np.broadcast_to(column, (rows,))
+
+        if filing_status == MARRIED_FILING_JOINTLY:
+            # Both earners' incomes are combined into one, as TaxHandler combines them
+            if people.max() > 2:
+                raise ValueError(f"Unsupported number of incomes for MARRIED_FILING_JOINTLY. Got '{people.max()}', expected: '1' or '2'")
+            for name, column in [("dependents", full(dependents)), ("use_standard_deduction", full(use_standard_deduction))]:
+                differs = np.minimum.reduceat(column, starts) != np.maximum.reduceat(column, starts)
+                if differs.any():
+                    raise ValueError(f"Cannot have differing {name} when filing status is {MARRIED_FILING_JOINTLY}, as in household {int(np.argmax(differs))} of the batch")
+            unit_starts = np.arange(len(starts))
+            units_per_household = np.ones(len(starts), dtype=int)
+            incomes = FederalIncomeBatch(filing_status, tax_year, full(dependents)[starts], full(use_standard_deduction)[starts],
+                **{key: np.add.reduceat(full(column).astype(float, copy=False), starts) for key, column in columns.items()})
+        else:
+            unit_starts = starts
+            units_per_household = people
+            incomes = FederalIncomeBatch(filing_status, tax_year, full(dependents), full(use_standard_deduction), **{key: full(column) for key, column in columns.items()})
+
+        taxable_incomes = incomes.taxable_income
+        long_term_capital_gains = incomes.long_term_capital_gains
+        if state == GEORGIA:
+            # The state of Georgia treats long term capital gains as taxable income. Its deduction is looked up, and
+            # validated, by GeorgiaTaxHandler once for each distinct number of exemptions in the batch.
+            exemptions = full(np.asarray(EXEMPTIONS_NOT_GIVEN if exemptions is None else exemptions))[starts]
+            distinct, household_exemptions = np.unique(exemptions, return_inverse=True)
+            deductions = np.array([GeorgiaTaxHandler._get_deduction(tax_year, None if value == EXEMPTIONS_NOT_GIVEN else {"exemptions": value})
+                for value in distinct.tolist()], dtype=float)[household_exemptions.reshape(-1)]
+            deduction_per_income = np.repeat(deductions / units_per_household, units_per_household)
+            state_taxable_incomes = (taxable_incomes + long_term_capital_gains) - deduction_per_income
+        else:
+            state_taxable_incomes = np.zeros(len(taxable_incomes))
+        wages = full(columns.get("salaries_and_wages", np.zeros(1)).astype(float, copy=False))
+
+        taxes = {
+            "federal_income_tax_owed": np.add.reduceat(federal_brackets.calculate_taxes_batch(taxable_incomes), unit_starts),
+            "federal_long_term_capital_gains_tax_owed": np.add.reduceat(federal_long_term_capital_gains_brackets.calculate_taxes_on_slice_batch(
+                taxable_incomes, taxable_incomes + long_term_capital_gains), unit_starts),
+            "state_income_tax_owed": np.add.reduceat(state_brackets.calculate_taxes_batch(state_taxable_incomes), unit_starts),
+            # No state taxes gains apart from its income, so each slice is empty, as in compute
+            "state_long_term_capital_gains_tax_owed": np.add.reduceat(state_long_term_capital_gains_brackets.calculate_taxes_on_slice_batch(
+                state_taxable_incomes, state_taxable_incomes), unit_starts),
+            "social_security_tax_owed": np.add.reduceat(social_security_brackets.calculate_taxes_batch(wages), starts),
+            "medicare_tax_owed": np.add.reduceat(medicare_brackets.calculate_taxes_batch(wages), starts),
+            "niit_owed": np.add.reduceat(niit_brackets.calculate_taxes_batch(incomes.niit_income), unit_starts),
+        }
+        # Added in the same order compute adds them
+        total_tax_owed = np.zeros(len(starts))
+        for name in BATCH_COLUMNS[:-1]:
+            total_tax_owed += taxes[name]
+        taxes["total_tax_owed"] = total_tax_owed
+        return taxes
+
+
+    def sweep(self, incomes_adjustments_and_deductions: list[dict], axes: dict, tax_year: int, filing_status: str, state: str, state_data = None):
+        """Returns the taxes of a household over a grid of changes to its inputs, as a dict of BATCH_COLUMNS to an ndarray with one axis per sweep axis.
+
+        Each point of the grid is the household with one value from each axis in place of its own, so the result at
+        [i, j] has the i-th value of the first axis and the j-th of the second. Every point of a tax_year, filing_status
+        and state is one row of a single compute_batch, which resolves the brackets and Georgia's deduction once for all of
+        them. Only the swept fields are held per point; a field every person shares is broadcast from its one value,
+        and is only repeated for each point when the people's values differ.
+
+        Keyword arguments:
+        incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in the household, as compute takes it.
+        axes: dict - The values to sweep each input over, in the order of the result's axes. A key is one of:
+         a field of the first person's dict, such as "ira_deductions";
+         (person, field) for a field of any person's dict;
+         ("state_data", "exemptions") for the exemptions of state_data;
+         or any of "tax_year", "filing_status" and "state".
+        tax_year: int - The year for tax filling, unless swept.
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc), unless swept.
+        state: str - The state that you will be filing, unless swept.
+        state_data: dict - information relevant to the selected state
+        """
+        np = import_numpy()
+        people = len(incomes_adjustments_and_deductions)
+        if people == 0:
+            raise ValueError("incomes_adjustments_and_deductions must have at least one person")
+        for person in incomes_adjustments_and_deductions:
+            for key in person:
+                if key not in PERSON_FIELDS:
+                    raise ValueError(f"Unsupported income for key {key}")
+
+        # Each axis as (position, key), split into those calculated as columns and those looped over
+        household_axes, column_axes = [], []
+        values = []
+        for position, (key, axis) in enumerate(axes.items()):
+            if key in SWEEP_HOUSEHOLD_KEYS:
+                axis = list(axis)
+                household_axes.append((position, key))
+            else:
+                if isinstance(key, str):
+                    key = (0, key)
+                if key != ("state_data", "exemptions") and not (isinstance(key, tuple) and len(key) == 2 and key[0] in range(people) and key[1] in PERSON_FIELDS):
+                    raise ValueError(f"Unsupported sweep axis {key!r}, expected a field of a person's incomes_adjustments_and_deductions, "
+                        f"(person, field), ('state_data', 'exemptions') or any of: {list(SWEEP_HOUSEHOLD_KEYS)}")
+                if key in (swept for _, swept in column_axes):
+                    raise ValueError(f"Axis {key!r} is given more than once")
+                axis = np.asarray(axis)
+                if axis.ndim != 1:
+                    raise ValueError(f"The values of axis {key!r} must be one-dimensional, recieved shape: {axis.shape}")
+                column_axes.append((position, key))
+            values.append(axis)
+        shape = tuple(len(axis) for axis in values)
+        column_shape = tuple(shape[position] for position, _ in column_axes)
+        points = int(np.prod(column_shape, dtype=int))
+
+        # The grid as one household of the same people per point, each person a row
+        def grid(position):
+            # The values of an axis at every point of the column grid
+            index = [None] * len(column_shape)
+            index[[p for p, _ in column_axes].index(position)] = slice(None)
+            return np.broadcast_to(values[position][tuple(index)], column_shape).reshape(-1)
+
+        columns = {}
+        fields = {field for person in incomes_adjustments_and_deductions for field in person} | {key[1] for _, key in column_axes if key[0] != "state_data"}
+        for field in fields:
+            default = FederalIncomeHandler.SCHEMA.defaults[field]
+            base = [person.get(field, default) for person in incomes_adjustments_and_deductions]
+            swept = {key[0]: grid(position) for position, key in column_axes if key[1] == field and key[0] != "state_data"}
+            if not swept:
+                if len(set(base)) == 1:
+                    # A read-only view of the one value, which compute_batch only reads
+                    columns[field] = np.broadcast_to(np.asarray(base[0]), (points * people,))
+                else:
+                    columns[field] = np.tile(np.asarray(base), points)
+                continue
+            column = np.empty((points, people), dtype=np.result_type(np.asarray(base), *swept.values()))
+            column[:] = base
+            for person, axis in swept.items():
+                column[:, person] = axis
+            columns[field] = column.reshape(-1)
+        exemptions = (state_data or {}).get("exemptions")
+        exemptions = EXEMPTIONS_NOT_GIVEN if exemptions is None else exemptions
+        for position, key in column_axes:
+            if key == ("state_data", "exemptions"):
+                exemptions = np.repeat(grid(position), people)
+        household = np.repeat(np.arange(points), people)
+
+        taxes = {name: np.zeros(shape) for name in BATCH_COLUMNS}
+        arguments = {"tax_year": tax_year, "filing_status": filing_status, "state": state}
+        for chosen in itertools.product(*(enumerate(values[position]) for position, _ in household_axes)):
+            index = [slice(None)] * len(shape)
+            for (position, key), (value_index, value) in zip(household_axes, chosen):
+                index[position] = value_index
+                arguments[key] = value
+            batch_taxes = self.compute_batch(arguments["tax_year"], arguments["filing_status"], arguments["state"],
+                household=household, exemptions=exemptions, **columns)
+            for name in BATCH_COLUMNS:
+                taxes[name][tuple(index)] = batch_taxes[name].reshape(column_shape)
+        return taxes
+
+
+    def _calculate(self, incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data):
+        # Every income and tax of a household as lists, which compute and result arrange into what they return
+        brackets = self._brackets.get((tax_year, filing_status, state))
+        if brackets is None:
+            brackets = self._resolve(tax_year, filing_status, state)
+        federal_brackets, federal_long_term_capital_gains_brackets, state_brackets, state_long_term_capital_gains_brackets, \
+            social_security_brackets, medicare_brackets, niit_brackets = brackets
+        InputValidator.validate_household(incomes_adjustments_and_deductions, state_data)
+
+        federal_income_handlers = TaxHandler.federal_income_handlers_for(tax_year, filing_status, incomes_adjustments_and_deductions)
+        payroll_income_handlers = TaxHandler.payroll_income_handlers_for(incomes_adjustments_and_deductions)
+        if filing_status == MARRIED_FILING_JOINTLY and len(federal_income_handlers) != 1:
+            raise ValueError(f"Unsupported number of incomes for MARRIED_FILING_JOINTLY. Got '{len(federal_income_handlers)}', expected: '1'")
+
+        # The same incomes, and the same calculations, as each handler of a TaxHandler
+        taxable_incomes = [f.taxable_income for f in federal_income_handlers]
+        long_term_capital_gains = [f.long_term_capital_gains for f in federal_income_handlers]
+        if state == GEORGIA:
+            state_taxable_incomes = GeorgiaTaxHandler.taxable_incomes_for(tax_year, federal_income_handlers, state_data)
+        else:
+            state_taxable_incomes = [0 for _ in federal_income_handlers]
+        state_long_term_capital_gains = [0 for _ in federal_income_handlers]
+        wages = [f.salaries_and_wages for f in payroll_income_handlers]
+        niit_incomes = [f.niit_income for f in federal_income_handlers]
+
+        federal_tax_owed, federal_long_term_capital_gains_tax_owed = RegionalTaxHandlerBase.taxes_owed(
+            federal_brackets, federal_long_term_capital_gains_brackets, taxable_incomes, long_term_capital_gains)
+        state_tax_owed, state_long_term_capital_gains_tax_owed = RegionalTaxHandlerBase.taxes_owed(
+            state_brackets, state_long_term_capital_gains_brackets, state_taxable_incomes, state_long_term_capital_gains)
+        social_security_tax_owed = IndividualIncomeTaxHandlerBase.taxes_owed(social_security_brackets, wages)
+        medicare_tax_owed = IndividualIncomeTaxHandlerBase.taxes_owed(medicare_brackets, wages)
+        niit_tax_owed = IndividualIncomeTaxHandlerBase.taxes_owed(niit_brackets, niit_incomes)
+        total_tax_owed = TaxHandler.total_tax_of(federal_tax_owed, federal_long_term_capital_gains_tax_owed, state_tax_owed,
+            state_long_term_capital_gains_tax_owed, social_security_tax_owed, medicare_tax_owed, niit_tax_owed)
+        return taxable_incomes, long_term_capital_gains, federal_tax_owed, federal_long_term_capital_gains_tax_owed, \
+            wages, social_security_tax_owed, medicare_tax_owed, \
+            state_taxable_incomes, state_long_term_capital_gains, state_tax_owed, state_long_term_capital_gains_tax_owed, \
+            niit_incomes, niit_tax_owed, total_tax_owed
+
+
+    @staticmethod
+    def _calculate_many(calculate, records, tax_year, filing_status, state, state_data):
+        for record in records:
+            if isinstance(record, dict):
+                for key in record:
+                    if key not in RECORD_KEYS:
+                        raise ValueError(f"Unsupported key {key}, expected any of: {InputValidator.alphabetize_set(RECORD_KEYS)}")
+                yield calculate(
+                    record["incomes_adjustments_and_deductions"],
+                    tax_year=record.get("tax_year", tax_year),
+                    filing_status=record.get("filing_status", filing_status),
+                    state=record.get("state", state),
+                    state_data=record.get("state_data", state_data),
+                )
+            else:
+                yield calculate(record, tax_year=tax_year, filing_status=filing_status, state=state, state_data=state_data)
+
+
+    def _resolve(self, tax_year: int, filing_status: str, state: str):
+        # Validates a (tax_year, filing_status, state) once, as TaxHandler and its handlers would, and looks up its brackets
+        InputValidator.validate_tax_year(tax_year)
+        InputValidator.validate_filing_status(filing_status)
+        InputValidator.validate_state(state)
+        TaxHandler.validate_state_is_supported(tax_year, filing_status, state)
+
+        if state == GEORGIA:
+            state_brackets = GeorgiaStateIncomeTaxBrackets.brackets[tax_year][filing_status]
+            state_long_term_capital_gains_brackets = GeorgiaStateLongTermCapitalGainsTaxBrackets.brackets[tax_year][filing_status]
+        else:
+            state_brackets = state_long_term_capital_gains_brackets = registry.intern(flat(0.0))
+
+        brackets = (
+            FederalIncomeTaxBrackets.brackets[tax_year][filing_status],
+            FederalLongTermCapitalGainsTaxBrackets.brackets[tax_year][filing_status],
+            state_brackets,
+            state_long_term_capital_gains_brackets,
+            IndividualIncomeTaxHandlerBase._get_tax_brackets(tax_year, SocialSecurityIncomeTaxBrackets.brackets),
+            IndividualIncomeTaxHandlerBase._get_tax_brackets(tax_year, MedicareIncomeTaxBrackets.brackets),
+            NetInvestmentIncomeTaxHandler._get_tax_brackets(tax_year, filing_status),
+        )
+        self._brackets[(tax_year, filing_status, state)] = brackets
+        return brackets
+
+
+# Shared by every caller of compute. Its brackets are read-only once resolved.
+_engine = TaxEngine()
+
+
+def compute(incomes_adjustments_and_deductions: list[dict], tax_year: int, filing_status: str, state: str, state_data = None):
+    """Returns the TaxResult of a household. Safe to call from many threads at once, see TaxEngine.result.
+
+    Keyword arguments:
+    incomes_adjustments_and_deductions: list[dict] - List of dicts of income for each person in a household.
+    tax_year: int - The year for tax filling.
+    filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+    state: str - The state that you will be filing.
+    state_data: dict - information relevant to the selected state
+    """
+    return _engine.result(incomes_adjustments_and_deductions, tax_year, filing_status, state, state_data)
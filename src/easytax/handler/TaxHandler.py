@@ -1,6 +1,10 @@
+# Standard Library Imports
+from functools import cached_property
+import itertools
+
 # Local Imports
 from ..utils.Constants import *
-from ..utils.Logger import logger
+from ..utils.Logger import get_logger
 from ..utils.InputValidator import InputValidator
 from ..income.FederalIncomeHandler import FederalIncomeHandler
 from ..income.PayrollTaxIncomeHandler import PayrollTaxIncomeHandler
@@ -10,6 +14,7 @@ from .SocialSecurityTaxHandler import SocialSecurityIndividualIncomeTaxHandler
 from .MedicareTaxHandler import MedicareIndividualIncomeTaxHandler
 from .StateWithoutTaxHandler import StateWithoutTaxHandler
 from .NetInvestmentIncomeTaxHandler import NetInvestmentIncomeTaxHandler
+from .TaxResult import TaxResult
 
 
 class TaxHandler:
@@ -29,10 +34,14 @@ class TaxHandler:
         InputValidator.validate_tax_year(tax_year)
         InputValidator.validate_filing_status(filing_status)
         InputValidator.validate_state(state)
+        InputValidator.validate_household(incomes_adjustments_and_deductions, state_data)
 
         self.tax_year = tax_year
         self.filing_status = filing_status
         self.state = state
+        self.incomes_adjustments_and_deductions = incomes_adjustments_and_deductions
+        self.state_data = state_data
+        self.validate_state_is_supported(self.tax_year, self.filing_status, self.state)
 
         # Used for federal taxes and state 
         self.make_federal_income_handlers(incomes_adjustments_and_deductions)
@@ -40,79 +49,166 @@ class TaxHandler:
         # Used for social security taxes and medicare taxes
         self.make_payroll_income_handlers(incomes_adjustments_and_deductions)
 
-        if self.state == "Georgia":
-            self.stateTaxHandler = GeorgiaTaxHandler(
-            tax_year=tax_year, 
-            filing_status=filing_status, 
-            federal_income_handlers=self.federal_income_handlers,
-            state_data = state_data,
-        )
-        elif self.state in STATES_WITHOUT_INCOME_TAX:
-            self.stateTaxHandler = StateWithoutTaxHandler(
-            tax_year=tax_year, 
-            filing_status=filing_status, 
+        # Each tax is calculated on first access to it, or to a result that needs it, and then cached
+        return
+
+
+    def __reduce__(self):
+        # Pickled as its arguments alone, rather than with every handler it has built, and recalculated on access
+        return (TaxHandler, (self.tax_year, self.filing_status, self.state, self.incomes_adjustments_and_deductions, self.state_data))
+
+
+    # The cached results, discarded by invalidate
+    _CACHED_RESULTS = (
+        "federalHander",
+        "stateTaxHandler",
+        "socialSecurityTaxHandler",
+        "medicareTaxHandler",
+        "netInvestmentIncomeTaxHandler",
+        "total_tax",
+        "_result",
+    )
+
+    def invalidate(self):
+        """Discards every calculated tax, so each is recalculated from the current inputs on next access.
+
+        Call this after changing any input, such as tax_year, state or incomes_adjustments_and_deductions.
+        """
+        InputValidator.validate_tax_year(self.tax_year)
+        InputValidator.validate_filing_status(self.filing_status)
+        InputValidator.validate_state(self.state)
+        InputValidator.validate_household(self.incomes_adjustments_and_deductions, self.state_data)
+        self.validate_state_is_supported(self.tax_year, self.filing_status, self.state)
+        self.make_federal_income_handlers(self.incomes_adjustments_and_deductions)
+        self.make_payroll_income_handlers(self.incomes_adjustments_and_deductions)
+        for name in self._CACHED_RESULTS:
+            self.__dict__.pop(name, None)
+        return
+
+
+    def calculate_taxes(self):
+        """Calculates every tax. Taxes that were already calculated are not calculated again."""
+        self.federalHander
+        self.stateTaxHandler
+        self.socialSecurityTaxHandler
+        self.medicareTaxHandler
+        self.netInvestmentIncomeTaxHandler
+        return
+    
+
+    def compute_total_tax(self):
+        self.total_tax
+        return
+
+
+    @cached_property
+    def federalHander(self):
+        federalHander = FederalTaxHandler(
+            tax_year=self.tax_year, 
+            filing_status=self.filing_status, 
             federal_income_handlers=self.federal_income_handlers,
-            state = self.state,
         )
+        federalHander.calculate_taxes()
+        return federalHander
+
+    @cached_property
+    def stateTaxHandler(self):
+        if self.state == GEORGIA:
+            stateTaxHandler = GeorgiaTaxHandler(
+                tax_year=self.tax_year, 
+                filing_status=self.filing_status, 
+                federal_income_handlers=self.federal_income_handlers,
+                state_data = self.state_data,
+            )
         else:
-            raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}, and state {self.state}")
-        
-        self.federalHander = FederalTaxHandler(
-            tax_year=tax_year, 
-            filing_status=filing_status, 
-            federal_income_handlers=self.federal_income_handlers,
-        )
-        self.socialSecurityTaxHandler = SocialSecurityIndividualIncomeTaxHandler(
-            tax_year=tax_year, 
+            stateTaxHandler = StateWithoutTaxHandler(
+                tax_year=self.tax_year, 
+                filing_status=self.filing_status, 
+                federal_income_handlers=self.federal_income_handlers,
+                state = self.state,
+            )
+        stateTaxHandler.calculate_taxes()
+        return stateTaxHandler
+
+    @cached_property
+    def socialSecurityTaxHandler(self):
+        socialSecurityTaxHandler = SocialSecurityIndividualIncomeTaxHandler(
+            tax_year=self.tax_year, 
             federal_income_handlers=self.payroll_income_handlers,
         )
-        self.medicareTaxHandler = MedicareIndividualIncomeTaxHandler(
-            tax_year=tax_year, 
+        socialSecurityTaxHandler.calculate_taxes()
+        return socialSecurityTaxHandler
+
+    @cached_property
+    def medicareTaxHandler(self):
+        medicareTaxHandler = MedicareIndividualIncomeTaxHandler(
+            tax_year=self.tax_year, 
             federal_income_handlers=self.payroll_income_handlers,
         )
-        self.netInvestmentIncomeTaxHandler = NetInvestmentIncomeTaxHandler(
-            tax_year=tax_year, 
-            filing_status=filing_status, 
+        medicareTaxHandler.calculate_taxes()
+        return medicareTaxHandler
+
+    @cached_property
+    def netInvestmentIncomeTaxHandler(self):
+        netInvestmentIncomeTaxHandler = NetInvestmentIncomeTaxHandler(
+            tax_year=self.tax_year, 
+            filing_status=self.filing_status, 
             federal_income_handlers=self.federal_income_handlers,
         )
-        self.calculate_taxes()
-        self.compute_total_tax()
+        netInvestmentIncomeTaxHandler.calculate_taxes()
+        return netInvestmentIncomeTaxHandler
 
-        return
-    
 
-    def calculate_taxes(self):
+    @property
+    def federal_tax_owed(self):
+        return self.federalHander.income_tax_owed
 
-        self.federalHander.calculate_taxes()
-        self.stateTaxHandler.calculate_taxes()
-        self.socialSecurityTaxHandler.calculate_taxes()
-        self.medicareTaxHandler.calculate_taxes()
-        self.netInvestmentIncomeTaxHandler.calculate_taxes()
-
-        self.federal_tax_owed = self.federalHander.income_tax_owed
-        self.federal_long_term_capital_gains_tax_owed = self.federalHander.long_term_capital_gains_tax_owed
-        self.state_tax_owed = self.stateTaxHandler.income_tax_owed
-        self.state_long_term_capital_gains_tax_owed = self.stateTaxHandler.long_term_capital_gains_tax_owed
-        self.social_security_tax_owed = self.socialSecurityTaxHandler.income_tax_owed
-        self.medicare_tax_owed = self.medicareTaxHandler.income_tax_owed
-        self.niit_tax_owed = self.netInvestmentIncomeTaxHandler.income_tax_owed
-        return
-    
+    @property
+    def federal_long_term_capital_gains_tax_owed(self):
+        return self.federalHander.long_term_capital_gains_tax_owed
 
-    def compute_total_tax(self):
-        self.total_tax = sum(self.federal_tax_owed + \
-            self.federal_long_term_capital_gains_tax_owed + \
-            self.state_tax_owed + \
-            self.state_long_term_capital_gains_tax_owed + \
-            self.social_security_tax_owed + \
-            self.medicare_tax_owed + \
-            self.niit_tax_owed)
-        return
+    @property
+    def state_tax_owed(self):
+        return self.stateTaxHandler.income_tax_owed
+
+    @property
+    def state_long_term_capital_gains_tax_owed(self):
+        return self.stateTaxHandler.long_term_capital_gains_tax_owed
+
+    @property
+    def social_security_tax_owed(self):
+        return self.socialSecurityTaxHandler.income_tax_owed
+
+    @property
+    def medicare_tax_owed(self):
+        return self.medicareTaxHandler.income_tax_owed
+
+    @property
+    def niit_tax_owed(self):
+        return self.netInvestmentIncomeTaxHandler.income_tax_owed
+
+    @cached_property
+    def total_tax(self):
+        return self.total_tax_of(self.federal_tax_owed, self.federal_long_term_capital_gains_tax_owed, self.state_tax_owed,
+            self.state_long_term_capital_gains_tax_owed, self.social_security_tax_owed, self.medicare_tax_owed, self.niit_tax_owed)
+
+    @staticmethod
+    def total_tax_of(federal_tax_owed, federal_long_term_capital_gains_tax_owed, state_tax_owed, state_long_term_capital_gains_tax_owed,
+                     social_security_tax_owed, medicare_tax_owed, niit_tax_owed):
+        # Every tax of every person, added in this order by both TaxHandler and TaxEngine
+        return sum(itertools.chain(federal_tax_owed,
+            federal_long_term_capital_gains_tax_owed,
+            state_tax_owed,
+            state_long_term_capital_gains_tax_owed,
+            social_security_tax_owed,
+            medicare_tax_owed,
+            niit_tax_owed))
     
 
     def display_tax_summary(self):
 
         try:
+            logger = get_logger()
             self.federalHander.display_tax_summary()
             self.socialSecurityTaxHandler.display_tax_summary()
             self.medicareTaxHandler.display_tax_summary()
@@ -124,30 +220,90 @@ class TaxHandler:
         return
 
 
+    def result(self):
+        """Returns every tax as an immutable TaxResult, calculating any that were not already. The result is cached until invalidate is called."""
+        return self._result
+
+    @cached_property
+    def _result(self):
+        return TaxResult(
+            self.federalHander.result(),
+            self.socialSecurityTaxHandler.result(),
+            self.medicareTaxHandler.result(),
+            self.stateTaxHandler.result(),
+            self.netInvestmentIncomeTaxHandler.result(),
+            self.total_tax,
+        )
+
+
     def summary_json(self):
+        # Fresh dicts and lists, so changing the summary cannot change the handlers
+        return self.result().to_dict()
         
+    
+    def marginal_rates(self):
+        """Returns the marginal tax rate of each tax for each person, as computed alongside the taxes.
+
+        Each rate is the rate at which the next dollar of that tax's own taxable income is taxed.
+        """
+
         try:
-            federal_summary = self.federalHander.summary_json()
-            social_security_summary = self.socialSecurityTaxHandler.summary_json()
-            medicare_summary = self.medicareTaxHandler.summary_json()
-            niit_summary = self.netInvestmentIncomeTaxHandler.summary_json()
-            state_summary = self.stateTaxHandler.summary_json()
-            total_tax_owed = self.total_tax
             return {
-                'federal': federal_summary,
-                'social_security': social_security_summary,
-                'medicare': medicare_summary,
-                'state': state_summary,
-                'niit': niit_summary,
-                'total_tax_owed': total_tax_owed
+                'federal': self.federalHander.income_marginal_rates,
+                'federal_long_term_capital_gains': self.federalHander.long_term_capital_gains_marginal_rates,
+                'state': self.stateTaxHandler.income_marginal_rates,
+                'state_long_term_capital_gains': self.stateTaxHandler.long_term_capital_gains_marginal_rates,
+                'social_security': self.socialSecurityTaxHandler.income_marginal_rates,
+                'medicare': self.medicareTaxHandler.income_marginal_rates,
+                'niit': self.netInvestmentIncomeTaxHandler.income_marginal_rates,
             }
         except AttributeError as e:
             raise AttributeError(f"{e} Ensure you call 'calculate_taxes' on relevant Handlers")
-        
-    
+
+
+    @classmethod
+    def compute_many(cls, records, tax_year: int | None = None, filing_status: str | None = None, state: str | None = None, state_data = None, max_workers: int | None = None):
+        """Returns a generator of the summary_json of each household, without keeping a TaxHandler alive for any of them.
+
+        The tax brackets of each (tax_year, filing_status, state) are resolved once and reused for every household
+        that shares them, so memory stays constant however many records are streamed through.
+
+        Keyword arguments:
+        records: iterable - Each household, either as its incomes_adjustments_and_deductions list, or as a dict of
+         TaxHandler arguments, whose tax_year, filing_status, state and state_data override the ones given here.
+        tax_year: int - The year for tax filling of every household that does not give its own
+        filing_status: str - The type of filling of every household that does not give its own
+        state: str - The state of every household that does not give its own
+        state_data: dict - information relevant to the state of every household that does not give its own
+        max_workers: int - Calculates the households across this many worker processes, still returned in the order of the records
+        """
+        if max_workers is not None:
+            return cls._compute_many_in_parallel(records, tax_year, filing_status, state, state_data, max_workers)
+        # Imported here, as the engine builds on this class
+        from .TaxEngine import TaxEngine
+        return TaxEngine().compute_many(records, tax_year=tax_year, filing_status=filing_status, state=state, state_data=state_data)
+
+
+    @staticmethod
+    def _compute_many_in_parallel(records, tax_year, filing_status, state, state_data, max_workers: int):
+        from .ParallelTaxEngine import ParallelTaxEngine
+        with ParallelTaxEngine(max_workers=max_workers) as engine:
+            yield from engine.compute_many(records, tax_year=tax_year, filing_status=filing_status, state=state, state_data=state_data)
+
+
+    @staticmethod
+    def validate_state_is_supported(tax_year: int, filing_status: str, state: str):
+        if state != GEORGIA and state not in STATES_WITHOUT_INCOME_TAX:
+            raise ValueError(f"Unsupported combination of status: {filing_status}, year {tax_year}, and state {state}")
+
+
     # Makes federal income handlers. Handles the case when two incomes are provided for MARRIED_FILING_JOINTLY and combines them
     def make_federal_income_handlers(self, incomes_adjustments_and_deductions: list[dict]): 
-        if self.filing_status == MARRIED_FILING_JOINTLY and len(incomes_adjustments_and_deductions) == 2:
+        self.federal_income_handlers = self.federal_income_handlers_for(self.tax_year, self.filing_status, incomes_adjustments_and_deductions)
+
+    @staticmethod
+    def federal_income_handlers_for(tax_year: int, filing_status: str, incomes_adjustments_and_deductions: list[dict]):
+        if filing_status == MARRIED_FILING_JOINTLY and len(incomes_adjustments_and_deductions) == 2:
             # There are two earners and they need their incomes combined into a single entity
             combined = {}
             for k,v in incomes_adjustments_and_deductions[0].items():
@@ -163,11 +319,15 @@ class TaxHandler:
                 else:
                     # Sum the fields if they are a field that should be summed
                     combined[k] = v + incomes_adjustments_and_deductions[1][k]
-            self.federal_income_handlers = [FederalIncomeHandler.from_dict(combined | {'tax_year': self.tax_year, 'filing_status': self.filing_status})]
+            return [FederalIncomeHandler.from_dict(combined, tax_year=tax_year, filing_status=filing_status)]
 
         else: 
-            self.federal_income_handlers = [FederalIncomeHandler.from_dict(i | {'tax_year': self.tax_year, 'filing_status': self.filing_status}) for i in incomes_adjustments_and_deductions]
+            return FederalIncomeHandler.from_records(incomes_adjustments_and_deductions, tax_year=tax_year, filing_status=filing_status)
 
    # Makes payroll income handlers. 
     def make_payroll_income_handlers(self, incomes_adjustments_and_deductions: list[dict]): 
-        self.payroll_income_handlers = [PayrollTaxIncomeHandler.from_dict({'salaries_and_wages': i['salaries_and_wages']}) for i in incomes_adjustments_and_deductions]
+        self.payroll_income_handlers = self.payroll_income_handlers_for(incomes_adjustments_and_deductions)
+
+    @staticmethod
+    def payroll_income_handlers_for(incomes_adjustments_and_deductions: list[dict]):
+        return [PayrollTaxIncomeHandler(i['salaries_and_wages']) for i in incomes_adjustments_and_deductions]
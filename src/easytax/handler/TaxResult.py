@@ -0,0 +1,86 @@
+# Local Imports
+from .TaxResultBase import TaxResultBase
+from .RegionalTaxResult import RegionalTaxResult
+from .IndividualTaxResult import IndividualTaxResult
+
+
+class TaxResult(TaxResultBase):
+
+    """
+    The taxes of one household, as returned by easytax.compute and TaxHandler.result.
+
+    Results are immutable and hold their taxes as tuples, so a TaxResult can be shared between threads, cached, or kept
+    by the million, without copying. Convert it with to_dict or to_tuple only where it leaves the program.
+    """
+
+    FIELDS = ("federal", "social_security", "medicare", "state", "niit", "total_tax_owed")
+    __slots__ = FIELDS
+
+    def __init__(self, federal: RegionalTaxResult, social_security: IndividualTaxResult, medicare: IndividualTaxResult,
+                 state: RegionalTaxResult, niit: IndividualTaxResult, total_tax_owed: float):
+        """Create a TaxResult object.
+
+        Keyword arguments:
+        federal -- The federal income and long term capital gains taxes
+        social_security -- The Social Security taxes
+        medicare -- The Medicare taxes
+        state -- The state income and long term capital gains taxes
+        niit -- The Net Investment Income Taxes
+        total_tax_owed -- The sum of every tax owed by the household
+        """
+        # Slots are set through object, as this class refuses every other assignment
+        object.__setattr__(self, "federal", federal)
+        object.__setattr__(self, "social_security", social_security)
+        object.__setattr__(self, "medicare", medicare)
+        object.__setattr__(self, "state", state)
+        object.__setattr__(self, "niit", niit)
+        object.__setattr__(self, "total_tax_owed", total_tax_owed)
+        return
+
+
+    @classmethod
+    def from_summary_json(cls, summary: dict):
+        """Create a TaxResult from a dict shaped like TaxHandler.summary_json.
+
+        Keyword arguments:
+        summary -- dict as returned by TaxHandler.summary_json or TaxEngine.compute
+        """
+        federal, state = summary['federal'], summary['state']
+        social_security, medicare, niit = summary['social_security'], summary['medicare'], summary['niit']
+        return cls(
+            RegionalTaxResult(federal['taxable_incomes'], federal['long_term_capital_gains'], federal['income_tax_owed'], federal['long_term_capital_gains_tax_owed']),
+            IndividualTaxResult(social_security['taxable_incomes'], social_security['income_tax_owed']),
+            IndividualTaxResult(medicare['taxable_incomes'], medicare['income_tax_owed']),
+            RegionalTaxResult(state['taxable_incomes'], state['long_term_capital_gains'], state['income_tax_owed'], state['long_term_capital_gains_tax_owed']),
+            IndividualTaxResult(niit['taxable_incomes'], niit['income_tax_owed']),
+            summary['total_tax_owed'],
+        )
+
+
+    def to_dict(self):
+        """Returns the same dict as TaxHandler.summary_json, with fresh lists the caller may change."""
+        return {
+            'federal': self.federal.to_dict(),
+            'social_security': self.social_security.to_dict(),
+            'medicare': self.medicare.to_dict(),
+            'state': self.state.to_dict(),
+            'niit': self.niit.to_dict(),
+            'total_tax_owed': self.total_tax_owed,
+        }
+
+
+    def to_tuple(self):
+        """Returns the fields as nested tuples, in the order of FIELDS. The tuples are the result's own, not copies."""
+        return (
+            self.federal.to_tuple(),
+            self.social_security.to_tuple(),
+            self.medicare.to_tuple(),
+            self.state.to_tuple(),
+            self.niit.to_tuple(),
+            self.total_tax_owed,
+        )
+
+
+    def summary_json(self):
+        """Returns the same dict as TaxHandler.summary_json. The same as to_dict."""
+        return self.to_dict()
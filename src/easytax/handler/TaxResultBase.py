@@ -0,0 +1,47 @@
+# Standard Library Imports
+from operator import attrgetter
+
+
+class TaxResultBase:
+
+    """
+    Base object for an immutable tax result, such as a TaxResult.
+
+    Subclasses list their constructor arguments, in order, in FIELDS and store each in a slot. Results are compared,
+    hashed and pickled by those fields.
+    """
+
+    FIELDS = ()
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._values = attrgetter(*cls.FIELDS)
+
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, cannot set '{name}'")
+
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable, cannot delete '{name}'")
+
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self._values(self) == other._values(other)
+
+
+    def __hash__(self):
+        return hash(self._values(self))
+
+
+    def __reduce__(self):
+        # Rebuilt through the constructor, as the fields cannot be set afterwards
+        return (type(self), self._values(self))
+
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{field}={value!r}' for field, value in zip(self.FIELDS, self._values(self)))})"
@@ -0,0 +1,58 @@
+# Local Imports
+from ..base.PiecewiseLinearTax import PiecewiseLinearTax
+from ..brackets.BracketRegistry import registry, flat
+from ..brackets import FederalIncomeTaxBrackets
+from ..brackets import SocialSecurityIncomeTaxBrackets
+from ..brackets import MedicareIncomeTaxBrackets
+from ..brackets.states import GeorgiaStateIncomeTaxBrackets
+from ..data.ParameterStore import parameters, FEDERAL_STANDARD_DEDUCTION
+from ..utils.InputValidator import InputValidator
+from ..utils.Constants import *
+from .states.GeorgiaTaxHandler import GeorgiaTaxHandler
+
+
+class TotalTaxCurve(PiecewiseLinearTax):
+
+    def __init__(self, tax_year: int, filing_status: str, state: str, state_data = None):
+        """Create a TotalTaxCurve object.
+
+        The curve maps the wages of a single-earner, wage-only household taking the standard deduction to the total tax
+        a TaxHandler would compute for it: federal, state, Social Security, Medicare and NIIT fused into one function.
+        Build it once per (tax_year, filing_status, state), then evaluate any number of households with calculate_taxes.
+
+        Keyword arguments:
+        tax_year: int - The year for tax filling.
+        filing_status: str - The type of filling (Married Filing Jointly, Single, etc)
+        state: str - The state that you will be filing.
+        state_data: dict - information relevant to the selected state
+        """
+
+        InputValidator.validate_tax_year(tax_year)
+        InputValidator.validate_filing_status(filing_status)
+        InputValidator.validate_state(state)
+
+        self.tax_year = tax_year
+        self.filing_status = filing_status
+        self.state = state
+
+        standard_deduction = parameters.get(FEDERAL_STANDARD_DEDUCTION, tax_year, filing_status)
+        if standard_deduction is None:
+            raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}, and state {self.state}")
+        self.federal_tax_curve = FederalIncomeTaxBrackets.brackets[tax_year][filing_status].shift(standard_deduction)
+
+        # States tax federal taxable income, less any state-specific deductions
+        if self.state == GEORGIA:
+            state_deduction = GeorgiaTaxHandler._get_deduction(tax_year, state_data)
+            self.state_tax_curve = GeorgiaStateIncomeTaxBrackets.brackets[tax_year][filing_status].shift(standard_deduction + state_deduction)
+        elif self.state in STATES_WITHOUT_INCOME_TAX:
+            self.state_tax_curve = registry.intern(flat(0.0))
+        else:
+            raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}, and state {self.state}")
+
+        self.social_security_tax_curve = SocialSecurityIncomeTaxBrackets.brackets[tax_year]
+        self.medicare_tax_curve = MedicareIncomeTaxBrackets.brackets[tax_year]
+
+        # Wages are not net investment income, so the NIIT never applies to these households
+        total = self.federal_tax_curve + self.state_tax_curve + self.social_security_tax_curve + self.medicare_tax_curve
+        super().__init__(breakpoints = total.breakpoints, slopes = total.slopes, intercepts = total.intercepts)
+        return
@@ -0,0 +1,22 @@
+# Handlers are imported on first use, so importing one handler does not load every other handler and tax table
+from ..utils.LazyImport import lazy_submodules
+
+__all__ = [
+    "FederalTaxHandler",
+    "IndividualIncomeTaxHandlerBase",
+    "IndividualTaxResult",
+    "MedicareTaxHandler",
+    "NetInvestmentIncomeTaxHandler",
+    "ParallelTaxEngine",
+    "RegionalTaxHandlerBase",
+    "RegionalTaxResult",
+    "SocialSecurityTaxHandler",
+    "StateWithoutTaxHandler",
+    "TaxEngine",
+    "TaxHandler",
+    "TaxResult",
+    "TaxResultBase",
+    "TotalTaxCurve",
+    "states",
+]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
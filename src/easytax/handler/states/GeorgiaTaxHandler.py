@@ -30,28 +30,54 @@ class GeorgiaTaxHandler(RegionalTaxHandlerBase.RegionalTaxHandlerBase):
         self.filing_status = filing_status
         self.region = GEORGIA
 
-        # The state of Georgia treats long term capital gains as taxable income
-        self.taxable_income_before_dependents_and_exmptions = [f.taxable_income + f.long_term_capital_gains for f in federal_income_handlers]
+        self.taxable_income_before_dependents_and_exmptions = self._taxable_incomes_before_deduction(federal_income_handlers)
         self.long_term_capital_gains = [0 for _ in federal_income_handlers]
 
         self.income_tax_brackets = self._get_tax_brackets(tax_year, filing_status, GeorgiaStateIncomeTaxBrackets.brackets)
         self.long_term_capital_gains_tax_brackets = self._get_tax_brackets(tax_year, filing_status, GeorgiaStateLongTermCapitalGainsTaxBrackets.brackets)
 
+        self.deduction = self._get_deduction(tax_year, state_data)
+        self.taxable_incomes = self._apply_deduction(self.taxable_income_before_dependents_and_exmptions, self.deduction)
+        
+        return
+
+
+    @classmethod
+    def taxable_incomes_for(cls, tax_year: int, federal_income_handlers: list[FederalIncomeHandler], state_data: dict | None):
+        """Returns the Georgia taxable income of each person, as a GeorgiaTaxHandler of the same arguments would have it.
+
+        Keyword arguments:
+        tax_year: int - The year for tax filling.
+        federal_income_handlers: list[FederalIncomeHandler] - List of FederalIncomeHandler objects
+        state_data: dict - Inputs relevant to Georiga
+        """
+        return cls._apply_deduction(cls._taxable_incomes_before_deduction(federal_income_handlers), cls._get_deduction(tax_year, state_data))
+
+
+    @staticmethod
+    def _taxable_incomes_before_deduction(federal_income_handlers: list[FederalIncomeHandler]):
+        # The state of Georgia treats long term capital gains as taxable income
+        return [f.taxable_income + f.long_term_capital_gains for f in federal_income_handlers]
+
+
+    @staticmethod
+    def _apply_deduction(taxable_incomes: list, deduction: float):
+        # The household's deduction is split evenly between its incomes
+        deduction_per_income = deduction / len(taxable_incomes)
+        return [i - deduction_per_income for i in taxable_incomes]
+
+
+    @staticmethod
+    def _get_deduction(tax_year: int, state_data: dict | None):
         # The Georiga personal exemption deduction of $3,700 per person was removed in 2024. 
-        if self.tax_year < 2024:
+        if tax_year < 2024:
             if state_data is None:
-                self.deduction = 0
+                return 0
             elif state_data.get('exemptions') is None:
-                self.deduction = 0
+                return 0
             elif type(state_data.get('exemptions')) is not int:
                 raise TypeError(f"state_data specified invalid type for 'exemptions': {type(state_data.get('exemptions'))}")
             else:
-                self.deduction = 3700 * state_data.get('exemptions', 0)
+                return 3700 * state_data.get('exemptions', 0)
         else:
-            self.deduction = 0
-
-        deduction_per_income = self.deduction / len(self.taxable_income_before_dependents_and_exmptions)
-        self.taxable_incomes = [i - deduction_per_income for i in self.taxable_income_before_dependents_and_exmptions]
-        
-        return
-    
\ No newline at end of file
+            return 0
@@ -0,0 +1,114 @@
+# Local Imports
+from .FederalIncomeHandler import FederalIncomeHandler
+from ..data.ParameterStore import parameters, FEDERAL_STANDARD_DEDUCTION, NET_INVESTMENT_INCOME_THRESHOLD
+from ..utils.InputValidator import InputValidator
+from ..utils.OptionalDependencies import import_numpy
+
+
+class FederalIncomeBatch:
+
+    # The same layout as FederalIncomeHandler, so the columns are summed in the same order
+    INCOME_FIELDS = FederalIncomeHandler.INCOME_FIELDS
+    ADJUSTMENT_FIELDS = FederalIncomeHandler.ADJUSTMENT_FIELDS
+    DEDUCTION_FIELDS = FederalIncomeHandler.DEDUCTION_FIELDS
+    NIIT_FIELDS = FederalIncomeHandler.NIIT_FIELDS
+    COLUMN_FIELDS = INCOME_FIELDS + ("long_term_capital_gains",) + ADJUSTMENT_FIELDS + DEDUCTION_FIELDS + ("qbid",)
+
+    def __init__(self, filing_status, tax_year, dependents = 0, use_standard_deduction = True, **columns):
+        """Create a FederalIncomeBatch object, the columnar sibling of FederalIncomeHandler.
+
+        Each income, adjustment and deduction is a column holding one value per household. Every computed column is
+        bit-identical to the attribute of the same name on a FederalIncomeHandler built from that household's row.
+
+        Keyword arguments:
+        filing_status: str or array-like - The type of filling (Married Filing Jointly, Single, etc) of each row
+        tax_year: int or array-like - The year for tax filling of each row
+        dependents: int or array-like - The number of dependents of each row
+        use_standard_deduction: bool or array-like - Whether each row takes the standard deduction
+        columns: array-like - A column for any of the FederalIncomeHandler income, adjustment and deduction fields. Omitted fields are 0.
+        """
+        np = import_numpy()
+        # Per-row tax years and filing statuses are checked by the parameter gathers below
+        if np.ndim(tax_year) == 0:
+            InputValidator.validate_tax_year(tax_year)
+        if np.ndim(filing_status) == 0:
+            InputValidator.validate_filing_status(filing_status)
+
+        for key in columns:
+            if key not in self.COLUMN_FIELDS:
+                raise ValueError(f"Unsupported income for key {key}")
+
+        arrays = {key: np.asarray(column) for key, column in columns.items()}
+        for key, array in arrays.items():
+            if array.dtype.kind not in "iuf":
+                raise TypeError(f"Unsupported income type {array.dtype} for {key}")
+        dependents = np.asarray(dependents)
+        use_standard_deduction = np.asarray(use_standard_deduction, dtype=bool)
+
+        # Scalars are broadcast against the columns, and a batch of only scalars is a single row
+        shape = np.broadcast_shapes(np.shape(filing_status), np.shape(tax_year), dependents.shape, use_standard_deduction.shape, *(array.shape for array in arrays.values()))
+        if len(shape) > 1:
+            raise ValueError(f"columns must be one-dimensional, recieved shape: {shape}")
+        self.rows = shape[0] if shape else 1
+
+        # Omitted fields are a zero-copy view of a single 0, and are skipped by the sums below
+        zeros = np.broadcast_to(np.zeros(1), (self.rows,))
+        for key in self.COLUMN_FIELDS:
+            array = arrays.get(key)
+            setattr(self, key, zeros if array is None else np.broadcast_to(array.astype(float, copy=False), (self.rows,)))
+        self.filing_status = np.broadcast_to(filing_status, (self.rows,))
+        self.tax_year = np.broadcast_to(tax_year, (self.rows,))
+        # Gather from the unbroadcast inputs, so a batch sharing one tax year and filing status does a single lookup
+        standard_deduction = parameters.gather(FEDERAL_STANDARD_DEDUCTION, tax_year, filing_status)
+        niit_threshold = parameters.gather(NET_INVESTMENT_INCOME_THRESHOLD, tax_year, filing_status)
+        self.dependents = np.broadcast_to(dependents, (self.rows,))
+        self.use_standard_deduction = np.broadcast_to(use_standard_deduction, (self.rows,))
+
+        self.standard_deduction = np.broadcast_to(standard_deduction, (self.rows,))
+        self.total_income = self._sum(self.INCOME_FIELDS, arrays)
+        self.total_adjustments = self._sum(self.ADJUSTMENT_FIELDS, arrays)
+        self.adjusted_gross_income = self.total_income - self.total_adjustments
+        self.allowable_itemized_deductions = self._sum(self.DEDUCTION_FIELDS, arrays)
+        self.deduction_taken = np.where(self.use_standard_deduction, self.standard_deduction, self.allowable_itemized_deductions)
+
+        # Taxable Income Before Qualified Business Income Deduction
+        self.taxable_income_before_qbid = self.adjusted_gross_income - self.deduction_taken
+
+        # Selects exactly what max(x, 0) returns, including for -0.0 and nan
+        taxable_income = self.taxable_income_before_qbid - self.qbid
+        self.taxable_income = np.where(0 > taxable_income, 0.0, taxable_income)
+
+        # NIIT, choosing the lesser of the NIIT incomes or the taxable income over the threshold, as min() would
+        niit_incomes = self._sum(self.NIIT_FIELDS, arrays)
+        excess_income = self.taxable_income - niit_threshold
+        self.niit_income = np.where(self.taxable_income >= niit_threshold, np.where(excess_income < niit_incomes, excess_income, niit_incomes), 0.0)
+        return
+
+
+    @classmethod
+    def from_records(cls, records, **fixed):
+        """Create a FederalIncomeBatch with one row per dict of FederalIncomeHandler arguments.
+
+        Keyword arguments:
+        records -- iterable of dicts of argument to value, as accepted by FederalIncomeHandler.from_dict
+        fixed -- Arguments that override every dict's, such as a tax_year shared by every record
+        """
+        rows, columns = FederalIncomeHandler.SCHEMA.columns(records, **fixed)
+        if not rows:
+            raise ValueError("records cannot be empty")
+        return cls(**columns)
+
+
+    def __len__(self):
+        return self.rows
+
+
+    def _sum(self, fields, arrays):
+        # Adds the columns left to right from 0, the same operations sum() performs on each row.
+        # A running sum starting from 0 is never -0.0, so skipping omitted columns, which are all 0, changes nothing.
+        np = import_numpy()
+        total = np.zeros(self.rows)
+        for field in fields:
+            if field in arrays:
+                total += getattr(self, field)
+        return total
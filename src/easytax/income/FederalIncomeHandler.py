@@ -1,11 +1,90 @@
+# Standard Library Imports
+from operator import attrgetter
+
 # Local Imports
 from ..utils.InputValidator import InputValidator
-from ..deductions import FederalStandardDeductions
+from ..utils.RecordSchema import RecordSchema
+from ..data.ParameterStore import parameters, FEDERAL_STANDARD_DEDUCTION, NET_INVESTMENT_INCOME_THRESHOLD
 from ..utils.Constants import *
-from ..brackets.NetInvestmentIncomeTaxBrackets import threshold_amounts
 
 
 class FederalIncomeHandler:
+
+    # The field layout. Each group is summed in this order, so totals match a left-to-right sum of the fields.
+    # Notably omit long_term_capital_gains, which is taxed separately
+    INCOME_FIELDS = (
+        "salaries_and_wages",
+        "interest_income",
+        "tax_exempt_interest",
+        "dividend_income",
+        "qualified_dividend_income",
+        "taxable_state_local_refunds",
+        "alimony_received",
+        "business_income_or_loss",
+        "capital_gain_or_loss",
+        "other_gains_or_losses",
+        "taxable_ira_distributions",
+        "taxable_pensions",
+        "rent_royalty_income",
+        "partnership_or_s_corp_income",
+        "estate_trust_income",
+        "farm_income_or_loss",
+        "unemployment_compensation",
+        "taxable_social_security",
+        "other_income",
+    )
+    ADJUSTMENT_FIELDS = (
+        "moving_expenses",
+        "deductible_self_employment_tax",
+        "sep_simple_qualified_plans_deductions",
+        "self_employment_health_insurance",
+        "penalty_early_withdrawal_savings",
+        "alimony_paid",
+        "ira_deductions",
+        "student_loan_interest",
+        "other_adjustments",
+    )
+    DEDUCTION_FIELDS = (
+        "medical_expenses",
+        "taxes_paid",
+        "interest_paid",
+        "charitable_contributions",
+        "casualty_losses",
+        "miscellaneous_expenses",
+    )
+    NIIT_FIELDS = (
+        "capital_gain_or_loss",
+        "long_term_capital_gains",
+        "interest_income",
+        "rent_royalty_income",
+        "business_income_or_loss",
+    )
+
+    # Every constructor argument. Equality compares these, as everything else is computed from them.
+    INPUT_FIELDS = ("filing_status", "tax_year", "dependents", "use_standard_deduction") + \
+        INCOME_FIELDS + ("long_term_capital_gains",) + ADJUSTMENT_FIELDS + DEDUCTION_FIELDS + ("qbid",)
+    COMPUTED_FIELDS = (
+        "standard_deduction",
+        "total_income",
+        "total_adjustments",
+        "adjusted_gross_income",
+        "allowable_itemized_deductions",
+        "deduction_taken",
+        "taxable_income_before_qbid",
+        "taxable_income",
+        "niit_income",
+    )
+
+    # Millions of households may be held in memory at once, so fields live in slots rather than a per-object __dict__
+    __slots__ = INPUT_FIELDS + COMPUTED_FIELDS
+
+    _get_incomes = attrgetter(*INCOME_FIELDS)
+    _get_adjustments = attrgetter(*ADJUSTMENT_FIELDS)
+    _get_deductions = attrgetter(*DEDUCTION_FIELDS)
+    _get_niit_incomes = attrgetter(*NIIT_FIELDS)
+    _key = attrgetter(*INPUT_FIELDS)
+    _state = attrgetter(*__slots__)
+
     def __init__(self,
                 filing_status: str,
                 tax_year: int,
@@ -104,109 +183,36 @@ class FederalIncomeHandler:
         self.miscellaneous_expenses = miscellaneous_expenses
 
         # Set standard Deduction
-        if self.tax_year == 2025:
-            if self.filing_status == MARRIED_FILING_JOINTLY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_jointly_2025_deduction
-            elif self.filing_status == MARRIED_FILING_SEPARATELY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_separately_2025_deduction
-            elif self.filing_status == SINGLE:
-                self.standard_deduction = FederalStandardDeductions.single_filer_2025_deduction
-            else:
-                raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}")
-        elif self.tax_year == 2024:
-            if self.filing_status == MARRIED_FILING_JOINTLY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_jointly_2024_deduction
-            elif self.filing_status == MARRIED_FILING_SEPARATELY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_separately_2024_deduction
-            elif self.filing_status == SINGLE:
-                self.standard_deduction = FederalStandardDeductions.single_filer_2024_deduction
-            else:
-                raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}")
-        elif self.tax_year == 2023: 
-            if self.filing_status == MARRIED_FILING_JOINTLY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_jointly_2023_deduction
-            elif self.filing_status == MARRIED_FILING_SEPARATELY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_separately_2023_deduction
-            elif self.filing_status == SINGLE:
-                self.standard_deduction = FederalStandardDeductions.single_filer_2023_deduction
-            else:
-                raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}")  
-        elif self.tax_year == 2022:
-            if self.filing_status == MARRIED_FILING_JOINTLY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_jointly_2022_deduction
-            elif self.filing_status == MARRIED_FILING_SEPARATELY:
-                self.standard_deduction = FederalStandardDeductions.married_filing_separately_2022_deduction
-            elif self.filing_status == SINGLE:
-                self.standard_deduction = FederalStandardDeductions.single_filer_2022_deduction
-            else:
-                raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}")
-        else:
+        self.standard_deduction = parameters.get(FEDERAL_STANDARD_DEDUCTION, self.tax_year, self.filing_status)
+        if self.standard_deduction is None:
             raise ValueError(f"Unsupported combination of status: {self.filing_status}, year {self.tax_year}")
 
         # QBID
         self.qbid = qbid
 
-        # Notably omit long_term_capital_gains
-        self.income_sources = [
-            self.salaries_and_wages, 
-            self.interest_income, 
-            self.tax_exempt_interest, 
-            self.dividend_income, 
-            self.qualified_dividend_income, 
-            self.taxable_state_local_refunds, 
-            self.alimony_received, 
-            self.business_income_or_loss, 
-            self.capital_gain_or_loss, 
-            self.other_gains_or_losses, 
-            self.taxable_ira_distributions, 
-            self.taxable_pensions, 
-            self.rent_royalty_income, 
-            self.partnership_or_s_corp_income, 
-            self.estate_trust_income, 
-            self.farm_income_or_loss, 
-            self.unemployment_compensation, 
-            self.taxable_social_security, 
-            self.other_income
-        ]
-        for i in self.income_sources:
+        income_sources = self._get_incomes(self)
+        for i in income_sources:
             if type(i) not in (int, float):
                 raise TypeError(f"Unsupported income type {type(i)} for income {i}")
-        self.total_income = sum(self.income_sources)
+        self.total_income = sum(income_sources)
 
         # Calculate Total Income, Adjustments, and AGI
-        self.adjustment_sources = [
-            self.moving_expenses, 
-            self.deductible_self_employment_tax, 
-            self.sep_simple_qualified_plans_deductions, 
-            self.self_employment_health_insurance, 
-            self.penalty_early_withdrawal_savings, 
-            self.alimony_paid, 
-            self.ira_deductions, 
-            self.student_loan_interest, 
-            self.other_adjustments
-        ]
-        for i in self.adjustment_sources:
+        adjustment_sources = self._get_adjustments(self)
+        for i in adjustment_sources:
             if type(i) not in (int, float):
                 raise TypeError(f"Unsupported income type {type(i)} for adjustment {i}")
             
-        self.total_adjustments = sum(self.adjustment_sources)
+        self.total_adjustments = sum(adjustment_sources)
         self.adjusted_gross_income = self.total_income - self.total_adjustments
 
         # Deduction fields
-        self.deduction_sources = [
-            self.medical_expenses, 
-            self.taxes_paid, 
-            self.interest_paid, 
-            self.charitable_contributions, 
-            self.casualty_losses, 
-            self.miscellaneous_expenses, 
-        ]
-        for i in self.deduction_sources:
+        deduction_sources = self._get_deductions(self)
+        for i in deduction_sources:
             if type(i) not in (int, float):
                 raise TypeError(f"Unsupported deduction type {type(i)} for deduction {i}")
         
         # TODO: Perform any other value validation on incomes. Some may be negative, but those that must be positive should be checked.
-        self.allowable_itemized_deductions = sum(self.deduction_sources)
+        self.allowable_itemized_deductions = sum(deduction_sources)
 
         # handle the fact that not all pre-tax contributions are tax-deductible, such as IRA contributions if you are, or are not, covered by a retirement plan at work and make above a certain amount
         # https://www.irs.gov/retirement-plans/2023-ira-deduction-limits-effect-of-modified-agi-on-deduction-if-you-are-covered-by-a-retirement-plan-at-work
@@ -224,13 +230,7 @@ class FederalIncomeHandler:
             raise ValueError(f"Taxable Income cannot be less than zero. Got {self.taxable_income}")
         
         # NIIT
-        niit_incomes = [
-            self.capital_gain_or_loss,
-            self.long_term_capital_gains, 
-            self.interest_income,
-            self.rent_royalty_income,
-            business_income_or_loss
-        ]
+        niit_incomes = self._get_niit_incomes(self)
         # Fetch the NIIT threshold
         niit_threshold = self._get_niit_threshold(self.tax_year, self.filing_status)
 
@@ -241,58 +241,40 @@ class FederalIncomeHandler:
             self.niit_income = min(sum(niit_incomes), self.taxable_income - niit_threshold)
         else:
             self.niit_income = 0
-    
+
+    @property
+    def income_sources(self):
+        return list(self._get_incomes(self))
+
+    @property
+    def adjustment_sources(self):
+        return list(self._get_adjustments(self))
+
+    @property
+    def deduction_sources(self):
+        return list(self._get_deductions(self))
+
     def __eq__(self, other):
         if not isinstance(other, FederalIncomeHandler):
             return NotImplemented
 
-        return (
-            self.filing_status == other.filing_status and
-            self.tax_year == other.tax_year and
-            self.dependents == other.dependents and
-            self.use_standard_deduction == other.use_standard_deduction and
-            # Income
-            self.salaries_and_wages == other.salaries_and_wages and
-            self.interest_income == other.interest_income and
-            self.tax_exempt_interest == other.tax_exempt_interest and
-            self.dividend_income == other.dividend_income and
-            self.qualified_dividend_income == other.qualified_dividend_income and
-            self.taxable_state_local_refunds == other.taxable_state_local_refunds and
-            self.alimony_received == other.alimony_received and
-            self.business_income_or_loss == other.business_income_or_loss and
-            self.capital_gain_or_loss == other.capital_gain_or_loss and
-            self.other_gains_or_losses == other.other_gains_or_losses and
-            self.taxable_ira_distributions == other.taxable_ira_distributions and
-            self.taxable_pensions == other.taxable_pensions and
-            self.rent_royalty_income == other.rent_royalty_income and
-            self.partnership_or_s_corp_income == other.partnership_or_s_corp_income and
-            self.estate_trust_income == other.estate_trust_income and
-            self.farm_income_or_loss == other.farm_income_or_loss and
-            self.unemployment_compensation == other.unemployment_compensation and
-            self.taxable_social_security == other.taxable_social_security and
-            self.other_income == other.other_income and
-            # LTCG
-            self.long_term_capital_gains == other.long_term_capital_gains and
-            # Adjustments
-            self.moving_expenses == other.moving_expenses and
-            self.deductible_self_employment_tax == other.deductible_self_employment_tax and
-            self.sep_simple_qualified_plans_deductions == other.sep_simple_qualified_plans_deductions and
-            self.self_employment_health_insurance == other.self_employment_health_insurance and
-            self.penalty_early_withdrawal_savings == other.penalty_early_withdrawal_savings and
-            self.alimony_paid == other.alimony_paid and
-            self.ira_deductions == other.ira_deductions and
-            self.student_loan_interest == other.student_loan_interest and
-            self.other_adjustments == other.other_adjustments and
-            # Deductions
-            self.medical_expenses == other.medical_expenses and
-            self.taxes_paid == other.taxes_paid and
-            self.interest_paid == other.interest_paid and
-            self.charitable_contributions == other.charitable_contributions and
-            self.casualty_losses == other.casualty_losses and
-            self.miscellaneous_expenses == other.miscellaneous_expenses and
-            self.standard_deduction == other.standard_deduction and
-            self.qbid == other.qbid
-        )
+        return self._key(self) == other._key(other)
+
+    # The fields are mutable, so handlers are not hashable. Use key to put one in a set or dict.
+    __hash__ = None
+
+    @property
+    def key(self):
+        # A snapshot of the input fields, which stays the same if the handler is changed afterwards
+        return self._key(self)
+
+    def __getstate__(self):
+        # Pickled as a bare tuple of the slots' values, without their names, and restored without being recomputed
+        return self._state(self)
+
+    def __setstate__(self, state):
+        for field, value in zip(self.__slots__, state):
+            setattr(self, field, value)
 
     def __str__(self):
         return (
@@ -349,78 +331,35 @@ class FederalIncomeHandler:
         )
 
     @classmethod
-    def from_dict(cls, data: dict):
-        # Mandatory fields without default values
-        if 'filing_status' not in data or 'tax_year' not in data:
-            raise ValueError("filing_status and tax_year are required fields")
-
-        # Set default values to 0 if not provided in data
-        default_values = {
-            "tax_year": "REPLACE",
-            "filing_status": "REPLACE",
-            "dependents": 0,
-            "use_standard_deduction": True,
-            # Income
-            "salaries_and_wages": 0,
-            "interest_income": 0,
-            "tax_exempt_interest": 0,
-            "dividend_income": 0,
-            "qualified_dividend_income": 0,
-            "taxable_state_local_refunds": 0,
-            "alimony_received": 0,
-            "business_income_or_loss": 0,
-            "capital_gain_or_loss": 0,
-            "other_gains_or_losses": 0,
-            "taxable_ira_distributions": 0,
-            "taxable_pensions": 0,
-            "rent_royalty_income": 0,
-            "partnership_or_s_corp_income": 0,
-            "estate_trust_income": 0,
-            "farm_income_or_loss": 0,
-            "unemployment_compensation": 0,
-            "taxable_social_security": 0,
-            "other_income": 0,
-            # LTCG
-            "long_term_capital_gains": 0,
-            # Adjustments
-            "moving_expenses": 0,
-            "deductible_self_employment_tax": 0,
-            "sep_simple_qualified_plans_deductions": 0,
-            "self_employment_health_insurance": 0,
-            "penalty_early_withdrawal_savings": 0,
-            "alimony_paid": 0,
-            "ira_deductions": 0,
-            "student_loan_interest": 0,
-            "other_adjustments": 0,
-            # Deductions
-            "medical_expenses": 0,
-            "taxes_paid": 0,
-            "interest_paid": 0,
-            "charitable_contributions": 0,
-            "casualty_losses": 0,
-            "miscellaneous_expenses": 0,
-            "qbid": 0,
-        }
-
-        # Update default values with those provided in data
-        for key in default_values.keys():
-            if key in data:
-                default_values[key] = data[key]
-
-        for key in data.keys():
-            if key not in default_values.keys():
-                raise ValueError(f"Unsupported income for key {key}")
-
-        # Create an instance of the class with the updated values
-        return cls(**default_values)
+    def from_dict(cls, data: dict, **fixed):
+        """Create a FederalIncomeHandler from a dict of its arguments. Omitted incomes, adjustments and deductions are 0.
+
+        Keyword arguments:
+        data -- dict of argument to value, which must include filing_status and tax_year unless they are fixed
+        fixed -- Arguments that override the dict's, such as the tax_year
+        """
+        return cls.SCHEMA.from_dict(data, **fixed)
+
+    @classmethod
+    def from_records(cls, records, **fixed):
+        """Create a list of FederalIncomeHandlers, one from each dict of arguments.
+
+        Keyword arguments:
+        records -- iterable of dicts of argument to value
+        fixed -- Arguments that override every dict's, such as a tax_year shared by every record
+        """
+        return cls.SCHEMA.from_records(records, **fixed)
     
     @staticmethod
     def _get_niit_threshold(tax_year: int, filing_status: str):
-        if tax_year not in threshold_amounts:
-            raise ValueError(f"Unsupported tax year: {tax_year}")
-        
-        if filing_status not in threshold_amounts[tax_year]:
+        niit_threshold = parameters.get(NET_INVESTMENT_INCOME_THRESHOLD, tax_year, filing_status)
+        if niit_threshold is None:
+            if tax_year not in parameters.tax_years(NET_INVESTMENT_INCOME_THRESHOLD):
+                raise ValueError(f"Unsupported tax year: {tax_year}")
             raise ValueError(f"Unsupported filing status: {filing_status} for tax year {tax_year}")
 
-        
-        return threshold_amounts[tax_year][filing_status]
+        return niit_threshold
+
+
+# Compiled once, so building from dicts checks each distinct key signature once rather than every record
+FederalIncomeHandler.SCHEMA = RecordSchema(FederalIncomeHandler)
@@ -0,0 +1,231 @@
+# Local Imports
+from .FederalIncomeHandler import FederalIncomeHandler
+from ..utils.Constants import *
+from ..utils.OptionalDependencies import import_numpy
+from ..utils.RecordSchema import MISSING_FIELD, UNSUPPORTED_FIELD
+
+
+# Error codes, one per rule a row can break
+UNSUPPORTED_TAX_YEAR = "unsupported_tax_year"
+UNSUPPORTED_FILING_STATUS = "unsupported_filing_status"
+UNSUPPORTED_STATE = "unsupported_state"
+UNSUPPORTED_TYPE = "unsupported_type"
+MISMATCHED_DEPENDENTS = "mismatched_dependents"
+MISMATCHED_STANDARD_DEDUCTION = "mismatched_standard_deduction"
+
+# A (row, field, code) entry per problem. Field and code are str objects, so each entry shares the one str of its rule.
+ERROR_TABLE_DTYPE = [("row", "i8"), ("field", object), ("code", object)]
+
+# The incomes, adjustments and deductions, which must each be an int or a float
+NUMERIC_FIELDS = FederalIncomeHandler.INCOME_FIELDS + ("long_term_capital_gains",) + FederalIncomeHandler.ADJUSTMENT_FIELDS + \
+    FederalIncomeHandler.DEDUCTION_FIELDS + ("qbid",)
+
+
+class FederalIncomeValidator:
+
+    """
+    Validates a batch of FederalIncomeHandler inputs in one pass, reporting every problem rather than raising on the first.
+
+    Each rule is checked over a whole column at once. The problems are returned as an error table, a numpy structured
+    array with a (row, field, code) entry per problem, sorted by row, so the valid rows can continue into a
+    FederalIncomeBatch without an exception per bad row.
+    """
+
+    @staticmethod
+    def validate_columns(filing_status, tax_year, dependents = 0, use_standard_deduction = True, state = None, household = None, **columns):
+        """Returns the error table of a batch of columns, as accepted by FederalIncomeBatch.
+
+        Keyword arguments:
+        filing_status: str or array-like - The filing status of each row
+        tax_year: int or array-like - The tax year of each row
+        dependents: int or array-like - The number of dependents of each row
+        use_standard_deduction: bool or array-like - Whether each row takes the standard deduction
+        state: str or array-like - The state of each row, if it should be checked
+        household: array-like - An id shared by the rows of a household. Rows of a Married Filing Jointly household must
+                   have the same dependents and use_standard_deduction, as required by TaxHandler.
+        columns: array-like - A column for any of the incomes, adjustments and deductions
+        """
+        return FederalIncomeValidator._validate(dict(columns, filing_status=filing_status, tax_year=tax_year, dependents=dependents,
+            use_standard_deduction=use_standard_deduction, state=state, household=household), None)
+
+
+    @staticmethod
+    def validate_records(records, state = None, household = None, **fixed):
+        """Returns the number of records and their columns, as FederalIncomeHandler.SCHEMA.columns does, and their error table.
+
+        Records with a missing or unsupported key are reported with the codes missing_field and unsupported_field, and
+        are otherwise left unchecked.
+
+        Keyword arguments:
+        records -- iterable of dicts of FederalIncomeHandler arguments
+        state: str or array-like - The state of each record, if it should be checked
+        household: array-like - An id shared by the records of a household
+        fixed -- Arguments that override every record's, such as a tax_year shared by every record
+        """
+        invalid = []
+        rows, columns = FederalIncomeHandler.SCHEMA.columns(records, invalid=invalid, **fixed)
+        errors = FederalIncomeValidator._validate(dict(columns, state=state, household=household), invalid, rows)
+        return rows, columns, errors
+
+
+    @staticmethod
+    def valid_rows(errors, rows: int):
+        """Returns a boolean ndarray that is True for each row without an entry in the error table.
+
+        Keyword arguments:
+        errors -- The error table returned by validate_columns or validate_records
+        rows -- The number of rows that were validated
+        """
+        np = import_numpy()
+        valid = np.ones(rows, dtype=bool)
+        valid[errors["row"]] = False
+        return valid
+
+
+    @staticmethod
+    def select_rows(columns: dict, rows):
+        """Returns the columns with only the selected rows. Scalars, which are shared by every row, are kept as they are.
+
+        Keyword arguments:
+        columns -- dict of field to a scalar or array-like column
+        rows -- A boolean mask or an array of row indexes, such as from valid_rows
+        """
+        np = import_numpy()
+        selected = {}
+        for field, column in columns.items():
+            if FederalIncomeValidator._is_column(column):
+                # Object arrays, so values such as lists in rows that failed validation are never unpacked
+                array = column if isinstance(column, np.ndarray) else np.fromiter(column, dtype=object, count=len(column))
+                column = array[rows]
+                if column.dtype == object and len(column):
+                    column = np.array(column.tolist())
+            selected[field] = column
+        return selected
+
+
+    @staticmethod
+    def _validate(columns: dict, invalid: list | None, rows: int | None = None):
+        np = import_numpy()
+        for key in columns:
+            if key not in NUMERIC_FIELDS and key not in ("filing_status", "tax_year", "dependents", "use_standard_deduction", "state", "household"):
+                raise ValueError(f"Unsupported income for key {key}")
+        state = columns.pop("state")
+        household = columns.pop("household")
+
+        if rows is None:
+            lengths = {len(column) for column in [*columns.values(), state, household] if FederalIncomeValidator._is_column(column)}
+            if len(lengths) > 1:
+                raise ValueError(f"columns must all be the same length, recieved lengths: {sorted(lengths)}")
+            rows = lengths.pop() if lengths else 1
+
+        # Rows with a missing or unsupported key hold placeholders, so they are not checked any further
+        checked = np.ones(rows, dtype=bool)
+        found = []
+        if invalid:
+            invalid_rows, fields, codes = zip(*invalid)
+            checked[list(invalid_rows)] = False
+            found.append((np.asarray(invalid_rows, dtype=np.intp), np.asarray(fields, dtype=object), np.asarray(codes, dtype=object)))
+
+        def report(field, code, failed):
+            failed = np.broadcast_to(failed, (rows,)) & checked
+            if failed.any():
+                failed_rows = np.flatnonzero(failed)
+                found.append((failed_rows, field, code))
+
+        report("tax_year", UNSUPPORTED_TAX_YEAR, ~FederalIncomeValidator._isin(columns["tax_year"], SUPPORTED_TAX_YEARS))
+        report("filing_status", UNSUPPORTED_FILING_STATUS, ~FederalIncomeValidator._isin(columns["filing_status"], SUPPORTED_FILING_STATUSES))
+        if state is not None:
+            report("state", UNSUPPORTED_STATE, ~FederalIncomeValidator._isin(state, SUPPORTED_STATES))
+        for field in NUMERIC_FIELDS:
+            if field in columns:
+                report(field, UNSUPPORTED_TYPE, ~FederalIncomeValidator._is_number(columns[field]))
+
+        if household is not None:
+            married_filing_jointly = np.broadcast_to(FederalIncomeValidator._isin(columns["filing_status"], {MARRIED_FILING_JOINTLY}), (rows,)) & checked
+            for field, code in (("dependents", MISMATCHED_DEPENDENTS), ("use_standard_deduction", MISMATCHED_STANDARD_DEDUCTION)):
+                # Records that all omit a field share its default
+                if field in columns:
+                    report(field, code, FederalIncomeValidator._differs_within_household(columns[field], household, married_filing_jointly, rows))
+
+        table = np.empty(sum(len(found_rows) for found_rows, _, _ in found), dtype=ERROR_TABLE_DTYPE)
+        start = 0
+        for found_rows, field, code in found:
+            end = start + len(found_rows)
+            table["row"][start:end], table["field"][start:end], table["code"][start:end] = found_rows, field, code
+            start = end
+        if len(found) > 1:
+            # Stable, so each row's problems stay in the order the rules are checked
+            table = table[np.argsort(table["row"], kind="stable")]
+        return table
+
+
+    @staticmethod
+    def _is_column(value):
+        # Strings and other scalars are shared by every row
+        np = import_numpy()
+        if isinstance(value, np.ndarray):
+            return value.ndim > 0
+        return hasattr(value, "__len__") and not isinstance(value, (str, bytes))
+
+
+    @staticmethod
+    def _isin(column, supported: set):
+        # Membership with the same semantics as the `in` checks of InputValidator, over every row
+        np = import_numpy()
+        if not FederalIncomeValidator._is_column(column):
+            return np.bool_(FederalIncomeValidator._contains(supported, column))
+        if isinstance(column, np.ndarray) and column.dtype.kind in "iufU":
+            # One comparison per supported value, which is far cheaper than sorting the column as np.isin does
+            kind = str if column.dtype.kind == "U" else (int, float)
+            found = np.zeros(len(column), dtype=bool)
+            for value in supported:
+                if isinstance(value, kind):
+                    found |= column == value
+            return found
+        try:
+            return np.fromiter(map(supported.__contains__, column), dtype=bool, count=len(column))
+        except TypeError:
+            # An unhashable value, such as a list, is never supported
+            return np.fromiter((FederalIncomeValidator._contains(supported, value) for value in column), dtype=bool, count=len(column))
+
+
+    @staticmethod
+    def _is_number(column):
+        # The type check of FederalIncomeHandler, which accepts only int and float, over every row
+        np = import_numpy()
+        numeric = (int, float)
+        if not FederalIncomeValidator._is_column(column):
+            return np.bool_(type(column) in numeric)
+        if isinstance(column, np.ndarray) and column.dtype.kind != "O":
+            return np.bool_(column.dtype.kind in "iuf")
+        if set(map(type, column)) <= set(numeric):
+            return np.True_
+        return np.fromiter((type(value) in numeric for value in column), dtype=bool, count=len(column))
+
+
+    @staticmethod
+    def _differs_within_household(column, household, married_filing_jointly, rows: int):
+        # True for each Married Filing Jointly row whose value differs from the first row of its household
+        np = import_numpy()
+        failed = np.zeros(rows, dtype=bool)
+        if not FederalIncomeValidator._is_column(column) or not married_filing_jointly.any():
+            return failed
+
+        indexes = np.flatnonzero(married_filing_jointly)
+        households = np.broadcast_to(np.asarray(household), (rows,))[indexes]
+        order = np.argsort(households, kind="stable")
+        indexes, households = indexes[order], households[order]
+        starts = np.concatenate(([True], households[1:] != households[:-1]))
+        first = np.flatnonzero(starts)[np.cumsum(starts) - 1]
+
+        values = np.asarray(column)[indexes]
+        failed[indexes] = values != values[first]
+        return failed
+
+
+    @staticmethod
+    def _contains(supported: set, value):
+        try:
+            return value in supported
+        except TypeError:
+            return False
@@ -1,3 +1,7 @@
+# Local Imports
+from ..utils.RecordSchema import RecordSchema
+
+
 # Income handler for Payroll/FICA taxes (Social Security and Medicare)
 class PayrollTaxIncomeHandler:
     def __init__(self,
@@ -32,6 +36,10 @@ class PayrollTaxIncomeHandler:
             self.salaries_and_wages == other.salaries_and_wages
         )
 
+    def __reduce__(self):
+        # Everything else is computed from the wages, so they are all that is pickled
+        return (PayrollTaxIncomeHandler, (self.salaries_and_wages,))
+
     def __str__(self):
         return (
             f"Payroll Income Handler:\n"
@@ -40,21 +48,12 @@ class PayrollTaxIncomeHandler:
 
     @classmethod
     def from_dict(cls, data: dict):
+        return cls.SCHEMA.from_dict(data)
 
-        # Set default values to 0 if not provided in data
-        default_values = {
-            # Income
-            "salaries_and_wages": 0,
-        }
-
-        # Update default values with those provided in data
-        for key in default_values.keys():
-            if key in data:
-                default_values[key] = data[key]
+    @classmethod
+    def from_records(cls, records):
+        return cls.SCHEMA.from_records(records)
 
-        for key in data.keys():
-            if key not in default_values.keys():
-                raise ValueError(f"Unsupported income for key {key}")
 
-        # Create an instance of the class with the updated values
-        return cls(**default_values)
\ No newline at end of file
+# Compiled once, so building from dicts checks each distinct key signature once rather than every record
+PayrollTaxIncomeHandler.SCHEMA = RecordSchema(PayrollTaxIncomeHandler)
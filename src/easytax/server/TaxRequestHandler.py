@@ -0,0 +1,164 @@
+# Standard Library Imports
+from http.server import BaseHTTPRequestHandler
+import json
+
+
+# Content types of a batch whose records are one JSON object per line, rather than a JSON array
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/jsonl"}
+
+# Summaries are written to a batch response in chunks of about this many bytes
+CHUNK_SIZE = 64 * 2**10
+
+
+class TaxRequestHandler(BaseHTTPRequestHandler):
+
+    """
+    Serves the endpoints of a TaxServer:
+
+    POST /v1/tax -- The body is a JSON object of TaxHandler arguments: tax_year, filing_status, state,
+     incomes_adjustments_and_deductions and optionally state_data. Responds with its summary_json.
+    POST /v1/tax:batch -- The body is a JSON array of such objects, or one per line when sent as application/x-ndjson.
+     Responds with NDJSON, one summary_json per household in the order they were sent, streamed as each is calculated.
+     A household that cannot be calculated gets a line of {"index": ..., "error": ...} instead.
+
+    Connections are kept alive between requests.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "easytax"
+
+    # Headers and body are written separately, so with Nagle's algorithm a kept-alive connection would stall each
+    # response on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    ROUTES = {
+        "/v1/tax": "_tax",
+        "/v1/tax:batch": "_tax_batch",
+    }
+
+    def do_POST(self):
+        route = self.ROUTES.get(self.path.split("?", 1)[0])
+        if route is None:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._send_error(404, f"Unsupported path {self.path}, expected any of: {sorted(self.ROUTES)}")
+            return
+
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            self._send_error(411, "Content-Length is required")
+            return
+        length = int(length)
+        if length > self.server.max_body_size:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._send_error(413, f"Request body cannot be larger than {self.server.max_body_size} bytes, recieved: {length}")
+            return
+        getattr(self, route)(length)
+
+
+    def log_message(self, format, *args):
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+
+    def _tax(self, length: int):
+        try:
+            record = json.loads(self.rfile.read(length))
+            if not isinstance(record, dict):
+                raise ValueError(f"Expected a JSON object of TaxHandler arguments, recieved: {type(record).__name__}")
+            data = self._dumps(self.server.compute(record))
+        except Exception as e:
+            # Any household that cannot be calculated is refused, rather than dropping the connection
+            self._send_error(400, self._message(e))
+            return
+        self._send(200, data)
+
+
+    def _tax_batch(self, length: int):
+        if self.headers.get_content_type() in NDJSON_CONTENT_TYPES:
+            records = self._ndjson_records(length)
+        else:
+            try:
+                records = json.loads(self.rfile.read(length))
+                if not isinstance(records, list):
+                    raise ValueError(f"Expected a JSON array of households, recieved: {type(records).__name__}")
+            except ValueError as e:
+                self._send_error(400, self._message(e))
+                return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        lines = []
+        size = 0
+        for index, record in enumerate(records):
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                if not isinstance(record, dict):
+                    raise ValueError(f"Expected a JSON object of TaxHandler arguments, recieved: {type(record).__name__}")
+                line = self._dumps(self.server.compute(record))
+            except Exception as e:
+                # One household that cannot be calculated must not cut short the stream of those after it
+                line = self._dumps({"index": index, "error": self._message(e)})
+            lines.append(line)
+            size += len(line) + 1
+            if size >= CHUNK_SIZE:
+                self._write_chunk(lines)
+                lines, size = [], 0
+        if lines:
+            self._write_chunk(lines)
+        self.wfile.write(b"0\r\n\r\n")
+
+
+    def _ndjson_records(self, length: int):
+        # Parses each line as it arrives, so a large batch is calculated while it is still being sent
+        remaining = length
+        while remaining > 0:
+            line = self.rfile.readline(remaining)
+            if not line:
+                break
+            remaining -= len(line)
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    yield e
+
+
+    def _write_chunk(self, lines: list):
+        data = b"\n".join(lines) + b"\n"
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+
+    @staticmethod
+    def _dumps(body):
+        # NaN and Infinity are not JSON, so a summary holding them is an error rather than an invalid response
+        return json.dumps(body, allow_nan=False).encode()
+
+
+    def _send_json(self, status: int, body):
+        self._send(status, self._dumps(body))
+
+
+    def _send(self, status: int, data: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def _send_error(self, status: int, message: str):
+        self._send_json(status, {"error": message})
+
+
+    @staticmethod
+    def _message(error: Exception):
+        if isinstance(error, KeyError):
+            return f"Missing key {error}"
+        return str(error)
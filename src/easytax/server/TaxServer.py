@@ -0,0 +1,47 @@
+# Standard Library Imports
+from http.server import ThreadingHTTPServer
+
+# Local Imports
+from ..handler.TaxEngine import TaxEngine
+from .TaxRequestHandler import TaxRequestHandler
+
+
+class TaxServer(ThreadingHTTPServer):
+
+    """
+    An HTTP server calculating taxes with one TaxEngine shared by every connection's thread.
+
+    The engine resolves every supported tax bracket table when the server is created, so no request pays to load one.
+    See TaxRequestHandler for the endpoints.
+    """
+
+    # Connection threads do not keep the process alive once serve_forever returns
+    daemon_threads = True
+
+    # Requests with a larger body are refused, rather than read into memory
+    MAX_BODY_SIZE = 64 * 2**20
+
+    def __init__(self, server_address: tuple, engine: TaxEngine | None = None, max_body_size: int = MAX_BODY_SIZE, access_log: bool = False):
+        """Create a TaxServer object, bound and listening on server_address.
+
+        Keyword arguments:
+        server_address: tuple - The (host, port) to listen on. Port 0 picks a free port.
+        engine: TaxEngine - The engine to calculate with. Defaults to a new one.
+        max_body_size: int - The largest request body accepted, in bytes
+        access_log: bool - Whether to log every request to stderr
+        """
+        self.engine = TaxEngine() if engine is None else engine
+        self.engine.preload()
+        self.max_body_size = max_body_size
+        self.access_log = access_log
+        super().__init__(server_address, TaxRequestHandler)
+        return
+
+
+    def compute(self, record: dict):
+        """Returns the summary_json of a household, given as a dict of TaxHandler arguments.
+
+        Keyword arguments:
+        record: dict - The tax_year, filing_status, state, incomes_adjustments_and_deductions and optional state_data of a household
+        """
+        return next(self.engine.compute_many((record,)))
@@ -0,0 +1,8 @@
+# The HTTP service. Its modules are imported on first use, so the CLI does not load http.server until it serves.
+from ..utils.LazyImport import lazy_submodules
+
+__all__ = [
+    "TaxRequestHandler",
+    "TaxServer",
+]
+__getattr__, __dir__ = lazy_submodules(__name__, __all__)
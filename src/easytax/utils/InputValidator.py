@@ -1,3 +1,6 @@
+# Standard Library Imports
+import math
+
 # Local Imports
 from ..utils.Constants import *
 
@@ -30,3 +33,20 @@ class InputValidator:
     def validate_region_does_not_have_any_tax(state):
         if state not in STATES_WITHOUT_INCOME_TAX:
             raise ValueError(f"state must be in STATES_WITHOUT_INCOME_TAX: {InputValidator.alphabetize_set(STATES_WITHOUT_INCOME_TAX)}, got: {state}")
+
+    @staticmethod
+    def validate_household(incomes_adjustments_and_deductions, state_data):
+        # Checks the shape of a household, so input such as decoded JSON of the wrong shape is refused with a TypeError
+        if not isinstance(incomes_adjustments_and_deductions, (list, tuple)):
+            raise TypeError(f"incomes_adjustments_and_deductions must be a list of dicts, got: {type(incomes_adjustments_and_deductions).__name__}")
+        if not incomes_adjustments_and_deductions:
+            raise ValueError("incomes_adjustments_and_deductions must have at least one person")
+        for person in incomes_adjustments_and_deductions:
+            if not isinstance(person, dict):
+                raise TypeError(f"incomes_adjustments_and_deductions must be a list of dicts, got an item of type: {type(person).__name__}")
+            # Values such as 1e400 in JSON decode to inf, which would only come back as NaN or Infinity
+            for key, value in person.items():
+                if type(value) is float and not math.isfinite(value):
+                    raise ValueError(f"{key} must be a finite number, got: {value}")
+        if state_data is not None and not isinstance(state_data, dict):
+            raise TypeError(f"state_data must be a dict, got: {type(state_data).__name__}")
@@ -0,0 +1,22 @@
+# Standard Library Imports
+import sys
+
+
+def lazy_submodules(package: str, submodules: list[str]):
+    """Returns a module __getattr__ and __dir__ that import a package's submodules on first attribute access.
+
+    Keyword arguments:
+    package -- The __name__ of the package
+    submodules -- The names of the submodules to expose
+    """
+    def __getattr__(name):
+        if name in submodules:
+            # __import__ rather than importlib, which would itself add to the import time
+            __import__(f"{package}.{name}")
+            return sys.modules[f"{package}.{name}"]
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(submodules) | set(vars(sys.modules[package])))
+
+    return __getattr__, __dir__
@@ -1,18 +1,34 @@
-# Standard Library imports
-import sys
-import logging
+# The logging module, and the modules it imports, are a large share of easytax's import time.
+# They are only imported, and the stream handler only attached, when something is first logged.
+_logger = None
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO) # https://docs.python.org/3/library/logging.html#levels
 
-# Create a stream handler that writes log messages to stdout
-sh = logging.StreamHandler()
-sh.setLevel(logging.INFO)
+def get_logger():
+    """Returns the easytax logger, creating it and attaching its stream handler on first use."""
+    global _logger
+    if _logger is None:
+        # Standard Library imports
+        import logging
 
-# Create a formatter
-formatter = logging.Formatter('[[%(asctime)s - %(levelname)s]] - %(message)s')
-sh.setFormatter(formatter)
+        logger = logging.getLogger(__name__)
+        logger.setLevel(logging.INFO) # https://docs.python.org/3/library/logging.html#levels
 
-# Add the handler to the logger
-logger.addHandler(sh)
-sh = logging.StreamHandler(sys.stderr)
+        # Create a stream handler that writes log messages to stderr
+        sh = logging.StreamHandler()
+        sh.setLevel(logging.INFO)
+
+        # Create a formatter
+        formatter = logging.Formatter('[[%(asctime)s - %(levelname)s]] - %(message)s')
+        sh.setFormatter(formatter)
+
+        # Add the handler to the logger
+        logger.addHandler(sh)
+        _logger = logger
+    return _logger
+
+
+def __getattr__(name):
+    # Keeps `from easytax.utils.Logger import logger` working, configured on first access
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
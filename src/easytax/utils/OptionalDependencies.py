@@ -0,0 +1,7 @@
+def import_numpy():
+    """Import numpy, which is only required by the batch calculation APIs."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("numpy is required for batch calculations. Install it with: python3 -m pip install easytax[numpy]") from e
+    return numpy
@@ -0,0 +1,164 @@
+# Reasons a record's keys are rejected
+MISSING_FIELD = "missing_field"
+UNSUPPORTED_FIELD = "unsupported_field"
+
+
+class RecordSchema:
+
+    """
+    Builds objects, such as FederalIncomeHandlers, from dicts keyed by their constructor arguments.
+
+    The key set of a dict is checked once per distinct key signature, the keys in the order they appear. Every later
+    dict with that signature is copied straight into a positional argument list, without merging it into a dict of
+    defaults or unpacking keyword arguments.
+    """
+
+    # Bounds the signature cache, should every record arrive with its keys in a different order
+    MAX_SIGNATURES = 1024
+
+    def __init__(self, factory):
+        """Create a RecordSchema object from the signature of a class's __init__.
+
+        Keyword arguments:
+        factory -- The class to build. Its __init__ arguments without a default are required in every record.
+        """
+        init = factory.__init__
+        code = init.__code__
+        defaults = init.__defaults__ or ()
+
+        self.factory = factory
+        self.fields = code.co_varnames[1:code.co_argcount]
+        self.required = self.fields[:len(self.fields) - len(defaults)]
+        self.defaults = dict(zip(self.fields[len(self.required):], defaults))
+        self._defaults = (None,) * len(self.required) + defaults
+        self._positions = {field: position for position, field in enumerate(self.fields)}
+        self._plans = {}
+        return
+
+
+    def from_dict(self, data: dict, **fixed):
+        """Returns an object built from one record.
+
+        Keyword arguments:
+        data -- dict of constructor argument to value. Omitted arguments take their default.
+        fixed -- Arguments that override the record's, such as a tax year shared by every record
+        """
+        return self.factory(*self.arguments(data, fixed))
+
+
+    def from_records(self, records, **fixed):
+        """Returns a list of objects, one built from each record.
+
+        Keyword arguments:
+        records -- iterable of dicts of constructor argument to value
+        fixed -- Arguments that override every record's, such as a tax year shared by every record
+        """
+        factory = self.factory
+        arguments = self.arguments
+        return [factory(*arguments(data, fixed)) for data in records]
+
+
+    def columns(self, records, invalid: list | None = None, **fixed):
+        """Returns the number of records, and a dict of argument to a list of its value in every record, for building a columnar batch.
+
+        Arguments that are absent from every record are left out, apart from the required ones, so a batch can
+        treat them as omitted rather than as a column of defaults.
+
+        Keyword arguments:
+        records -- iterable of dicts of constructor argument to value
+        invalid -- A list to append (row, field, reason) to for each record with a missing or unsupported key, rather
+                   than raising. Those records' rows hold the defaults, and None for required fields.
+        fixed -- Arguments that override every record's. These are returned as-is rather than as a column.
+        """
+        fixed_keys = tuple(fixed)
+        columns = {}
+        rows = 0
+
+        def add_run(keys, run):
+            count = len(run)
+            # Consecutive records with the same signature are transposed together, a column at a time
+            plan = self._plans.get((keys, fixed_keys))
+            if plan is None:
+                problems = self.problems(keys, fixed_keys)
+                if problems and invalid is not None:
+                    invalid.extend((row, field, reason) for row in range(rows, rows + count) for field, reason in problems)
+                    run = ()
+                else:
+                    plan = self._compile((keys, fixed_keys))
+            if plan is not None:
+                for position, column in zip(plan, zip(*run)):
+                    columns.setdefault(position, [self._defaults[position]] * rows).extend(column)
+            end = rows + count
+            for position, column in columns.items():
+                column.extend([self._defaults[position]] * (end - len(column)))
+            return end
+
+        keys, run = None, []
+        for data in records:
+            if tuple(data) != keys:
+                if run:
+                    rows = add_run(keys, run)
+                keys, run = tuple(data), []
+            run.append(tuple(data.values()))
+        if keys is not None:
+            rows = add_run(keys, run)
+
+        result = {}
+        for position, field in enumerate(self.fields):
+            if field in fixed:
+                result[field] = fixed[field]
+            elif position in columns:
+                result[field] = columns[position]
+            elif field in self.required:
+                # Only reached when there are no records, as a record missing a required field fails to compile
+                result[field] = []
+        return rows, result
+
+
+    def arguments(self, data: dict, fixed: dict | None = None):
+        """Returns the positional constructor arguments for one record.
+
+        Keyword arguments:
+        data -- dict of constructor argument to value
+        fixed -- dict of arguments that override the record's
+        """
+        fixed = fixed or {}
+        signature = (tuple(data), tuple(fixed))
+        plan = self._plans.get(signature)
+        if plan is None:
+            plan = self._compile(signature)
+
+        arguments = list(self._defaults)
+        for position, value in zip(plan, data.values()):
+            arguments[position] = value
+        if fixed:
+            for position, value in zip(plan[len(data):], fixed.values()):
+                arguments[position] = value
+        return arguments
+
+
+    def problems(self, keys: tuple, fixed_keys: tuple = ()):
+        """Returns a list of (field, reason) for every required field missing from, and every unsupported key in, a key signature.
+
+        Keyword arguments:
+        keys -- The keys of a record
+        fixed_keys -- The keys of the fixed arguments
+        """
+        problems = [(field, MISSING_FIELD) for field in self.required if field not in keys and field not in fixed_keys]
+        problems.extend((key, UNSUPPORTED_FIELD) for key in keys + fixed_keys if key not in self._positions)
+        return problems
+
+
+    def _compile(self, signature: tuple):
+        # Validates a key signature, returning the position of each key's argument
+        keys, fixed_keys = signature
+        for field, reason in self.problems(keys, fixed_keys):
+            if reason == MISSING_FIELD:
+                raise ValueError(f"{' and '.join(self.required)} are required fields")
+            raise ValueError(f"Unsupported income for key {field}")
+
+        plan = tuple(self._positions[key] for key in keys + fixed_keys)
+        if len(self._plans) >= self.MAX_SIGNATURES:
+            self._plans.clear()
+        self._plans[signature] = plan
+        return plan
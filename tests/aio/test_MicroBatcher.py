@@ -0,0 +1,136 @@
+# Standard Library Imports
+import asyncio
+import gc
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Local Imports
+import src.easytax as easytax
+import src.easytax.aio as aio
+from src.easytax.aio.MicroBatcher import MicroBatcher
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+
+    # Records the size of every batch, and holds each one until released
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.batch_sizes = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def submit(self, function, requests):
+        self.batch_sizes.append(len(requests))
+        def held(requests):
+            self.release.wait()
+            return function(requests)
+        return super().submit(held, requests)
+
+
+def household_builder(wages: float):
+    return [{"salaries_and_wages": wages, "long_term_capital_gains": wages / 10}]
+
+
+class TestMicroBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_matches_compute(self):
+        async with MicroBatcher() as batcher:
+            results = await asyncio.gather(*(batcher.estimate(household_builder(wages), 2024, SINGLE, GEORGIA, SUPPORTED_STATE_DATA) for wages in range(0, 500000, 5000)))
+        self.assertEqual(results, [easytax.compute(household_builder(wages), 2024, SINGLE, GEORGIA, SUPPORTED_STATE_DATA) for wages in range(0, 500000, 5000)])
+
+    async def test_requests_are_batched(self):
+        executor = RecordingExecutor()
+        async with MicroBatcher(max_batch_size=8, executor=executor) as batcher:
+            # A lone request is calculated straight away
+            await batcher.estimate(household_builder(1000), 2024, SINGLE, FLORIDA)
+            self.assertEqual(executor.batch_sizes, [1])
+
+            # Requests arriving while a batch runs are gathered into the next ones, up to max_batch_size
+            executor.release.clear()
+            tasks = [asyncio.ensure_future(batcher.estimate(household_builder(wages), 2024, SINGLE, FLORIDA)) for wages in range(20)]
+            await asyncio.sleep(0.01)
+            executor.release.set()
+            await asyncio.gather(*tasks)
+        self.assertEqual(executor.batch_sizes, [1, 8, 8, 4])
+        executor.shutdown()
+
+    async def test_deadline(self):
+        executor = RecordingExecutor()
+        async with MicroBatcher(max_delay=0.05, executor=executor) as batcher:
+            first = asyncio.ensure_future(batcher.estimate(household_builder(1000), 2024, SINGLE, FLORIDA))
+            await asyncio.sleep(0.01)
+            second = asyncio.ensure_future(batcher.estimate(household_builder(2000), 2024, SINGLE, FLORIDA))
+            await asyncio.gather(first, second)
+        self.assertEqual(executor.batch_sizes, [2])
+        executor.shutdown()
+
+    async def test_errors_fail_only_their_request(self):
+        async with MicroBatcher() as batcher:
+            valid, invalid = await asyncio.gather(
+                batcher.estimate(household_builder(1000), 2024, SINGLE, FLORIDA),
+                batcher.estimate(household_builder(1000), 2019, SINGLE, FLORIDA),
+                return_exceptions=True)
+        self.assertEqual(valid, easytax.compute(household_builder(1000), 2024, SINGLE, FLORIDA))
+        self.assertIsInstance(invalid, ValueError)
+
+    async def test_backpressure(self):
+        executor = RecordingExecutor()
+        executor.release.clear()
+        batcher = MicroBatcher(max_batch_size=1, max_pending=2, executor=executor)
+        tasks = [asyncio.ensure_future(batcher.estimate(household_builder(wages), 2024, SINGLE, FLORIDA)) for wages in range(5)]
+        await asyncio.sleep(0.01)
+
+        # One request is running, two are queued, and the rest wait for room in the queue
+        self.assertEqual(executor.batch_sizes, [1])
+        self.assertTrue(batcher._queue.full())
+        executor.release.set()
+        await asyncio.gather(*tasks)
+        await batcher.close()
+        executor.shutdown()
+
+    async def test_close(self):
+        batcher = MicroBatcher()
+        await batcher.close()
+        with self.assertRaisesRegex(RuntimeError, "MicroBatcher is closed"):
+            await batcher.estimate(household_builder(1000), 2024, SINGLE, FLORIDA)
+
+    async def test_estimate(self):
+        result = await aio.estimate(household_builder(1000), 2024, SINGLE, FLORIDA)
+        self.assertEqual(result, easytax.compute(household_builder(1000), 2024, SINGLE, FLORIDA))
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "max_batch_size must be at least 1, recieved: 0"):
+            MicroBatcher(max_batch_size=0)
+        with self.assertRaisesRegex(ValueError, "max_delay cannot be negative, recieved: -1"):
+            MicroBatcher(max_delay=-1)
+
+
+class TestEstimate(unittest.TestCase):
+
+    def test_loops_do_not_leak_threads(self):
+        async def run(wages):
+            return await aio.estimate(household_builder(wages), 2024, SINGLE, FLORIDA)
+
+        asyncio.run(run(1000))
+        threads = threading.active_count()
+        for wages in range(2000, 7000, 1000):
+            self.assertEqual(asyncio.run(run(wages)), easytax.compute(household_builder(wages), 2024, SINGLE, FLORIDA))
+        # Every loop's default MicroBatcher calculates on the same thread
+        self.assertEqual(threading.active_count(), threads)
+
+    def test_loops_are_not_kept(self):
+        async def run(wages):
+            return await aio.estimate(household_builder(wages), 2024, SINGLE, FLORIDA)
+
+        for wages in range(1000, 6000, 1000):
+            asyncio.run(run(wages))
+        gc.collect()
+        # The default MicroBatcher of a loop is dropped along with the loop once it shuts down
+        self.assertEqual(len(aio._batchers), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
 # Standard Library Imports
 import unittest
 
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Local Imports
 from src.easytax.base import FlatTax
 from src.easytax.base import FlatTaxBracket
@@ -22,5 +28,10 @@ class TestFlatTax(unittest.TestCase):
         # 50% of 5 -> 2.5
         self.assertTrue(self.pt.calculate_taxes(5) == 2.5)
 
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch(self):
+        taxes = self.pt.calculate_taxes_batch(numpy.array([-5, 0, 5]))
+        self.assertEqual(taxes.tolist(), [0, 0, 2.5])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,187 @@
+# Standard Library Imports
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.base import PiecewiseLinearTax
+from src.easytax.base import FlatTax
+from src.easytax.base import FlatTaxBracket
+from src.easytax.base import ProgressiveTax
+from src.easytax.base import ProgressiveTaxBracket
+
+
+class TestPiecewiseLinearTax(unittest.TestCase):
+
+    # 10% for first $10, 25% for $10-$50, and 50% for > $50
+    curve = PiecewiseLinearTax.PiecewiseLinearTax(
+        breakpoints = [0, 10, 50],
+        slopes = [0.1, 0.25, 0.5])
+
+    def test_init_accumulates_intercepts(self):
+        self.assertEqual(list(self.curve.intercepts), [0, 1, 11])
+
+    def test_init_failure_mismatched_slopes(self):
+        with self.assertRaises(ValueError) as cm:
+            PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [0, 10], slopes = [0.1])
+
+        expected_message = f"Recieved 1 slopes but expected one per breakpoint for the following breakpoints [0, 10]"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_init_failure_nonzero_start(self):
+        with self.assertRaises(ValueError) as cm:
+            PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [5, 10], slopes = [0.1, 0.2])
+
+        expected_message = f"breakpoints must start at 0, recieved: 5"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_init_failure_unsorted_breakpoints(self):
+        with self.assertRaises(ValueError) as cm:
+            PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [0, 50, 10], slopes = [0.1, 0.2, 0.3])
+
+        expected_message = f"breakpoints must be monotonically increasing. Recieved: [0, 50, 10]."
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_init_failure_negative_slope(self):
+        with self.assertRaises(ValueError) as cm:
+            PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [0, 10], slopes = [0.1, -0.2])
+
+        expected_message = f"slopes cannot be negative, recieved: -0.2"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_calculate_taxes(self):
+        self.assertEqual(self.curve.calculate_taxes(-5), 0)
+        self.assertEqual(self.curve.calculate_taxes(5), 0.5)
+        self.assertEqual(self.curve.calculate_taxes(10), 1)
+        self.assertEqual(self.curve.calculate_taxes(30), 6)
+        self.assertEqual(self.curve.calculate_taxes(100), 36)
+
+    def test_marginal_rate(self):
+        self.assertEqual(self.curve.marginal_rate(-5), 0)
+        self.assertEqual(self.curve.marginal_rate(0), 0.1)
+        self.assertEqual(self.curve.marginal_rate(5), 0.1)
+        # The next dollar past a threshold is taxed at the higher rate
+        self.assertEqual(self.curve.marginal_rate(10), 0.25)
+        self.assertEqual(self.curve.marginal_rate(50), 0.5)
+        self.assertEqual(self.curve.marginal_rate(100), 0.5)
+
+    def test_effective_rate(self):
+        self.assertEqual(self.curve.effective_rate(-5), 0)
+        self.assertEqual(self.curve.effective_rate(0), 0)
+        self.assertEqual(self.curve.effective_rate(5), 0.1)
+        # 36 / 100 -> 0.36
+        self.assertEqual(self.curve.effective_rate(100), 0.36)
+
+    def test_calculate_taxes_on_slice(self):
+        # (5*0.1) -> 0.5
+        self.assertEqual(self.curve.calculate_taxes_on_slice(0, 5), 0.5)
+        # (5*0.1) + (40*0.25) + (10*0.5) -> 0.5 + 10 + 5 -> 15.5
+        self.assertEqual(self.curve.calculate_taxes_on_slice(5, 60), 15.5)
+        # Only the positive part of a slice is taxed
+        self.assertEqual(self.curve.calculate_taxes_on_slice(-20, 10), 1)
+        self.assertEqual(self.curve.calculate_taxes_on_slice(-20, -10), 0)
+        # A negative slice reduces the tax
+        self.assertEqual(self.curve.calculate_taxes_on_slice(60, 5), -15.5)
+
+    def test_calculate_taxes_on_slice_matches_difference(self):
+        incomes = [-10, 0, 3, 10, 25, 50, 75, 200]
+        for lower in incomes:
+            for upper in incomes:
+                expected = self.curve.calculate_taxes(upper) - self.curve.calculate_taxes(lower)
+                self.assertAlmostEqual(self.curve.calculate_taxes_on_slice(lower, upper), expected)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_on_slice_batch(self):
+        incomes = [-10, 0, 3, 10, 25, 50, 75, 200]
+        lower = numpy.repeat(incomes, len(incomes))
+        upper = numpy.tile(incomes, len(incomes))
+        taxes = self.curve.calculate_taxes_on_slice_batch(lower, upper)
+        for l, u, tax in zip(lower.tolist(), upper.tolist(), taxes.tolist()):
+            self.assertAlmostEqual(tax, self.curve.calculate_taxes_on_slice(l, u))
+
+    def test_inverse(self):
+        self.assertEqual(self.curve.inverse(-5), 0)
+        self.assertEqual(self.curve.inverse(0), 0)
+        self.assertEqual(self.curve.inverse(0.5), 5)
+        self.assertEqual(self.curve.inverse(1), 10)
+        self.assertEqual(self.curve.inverse(6), 30)
+        self.assertEqual(self.curve.inverse(36), 100)
+
+    def test_inverse_flat_segment(self):
+        # Nothing owed on the first $10, and at most $5 owed overall
+        curve = PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [0, 10, 20], slopes = [0, 0.5, 0])
+        self.assertEqual(curve.inverse(2.5), 15)
+        self.assertEqual(curve.inverse(5), 20)
+
+        with self.assertRaises(ValueError) as cm:
+            curve.inverse(6)
+
+        expected_message = f"No income owes 6 in taxes, the most that can be owed is 5.0"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_gross_up(self):
+        self.assertEqual(self.curve.gross_up(-5), -5)
+        self.assertEqual(self.curve.gross_up(0), 0)
+        # 5 - 0.5 -> 4.5
+        self.assertEqual(self.curve.gross_up(4.5), 5)
+        # 30 - 6 -> 24
+        self.assertEqual(self.curve.gross_up(24), 30)
+        # 100 - 36 -> 64
+        self.assertEqual(self.curve.gross_up(64), 100)
+        for income in [1, 9.5, 10, 49.99, 50, 1000.25]:
+            self.assertAlmostEqual(self.curve.gross_up(income - self.curve.calculate_taxes(income)), income)
+
+    def test_gross_up_failure_rate_above_one(self):
+        curve = PiecewiseLinearTax.PiecewiseLinearTax(breakpoints = [0, 10], slopes = [0.5, 1.5])
+
+        with self.assertRaises(ValueError) as cm:
+            curve.gross_up(100)
+
+        expected_message = f"Cannot gross up when a marginal tax rate exceeds 100%, recieved: 1.5"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_shift(self):
+        shifted = self.curve.shift(20)
+        self.assertEqual(list(shifted.breakpoints), [0, 20, 30, 70])
+        self.assertEqual(shifted.calculate_taxes(20), 0)
+        self.assertEqual(shifted.calculate_taxes(50), 6)
+        self.assertEqual(shifted.calculate_taxes(120), 36)
+        self.assertIs(self.curve.shift(0), self.curve)
+
+    def test_shift_failure_negative_offset(self):
+        with self.assertRaises(ValueError) as cm:
+            self.curve.shift(-1)
+
+        expected_message = f"offset cannot be negative, recieved: -1"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_add(self):
+        flat = FlatTax.FlatTax(FlatTaxBracket.FlatTaxBracket(0.05))
+        progressive = ProgressiveTax.ProgressiveTax(ProgressiveTaxBracket.ProgressiveTaxBracket(
+            tax_rates = [0.1, 0.2],
+            income_thresholds = [30]))
+        total = self.curve + flat + progressive
+
+        self.assertEqual(list(total.breakpoints), [0, 10, 30, 50])
+        for income in [-5, 0, 5, 10, 20, 30, 40, 50, 100]:
+            expected = self.curve.calculate_taxes(income) + flat.calculate_taxes(income) + progressive.calculate_taxes(income)
+            self.assertAlmostEqual(total.calculate_taxes(income), expected)
+
+    def test_sum(self):
+        flat = FlatTax.FlatTax(FlatTaxBracket.FlatTaxBracket(0.05))
+        total = sum([self.curve, flat])
+        self.assertAlmostEqual(total.calculate_taxes(100), 41)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch(self):
+        incomes = [-5, 0, 5, 10, 30, 50, 100]
+        taxes = self.curve.calculate_taxes_batch(numpy.array(incomes))
+        self.assertEqual(taxes.tolist(), [self.curve.calculate_taxes(i) for i in incomes])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
 # Standard Library Imports
 import unittest
 
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Local Imports
 from src.easytax.base import ProgressiveTax
 from src.easytax.base import ProgressiveTaxBracket
@@ -18,6 +24,11 @@ class TestProgressiveTax(unittest.TestCase):
 
     pt = ProgressiveTax.ProgressiveTax(brackets)
 
+    def test_compiled_curve(self):
+        self.assertEqual(list(self.pt.breakpoints), [0, 10, 50])
+        self.assertEqual(list(self.pt.slopes), [0.1, 0.25, 0.5])
+        self.assertEqual(list(self.pt.intercepts), [0, 1, 11])
+
     def test_negative_income(self):
         self.assertTrue(self.pt.calculate_taxes(-5) == 0)
 
@@ -33,5 +44,25 @@ class TestProgressiveTax(unittest.TestCase):
         # (10*0.1) + (40*0.25) + (50*50)-> 1 + 10 + 25 -> 36
         self.assertTrue(self.pt.calculate_taxes(100) == 36)
 
+    def test_income_on_threshold(self):
+        # Income exactly on a threshold is taxed entirely at the lower brackets
+        # (10*0.1) -> 1
+        self.assertTrue(self.pt.calculate_taxes(10) == 1)
+        # (10*0.1) + (40*0.25) -> 1 + 10 -> 11
+        self.assertTrue(self.pt.calculate_taxes(50) == 11)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch(self):
+        incomes = [-5, 0, 5, 10, 30, 50, 100]
+        taxes = self.pt.calculate_taxes_batch(numpy.array(incomes))
+        self.assertEqual(taxes.tolist(), [0, 0, 0.5, 1, 6, 11, 36])
+        self.assertEqual(taxes.tolist(), [self.pt.calculate_taxes(i) for i in incomes])
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch_preserves_shape(self):
+        taxes = self.pt.calculate_taxes_batch([[5, 30], [50, 100]])
+        self.assertEqual(taxes.shape, (2, 2))
+        self.assertEqual(taxes.tolist(), [[0.5, 6], [11, 36]])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,12 @@
 # Standard Library Imports
 import unittest
 
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Local Imports
 from src.easytax.base import RegressiveTax
 from src.easytax.base import RegressiveTaxBracket
@@ -33,5 +39,24 @@ class TestRegressiveTax(unittest.TestCase):
         # (10*0.5) + (40*0.25) + (50*0)-> 5 + 10 -> 15
         self.assertTrue(self.pt.calculate_taxes(100) == 15)
 
+    def test_income_on_threshold(self):
+        # Income exactly on a threshold is taxed entirely at the lower brackets
+        # (10*0.5) -> 5
+        self.assertTrue(self.pt.calculate_taxes(10) == 5)
+        # (10*0.5) + (40*0.25) -> 5 + 10 -> 15
+        self.assertTrue(self.pt.calculate_taxes(50) == 15)
+
+    def test_marginal_rate(self):
+        self.assertEqual(self.pt.marginal_rate(5), 0.5)
+        self.assertEqual(self.pt.marginal_rate(30), 0.25)
+        self.assertEqual(self.pt.marginal_rate(100), 0)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch(self):
+        incomes = [-5, 0, 5, 10, 30, 50, 100]
+        taxes = self.pt.calculate_taxes_batch(numpy.array(incomes))
+        self.assertEqual(taxes.tolist(), [0, 0, 2.5, 5, 10, 15, 15])
+        self.assertEqual(taxes.tolist(), [self.pt.calculate_taxes(i) for i in incomes])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+# Standard Library Imports
+import pickle
+import unittest
+
+# Local Imports
+from src.easytax.base.ProgressiveTax import ProgressiveTax
+from src.easytax.base.ProgressiveTaxBracket import ProgressiveTaxBracket
+from src.easytax.base.FlatTax import FlatTax
+from src.easytax.brackets.BracketRegistry import BracketRegistry, progressive, flat
+from src.easytax.brackets import MedicareIncomeTaxBrackets
+from src.easytax.brackets.states import GeorgiaStateIncomeTaxBrackets
+from src.easytax.utils.Constants import *
+
+
+class TestBracketRegistry(unittest.TestCase):
+
+    def registry_builder(self):
+        registry = BracketRegistry()
+        brackets = registry.register("Example", {
+            2024: {
+                SINGLE: progressive(tax_rates = [0.1, 0.2], income_thresholds = [100]),
+                MARRIED_FILING_JOINTLY: progressive(tax_rates = [0.1, 0.2], income_thresholds = [200]),
+            },
+            2025: {
+                SINGLE: progressive(tax_rates = [0.1, 0.2], income_thresholds = [100]),
+            },
+        })
+        return registry, brackets
+
+    def test_lazy_materialization(self):
+        registry, brackets = self.registry_builder()
+        self.assertFalse(registry.is_materialized("Example", 2024, SINGLE))
+
+        # Checking support does not build anything
+        self.assertTrue(2024 in brackets)
+        self.assertTrue(SINGLE in brackets[2024])
+        self.assertFalse(registry.is_materialized("Example", 2024, SINGLE))
+
+        tax = brackets[2024][SINGLE]
+        self.assertIsInstance(tax, ProgressiveTax)
+        self.assertEqual(tax.calculate_taxes(150), 20)
+        self.assertTrue(registry.is_materialized("Example", 2024, SINGLE))
+        self.assertFalse(registry.is_materialized("Example", 2024, MARRIED_FILING_JOINTLY))
+
+    def test_memoized(self):
+        registry, brackets = self.registry_builder()
+        self.assertIs(brackets[2024][SINGLE], brackets[2024][SINGLE])
+        self.assertIs(brackets[2024][SINGLE], registry.get("Example", 2024, SINGLE))
+
+    def test_identical_schedules_interned(self):
+        registry, brackets = self.registry_builder()
+        self.assertIs(brackets[2024][SINGLE], brackets[2025][SINGLE])
+        self.assertIsNot(brackets[2024][SINGLE], brackets[2024][MARRIED_FILING_JOINTLY])
+        self.assertIs(registry.intern(flat(0.0)), registry.intern(flat(0.0)))
+        self.assertIsInstance(registry.intern(flat(0.0)), FlatTax)
+
+    def test_mapping_interface(self):
+        _, brackets = self.registry_builder()
+        self.assertEqual(list(brackets), [2024, 2025])
+        self.assertEqual(len(brackets[2024]), 2)
+        self.assertFalse(2020 in brackets)
+        with self.assertRaises(KeyError):
+            brackets[2020]
+
+    def test_get_failure_unsupported(self):
+        registry, _ = self.registry_builder()
+
+        with self.assertRaises(ValueError) as cm:
+            registry.get("Example", 2020, SINGLE)
+
+        expected_message = f"Unsupported combination of status: {SINGLE}, year 2020, jurisdiction: Example"
+        self.assertEqual(str(cm.exception), expected_message)
+
+    def test_shipped_schedules_interned(self):
+        # The Medicare schedule is the same every year
+        self.assertIs(MedicareIncomeTaxBrackets.brackets[2022], MedicareIncomeTaxBrackets.brackets[2025])
+        # Georgia's flat tax is the same for every filing status
+        self.assertIs(GeorgiaStateIncomeTaxBrackets.brackets[2025][SINGLE], GeorgiaStateIncomeTaxBrackets.brackets[2025][MARRIED_FILING_JOINTLY])
+
+    def test_pickled_as_spec(self):
+        # Unpickles into the interned Tax rather than a copy of it
+        medicare = MedicareIncomeTaxBrackets.brackets[2024]
+        self.assertIs(pickle.loads(pickle.dumps(medicare)), medicare)
+
+        # Taxes that were not interned are pickled as they are
+        tax = ProgressiveTax(ProgressiveTaxBracket(tax_rates = [0.1, 0.2], income_thresholds = [100]))
+        unpickled = pickle.loads(pickle.dumps(tax))
+        self.assertIsNot(unpickled, tax)
+        self.assertEqual(unpickled.calculate_taxes(150), tax.calculate_taxes(150))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
 # Standard Library Imports
 import unittest
 
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Local Imports
 from src.easytax.brackets.FederalIncomeTaxBrackets import *
 
@@ -47,6 +53,14 @@ class TestFederalincomeTaxBracket(unittest.TestCase):
         self.assertEqual(brackets[2022][MARRIED_FILING_SEPARATELY].calculate_taxes(100), 10)
         self.assertEqual(brackets[2022][MARRIED_FILING_SEPARATELY].calculate_taxes(100 * 1000), 17835.5)
 
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_calculate_taxes_batch_matches_scalar(self):
+        incomes = numpy.linspace(-1000, 1000000, 10001)
+        for year in brackets:
+            for filing_status in brackets[year]:
+                tax = brackets[year][filing_status]
+                self.assertEqual(tax.calculate_taxes_batch(incomes).tolist(), [tax.calculate_taxes(i) for i in incomes.tolist()])
+
 
 if __name__ == '__main__':
     unittest.main()
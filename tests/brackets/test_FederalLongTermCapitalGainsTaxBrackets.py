@@ -18,6 +18,13 @@ class TestFederalincomeTaxBracket(unittest.TestCase):
         self.assertEqual(brackets[2025][MARRIED_FILING_JOINTLY].calculate_taxes(96700), 0)
         self.assertEqual(brackets[2025][MARRIED_FILING_JOINTLY].calculate_taxes(100000), 495)
 
+    def test_2025_ltcg_slice(self):
+        """Gains are taxed as a slice stacked on top of ordinary taxable income."""
+        # $40,000 of income + $20,000 of gains: $8,350 at 0% and $11,650 at 15% = $1,747.50
+        self.assertEqual(brackets[2025][SINGLE].calculate_taxes_on_slice(40000, 60000), 1747.5)
+        # $500,000 of income + $100,000 of gains: $33,400 at 15% and $66,600 at 20% = $18,330
+        self.assertAlmostEqual(brackets[2025][SINGLE].calculate_taxes_on_slice(500000, 600000), 18330)
+
     def test_married_filing_jointly_2023_tax(self):
         self.assertEqual(brackets[2023][MARRIED_FILING_JOINTLY].calculate_taxes(-100), 0)
         self.assertEqual(brackets[2023][MARRIED_FILING_JOINTLY].calculate_taxes(0), 0)
@@ -0,0 +1,68 @@
+# Standard Library Imports
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.data.ParameterStore import ParameterStore, parameters, FEDERAL_STANDARD_DEDUCTION, NET_INVESTMENT_INCOME_THRESHOLD
+from src.easytax.utils.Constants import *
+
+
+class TestParameterStore(unittest.TestCase):
+
+    def store_builder(self):
+        return ParameterStore({
+            "Example": {
+                2023: {SINGLE: 100, MARRIED_FILING_JOINTLY: 200},
+                2025: {SINGLE: 150},
+            },
+        })
+
+    def test_get(self):
+        store = self.store_builder()
+        self.assertEqual(store.get("Example", 2023, SINGLE), 100)
+        self.assertEqual(store.get("Example", 2025, SINGLE), 150)
+        self.assertIsNone(store.get("Example", 2025, MARRIED_FILING_JOINTLY))
+        self.assertIsNone(store.get("Example", 2024, SINGLE))
+        self.assertIsNone(store.get("Missing", 2023, SINGLE))
+
+    def test_tax_years(self):
+        store = self.store_builder()
+        self.assertEqual(store.tax_years("Example"), {2023, 2025})
+        self.assertEqual(store.tax_years("Missing"), set())
+
+    def test_shared_store(self):
+        self.assertEqual(parameters.get(FEDERAL_STANDARD_DEDUCTION, 2025, MARRIED_FILING_JOINTLY), 31500)
+        self.assertEqual(parameters.get(NET_INVESTMENT_INCOME_THRESHOLD, 2024, HEAD_OF_HOUSEHOLD), 200000)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_gather(self):
+        store = self.store_builder()
+        self.assertEqual(store.gather("Example", [2023, 2023, 2025], [SINGLE, MARRIED_FILING_JOINTLY, SINGLE]).tolist(), [100, 200, 150])
+        self.assertEqual(store.gather("Example", [2023, 2025], SINGLE).tolist(), [100, 150])
+        self.assertEqual(store.gather("Example", 2023, SINGLE), 100)
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_gather_unsupported(self):
+        store = self.store_builder()
+        for tax_years, filing_statuses in [
+            ([2023, 2024], SINGLE),
+            ([2023, 2025], MARRIED_FILING_JOINTLY),
+            (2022, SINGLE),
+            (2026, SINGLE),
+            (2023, [SINGLE, HEAD_OF_HOUSEHOLD]),
+            (2023, "Not a status"),
+        ]:
+            with self.assertRaisesRegex(ValueError, "Unsupported combination of status"):
+                store.gather("Example", tax_years, filing_statuses)
+
+        with self.assertRaisesRegex(ValueError, "Unsupported parameter: Missing"):
+            store.gather("Missing", 2023, SINGLE)
+
+
+if __name__ == '__main__':
+    unittest.main()
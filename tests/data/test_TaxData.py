@@ -0,0 +1,177 @@
+# Standard Library Imports
+import json
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Local Imports
+from src.easytax.data import TaxData
+from src.easytax.utils.Constants import *
+
+
+class TestTaxData(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.snapshot = os.path.join(self.directory, TaxData.SNAPSHOT_NAME)
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        return
+
+    def copy_data(self):
+        # A writable copy of the data files, so a test can edit one
+        data_directory = os.path.join(self.directory, "data")
+        os.mkdir(data_directory)
+        for name in TaxData.BRACKET_TABLES + TaxData.PARAMETER_TABLES:
+            shutil.copy(os.path.join(TaxData.DATA_DIRECTORY, f"{name}.json"), data_directory)
+        return data_directory
+
+    def test_snapshot_round_trip(self):
+        TaxData.compile_snapshot(self.snapshot)
+        tables = TaxData._read_snapshot(self.snapshot, TaxData._fingerprint())
+        self.assertEqual(tables, TaxData._read_sources())
+
+        # Whole dollar amounts come back as ints
+        standard_deductions = tables[TaxData.PARAMETERS]["FederalStandardDeduction"]
+        self.assertEqual(standard_deductions[2025][MARRIED_FILING_JOINTLY], 31500)
+        self.assertIsInstance(standard_deductions[2025][MARRIED_FILING_JOINTLY], int)
+
+    def test_load_matches_sources(self):
+        sources = TaxData._read_sources()
+        self.assertEqual(TaxData.load_bracket_specs("FederalIncomeTaxBrackets"), sources[TaxData.BRACKETS]["FederalIncomeTaxBrackets"])
+        self.assertEqual(TaxData.load_parameter("CaliforniaStandardDeduction"), sources[TaxData.PARAMETERS]["CaliforniaStandardDeduction"])
+
+    def test_stale_snapshot_is_ignored(self):
+        TaxData.compile_snapshot(self.snapshot)
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, "a different fingerprint"))
+
+    def test_corrupt_snapshot_is_ignored(self):
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()))
+
+        with open(self.snapshot, "wb") as f:
+            f.write(b"not a snapshot")
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()))
+
+        TaxData.compile_snapshot(self.snapshot)
+        with open(self.snapshot, "r+b") as f:
+            f.truncate(64)
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()))
+
+        # Offsets that point past the end of the file
+        TaxData.compile_snapshot(self.snapshot)
+        with open(self.snapshot, "r+b") as f:
+            _, _, _, strings_length = TaxData._HEADER.unpack(f.read(TaxData._HEADER.size))
+            f.seek(TaxData._HEADER.size + strings_length + 8)
+            f.write(struct.pack("<I", 2**31))
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()))
+
+        # A file cut short part way through its values
+        TaxData.compile_snapshot(self.snapshot)
+        with open(self.snapshot, "r+b") as f:
+            f.truncate(os.path.getsize(self.snapshot) - 12)
+        self.assertIsNone(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()))
+
+    def test_snapshot_path(self):
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.directory}):
+            os.environ.pop("EASYTAX_CACHE_DIR", None)
+            path = TaxData.snapshot_path()
+            self.assertEqual(os.path.dirname(path), os.path.join(self.directory, "easytax"))
+            self.assertRegex(os.path.basename(path), r"^parameters-[0-9a-f]{8}\.bin$")
+
+            # Installs with different data directories do not share a snapshot
+            with mock.patch.object(TaxData, "DATA_DIRECTORY", os.path.join(self.directory, "data")):
+                self.assertNotEqual(TaxData.snapshot_path(), path)
+
+            os.environ["EASYTAX_CACHE_DIR"] = os.path.join(self.directory, "baked")
+            self.assertEqual(TaxData.snapshot_path(), os.path.join(self.directory, "baked", os.path.basename(path)))
+
+    def test_concurrent_writes(self):
+        errors = []
+
+        def compile_snapshot():
+            try:
+                TaxData.compile_snapshot(self.snapshot)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=compile_snapshot) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(self.directory), [TaxData.SNAPSHOT_NAME])
+        self.assertEqual(TaxData._read_snapshot(self.snapshot, TaxData._fingerprint()), TaxData._read_sources())
+
+    def test_unwritable_snapshot_is_not_fatal(self):
+        # A file where the cache directory should be, so the snapshot cannot be written
+        blocked = os.path.join(self.directory, "blocked")
+        open(blocked, "w").close()
+        with mock.patch.dict(os.environ, {"EASYTAX_CACHE_DIR": blocked}), mock.patch.object(TaxData, "_tables", None):
+            self.assertEqual(TaxData.load_parameters(), TaxData._read_sources()[TaxData.PARAMETERS])
+
+    def test_edited_data_invalidates_snapshot(self):
+        data_directory = self.copy_data()
+        with mock.patch.object(TaxData, "DATA_DIRECTORY", data_directory):
+            TaxData.compile_snapshot(self.snapshot)
+            fingerprint = TaxData._fingerprint()
+
+            path = os.path.join(data_directory, "FederalStandardDeductions.json")
+            with open(path) as f:
+                data = json.load(f)
+            data["parameters"]["FederalStandardDeduction"]["2026"] = {SINGLE: 16100}
+            with open(path, "w") as f:
+                json.dump(data, f)
+
+            self.assertNotEqual(TaxData._fingerprint(), fingerprint)
+            self.assertEqual(TaxData._read_sources()[TaxData.PARAMETERS]["FederalStandardDeduction"][2026][SINGLE], 16100)
+
+    def test_invalid_data(self):
+        data_directory = self.copy_data()
+        path = os.path.join(data_directory, "MedicareIncomeTaxBrackets.json")
+        with open(path) as f:
+            data = json.load(f)
+
+        invalid_schedules = [
+            {"kind": "progressive", "tax_rates": [0.0145, 0.0235], "income_thresholds": [200000, 100000]},
+            {"kind": "progressive", "tax_rates": [0.0145, "0.0235"], "income_thresholds": [200000]},
+            {"kind": "graduated", "tax_rates": [0.0145, 0.0235], "income_thresholds": [200000]},
+            {"kind": "flat"},
+        ]
+        with mock.patch.object(TaxData, "DATA_DIRECTORY", data_directory):
+            for schedule in invalid_schedules:
+                data["schedules"]["2025"] = schedule
+                with open(path, "w") as f:
+                    json.dump(data, f)
+                with self.assertRaisesRegex(ValueError, "Invalid tax data in MedicareIncomeTaxBrackets.json"):
+                    TaxData._read_sources()
+
+    def test_duplicate_parameter(self):
+        data_directory = self.copy_data()
+        path = os.path.join(data_directory, "CaliforniaStateTaxCredits.json")
+        with open(path) as f:
+            data = json.load(f)
+        data["parameters"]["FederalStandardDeduction"] = {"2025": {SINGLE: 1}}
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        with mock.patch.object(TaxData, "DATA_DIRECTORY", data_directory):
+            with self.assertRaisesRegex(ValueError, "FederalStandardDeduction is defined in more than one file"):
+                TaxData._read_sources()
+
+    def test_unsupported_table(self):
+        with self.assertRaises(ValueError):
+            TaxData.load_bracket_specs("FederalStandardDeductions")
+        with self.assertRaises(ValueError):
+            TaxData.load_parameter("FederalIncomeTaxBrackets")
+
+
+if __name__ == '__main__':
+    unittest.main()
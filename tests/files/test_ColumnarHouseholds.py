@@ -0,0 +1,143 @@
+# Standard Library Imports
+import json
+import os
+import random
+import tempfile
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.files.ColumnarHouseholds import ColumnarHouseholds
+from src.easytax.handler.TaxEngine import TaxEngine, BATCH_COLUMNS, EXEMPTIONS_NOT_GIVEN
+from src.easytax.utils.Constants import *
+
+
+def records_builder(count: int):
+    rng = random.Random(0)
+    records = []
+    for _ in range(count):
+        filing_status = rng.choice(sorted(SUPPORTED_FILING_STATUSES))
+        use_standard_deduction = rng.random() < 0.5
+        records.append({
+            "tax_year": rng.choice([2022, 2023, 2024]),
+            "filing_status": filing_status,
+            "state": rng.choice([GEORGIA, FLORIDA]),
+            "state_data": {"exemptions": rng.randint(0, 3)},
+            "incomes_adjustments_and_deductions": [{
+                "salaries_and_wages": rng.uniform(0, 400000),
+                "long_term_capital_gains": rng.uniform(0, 50000),
+                "taxes_paid": rng.uniform(0, 20000),
+                "use_standard_deduction": use_standard_deduction,
+            } for _ in range(1 if filing_status == SINGLE else rng.choice([1, 2]))],
+        })
+    return records
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestColumnarHouseholds(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "households")
+
+    def test_matches_compute(self):
+        records = records_builder(500)
+        households = ColumnarHouseholds.write(self.path, records)
+        self.assertEqual(len(households), 500)
+        self.assertEqual(households.rows, sum(len(record["incomes_adjustments_and_deductions"]) for record in records))
+        self.assertIsInstance(households.columns["salaries_and_wages"], numpy.memmap)
+
+        engine = TaxEngine()
+        taxes = ColumnarHouseholds(self.path).compute(engine)
+        for index, record in enumerate(records):
+            summary = engine.compute(**record)
+            self.assertAlmostEqual(taxes["total_tax_owed"][index], summary["total_tax_owed"], places=6)
+            self.assertAlmostEqual(taxes["social_security_tax_owed"][index], sum(summary["social_security"]["income_tax_owed"]), places=6)
+
+        # A range of households is the same as those households of the whole
+        part = households.compute(engine, 100, 250)
+        for name in BATCH_COLUMNS:
+            numpy.testing.assert_array_equal(part[name], taxes[name][100:250])
+        self.assertEqual(len(households.compute(engine, 500, 600)["total_tax_owed"]), 0)
+
+    def test_columns(self):
+        ColumnarHouseholds.write(self.path, [{"incomes_adjustments_and_deductions": [{"salaries_and_wages": 1000}]}],
+            tax_year=2024, filing_status=SINGLE, state=FLORIDA)
+        with open(os.path.join(self.path, "manifest.json")) as file:
+            manifest = json.load(file)
+        # Incomes no household gives are not stored
+        self.assertEqual(list(manifest["columns"]), ["household", "tax_year", "filing_status", "state", "exemptions", "salaries_and_wages"])
+        self.assertEqual(sorted(os.listdir(self.path)), sorted([f"{name}.bin" for name in manifest["columns"]] + ["manifest.json"]))
+        self.assertEqual((manifest["filing_statuses"], manifest["states"]), ([SINGLE], [FLORIDA]))
+
+        households = ColumnarHouseholds(self.path)
+        self.assertEqual(households.columns["tax_year"].tolist(), [2024])
+        self.assertEqual(households.columns["exemptions"].tolist(), [EXEMPTIONS_NOT_GIVEN])
+
+    def test_household_ids(self):
+        records = [("a", {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 1000}]}),
+            ("", {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 2000}, {"salaries_and_wages": 10}]}),
+            ("ü-3", {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 3000}]})]
+        households = ColumnarHouseholds.write(self.path, records, 2024, SINGLE, FLORIDA, household_ids=True)
+        self.assertEqual(households.household_ids(), ["a", "", "ü-3"])
+        self.assertEqual(ColumnarHouseholds(self.path).household_ids(1, 5), ["", "ü-3"])
+        self.assertEqual(households.household_ids(3), [])
+
+        # Written again without ids, none are left behind
+        households = ColumnarHouseholds.write(self.path, [record for _, record in records], 2024, SINGLE, FLORIDA)
+        self.assertIsNone(households.household_ids())
+        self.assertNotIn("household_id.bin", os.listdir(self.path))
+
+    def test_empty(self):
+        households = ColumnarHouseholds.write(self.path, [])
+        self.assertEqual((len(households), households.rows), (0, 0))
+        self.assertEqual(ColumnarHouseholds.write(self.path, [], household_ids=True).household_ids(), [])
+        self.assertEqual(len(households.compute()["total_tax_owed"]), 0)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "tax_year must be in SUPPORTED_TAX_YEARS"):
+            ColumnarHouseholds.write(self.path, [{"incomes_adjustments_and_deductions": [{"salaries_and_wages": 1}]}], filing_status=SINGLE, state=GEORGIA)
+        # An unfinished directory cannot be opened
+        with self.assertRaises(FileNotFoundError):
+            ColumnarHouseholds(self.path)
+        with self.assertRaisesRegex(ValueError, "Unsupported state_data key children in household 0"):
+            ColumnarHouseholds.write(self.path, [{"state_data": {"children": 1}, "incomes_adjustments_and_deductions": [{}]}], 2024, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(TypeError, "state_data specified invalid type for 'exemptions'"):
+            ColumnarHouseholds.write(self.path, [{"state_data": {"exemptions": 1.5}, "incomes_adjustments_and_deductions": [{}]}], 2024, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key income in household 1"):
+            ColumnarHouseholds.write(self.path, [{"incomes_adjustments_and_deductions": [{}]}, {"incomes_adjustments_and_deductions": [{"income": 1}]}], 2024, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(ValueError, "Household 0 has no incomes_adjustments_and_deductions"):
+            ColumnarHouseholds.write(self.path, [{"incomes_adjustments_and_deductions": []}], 2024, SINGLE, GEORGIA)
+
+        # Values are checked against their column's type, rather than rounded or wrapped into it
+        for person, error, message in [
+            ({"dependents": 1.5}, TypeError, "Unsupported type <class 'float'> for dependents in household 0"),
+            ({"dependents": 2**15}, ValueError, "dependents must be between -32768 and 32767, recieved: 32768, in household 0"),
+            ({"use_standard_deduction": 1}, TypeError, "Unsupported type <class 'int'> for use_standard_deduction in household 0"),
+            ({"salaries_and_wages": "1000"}, TypeError, "Unsupported income type <class 'str'> for salaries_and_wages in household 0"),
+        ]:
+            with self.assertRaisesRegex(error, message):
+                ColumnarHouseholds.write(self.path, [[person]], 2024, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(ValueError, "exemptions must be between -32767 and 32767, recieved: 40000, in household 0"):
+            ColumnarHouseholds.write(self.path, [{"state_data": {"exemptions": 40000}, "incomes_adjustments_and_deductions": [{}]}], 2022, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(TypeError, "incomes_adjustments_and_deductions must be a list of dicts, got an item of type: list, in household 0"):
+            ColumnarHouseholds.write(self.path, [{"incomes_adjustments_and_deductions": [["salaries_and_wages"]]}], 2024, SINGLE, GEORGIA)
+
+        ColumnarHouseholds.write(self.path, [], 2024, SINGLE, GEORGIA)
+        manifest_path = os.path.join(self.path, "manifest.json")
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        with open(manifest_path, "w") as file:
+            json.dump(dict(manifest, format_version=0), file)
+        with self.assertRaisesRegex(ValueError, "Unsupported format_version 0"):
+            ColumnarHouseholds(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+# Standard Library Imports
+import io
+import unittest
+
+# Local Imports
+from src.easytax.files.HouseholdReader import HouseholdReader, format_of, CSV, JSONL
+from src.easytax.utils.Constants import *
+
+
+def read(text: str, format: str = CSV):
+    return list(HouseholdReader(io.StringIO(text, newline=""), format))
+
+
+class TestHouseholdReader(unittest.TestCase):
+
+    def test_csv(self):
+        households = read(
+            "tax_year,filing_status,state,state_data.exemptions,salaries_and_wages,long_term_capital_gains,use_standard_deduction,dependents\n"
+            "2024,Single,Georgia,1,50000,1000.5,false,2\n"
+            "\n"
+            ",,,,,,,\n")
+        self.assertEqual(households, [
+            (None, {"tax_year": 2024, "filing_status": SINGLE, "state": GEORGIA, "state_data": {"exemptions": 1},
+                "incomes_adjustments_and_deductions": [{"salaries_and_wages": 50000.0, "long_term_capital_gains": 1000.5, "use_standard_deduction": False, "dependents": 2}]}),
+            # Empty cells take the defaults
+            (None, {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 0, "long_term_capital_gains": 0, "use_standard_deduction": True, "dependents": 0}]}),
+        ])
+
+    def test_household_ids(self):
+        households = read(
+            "household_id,filing_status,salaries_and_wages\n"
+            "a,Married_Filing_Jointly,150000\n"
+            "a,,100000\n"
+            "b,Single,50000\n"
+            ",Single,1\n"
+            ",Single,2\n"
+            "a,Single,3\n")
+        self.assertEqual(households, [
+            ("a", {"filing_status": MARRIED_FILING_JOINTLY, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 150000.0}, {"salaries_and_wages": 100000.0}]}),
+            ("b", {"filing_status": SINGLE, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 50000.0}]}),
+            # Rows without a household_id are alone, and only consecutive rows are grouped
+            ("", {"filing_status": SINGLE, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 1.0}]}),
+            ("", {"filing_status": SINGLE, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 2.0}]}),
+            ("a", {"filing_status": SINGLE, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 3.0}]}),
+        ])
+
+    def test_jsonl(self):
+        households = read('{"tax_year": 2024, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 1}]}\n\n{"incomes_adjustments_and_deductions": [{}]}\n', JSONL)
+        self.assertEqual(households, [
+            (None, {"tax_year": 2024, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 1}]}),
+            (None, {"incomes_adjustments_and_deductions": [{}]}),
+        ])
+
+    def test_is_lazy(self):
+        reader = iter(HouseholdReader(io.StringIO("salaries_and_wages\n1\nnot a number\n", newline="")))
+        self.assertEqual(next(reader), (None, {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 1.0}]}))
+        with self.assertRaisesRegex(ValueError, "Invalid salaries_and_wages on line 3, recieved: not a number"):
+            next(reader)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported column wages, expected any of: "):
+            read("wages\n1\n")
+        with self.assertRaisesRegex(ValueError, "salaries_and_wages is a required column"):
+            read("tax_year\n2024\n")
+        with self.assertRaisesRegex(ValueError, "Line 2 has 1 columns, expected: 2"):
+            read("tax_year,salaries_and_wages\n2024\n")
+        with self.assertRaisesRegex(ValueError, "Invalid use_standard_deduction on line 2, recieved: maybe"):
+            read("use_standard_deduction,salaries_and_wages\nmaybe,1\n")
+        with self.assertRaisesRegex(ValueError, "Invalid tax_year on line 2, recieved: 2024.5"):
+            read("tax_year,salaries_and_wages\n2024.5,1\n")
+        with self.assertRaisesRegex(ValueError, "Invalid JSON on line 2"):
+            read("{}\n{\n", JSONL)
+        with self.assertRaisesRegex(ValueError, "Expected a JSON object of TaxHandler arguments on line 1, recieved: list"):
+            read("[]\n", JSONL)
+        with self.assertRaisesRegex(ValueError, "incomes_adjustments_and_deductions must have at least one person, on line 2"):
+            read('{"incomes_adjustments_and_deductions": [{}]}\n{"incomes_adjustments_and_deductions": []}\n', JSONL)
+        with self.assertRaisesRegex(TypeError, "state_data must be a dict, got: list, on line 1"):
+            read('{"state_data": [1], "incomes_adjustments_and_deductions": [{}]}\n', JSONL)
+        with self.assertRaisesRegex(TypeError, "incomes_adjustments_and_deductions must be a list of dicts, got an item of type: list, on line 2"):
+            read('{"incomes_adjustments_and_deductions": [{}]}\n{"incomes_adjustments_and_deductions": [["salaries_and_wages"]]}\n', JSONL)
+        with self.assertRaisesRegex(ValueError, "Unsupported format xml"):
+            read("", "xml")
+
+    def test_format_of(self):
+        self.assertEqual(format_of("households.CSV", JSONL), CSV)
+        self.assertEqual(format_of("households.ndjson", CSV), "ndjson")
+        self.assertEqual(format_of("-", JSONL), JSONL)
+
+
+if __name__ == '__main__':
+    unittest.main()
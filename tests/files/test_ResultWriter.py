@@ -0,0 +1,76 @@
+# Standard Library Imports
+import csv
+import io
+import json
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.files.ResultWriter import ResultWriter, CSV_COLUMNS
+from src.easytax.handler.TaxEngine import TaxEngine, BATCH_COLUMNS
+from src.easytax.handler.TaxHandler import TaxHandler
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+
+
+class TestResultWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.summary = TaxHandler(SUPPORTED_TAX_YEAR, MARRIED_FILING_SEPARATELY, SUPPORTED_STATE, SUPPORTED_INCOMES, SUPPORTED_STATE_DATA).summary_json()
+
+    def test_csv(self):
+        file = io.StringIO(newline="")
+        writer = ResultWriter(file, "csv", household_ids=True)
+        writer.write(0, "a", self.summary)
+
+        header, row = file.getvalue().splitlines()
+        self.assertEqual(header.split(",")[:3], ["index", "household_id", "federal_income_tax_owed"])
+        values = dict(zip(header.split(","), row.split(",")))
+        self.assertEqual(values["household_id"], "a")
+        self.assertEqual(float(values["social_security_tax_owed"]), sum(self.summary["social_security"]["income_tax_owed"]))
+        self.assertEqual(float(values["total_tax_owed"]), self.summary["total_tax_owed"])
+
+    def test_ndjson(self):
+        file = io.StringIO(newline="")
+        ResultWriter(file, "ndjson").write(0, None, self.summary)
+        ResultWriter(file, "jsonl", household_ids=True).write(1, "b", self.summary)
+
+        first, second = [json.loads(line) for line in file.getvalue().splitlines()]
+        self.assertEqual(first, json.loads(json.dumps(self.summary)))
+        self.assertEqual(second, dict(first, household_id="b"))
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_write_batch(self):
+        taxes = TaxEngine().compute_batch(SUPPORTED_TAX_YEAR, SINGLE, FLORIDA, salaries_and_wages=[50000, 80000])
+        self.assertEqual(list(CSV_COLUMNS) + ["total_tax_owed"], list(BATCH_COLUMNS))
+
+        file = io.StringIO(newline="")
+        ResultWriter(file, "csv").write_batch(10, taxes)
+        rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+        self.assertEqual([row["index"] for row in rows], ["10", "11"])
+        self.assertEqual([float(row["total_tax_owed"]) for row in rows], taxes["total_tax_owed"].tolist())
+
+        file = io.StringIO(newline="")
+        ResultWriter(file, "ndjson").write_batch(10, taxes)
+        lines = [json.loads(line) for line in file.getvalue().splitlines()]
+        self.assertEqual(lines[1], dict({"index": 11}, **{name: taxes[name][1] for name in BATCH_COLUMNS}))
+
+        file = io.StringIO(newline="")
+        ResultWriter(file, "csv", household_ids=True).write_batch(10, taxes, ["a", "b"])
+        rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+        self.assertEqual([(row["index"], row["household_id"]) for row in rows], [("10", "a"), ("11", "b")])
+        with self.assertRaisesRegex(ValueError, "Expected a household_id for each of the 2 households, recieved: None"):
+            ResultWriter(io.StringIO(), "ndjson", household_ids=True).write_batch(10, taxes)
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported format xml"):
+            ResultWriter(io.StringIO(), "xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# Standard Library Imports
+import os
+import random
+import tempfile
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.files.ColumnarHouseholds import ColumnarHouseholds
+from src.easytax.handler.ParallelTaxEngine import ParallelTaxEngine
+from src.easytax.handler.TaxEngine import TaxEngine
+from src.easytax.handler.TaxHandler import TaxHandler
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+
+
+def households_builder(count: int):
+    rng = random.Random(0)
+    return [[{
+        "salaries_and_wages": rng.uniform(0, 400000),
+        "long_term_capital_gains": rng.uniform(0, 50000),
+    }] for _ in range(count)]
+
+
+class TestParallelTaxEngine(unittest.TestCase):
+
+    def test_matches_tax_engine(self):
+        households = households_builder(250)
+        expected = list(TaxEngine().compute_many(households, tax_year=2024, filing_status=SINGLE, state=GEORGIA, state_data=SUPPORTED_STATE_DATA))
+
+        with ParallelTaxEngine(max_workers=2, chunk_size=16) as engine:
+            summaries = list(engine.compute_many(households, tax_year=2024, filing_status=SINGLE, state=GEORGIA, state_data=SUPPORTED_STATE_DATA))
+        # repr compares the exact floats
+        self.assertEqual(repr(summaries), repr(expected))
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_compute_columnar(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "households")
+            households = ColumnarHouseholds.write(path, households_builder(250), tax_year=2024, filing_status=SINGLE, state=GEORGIA)
+            expected = households.compute()
+
+            with ParallelTaxEngine(max_workers=2) as engine:
+                chunks = list(engine.compute_columnar(path, chunk_size=64))
+        # Each worker maps the directory itself, so only ranges and taxes pass between processes
+        self.assertEqual([start for start, _ in chunks], [0, 64, 128, 192])
+        numpy.testing.assert_array_equal(numpy.concatenate([taxes["total_tax_owed"] for _, taxes in chunks]), expected["total_tax_owed"])
+
+    def test_unordered_results_have_record_ids(self):
+        households = households_builder(100)
+        expected = list(TaxEngine().compute_many(households, tax_year=2023, filing_status=SINGLE, state=FLORIDA))
+
+        with ParallelTaxEngine(max_workers=2, chunk_size=7) as engine:
+            results = list(engine.compute_many(iter(households), tax_year=2023, filing_status=SINGLE, state=FLORIDA, ordered=False))
+        self.assertEqual(sorted(index for index, _ in results), list(range(len(households))))
+        for index, summary in results:
+            self.assertEqual(summary, expected[index])
+
+    def test_tax_handler_compute_many(self):
+        households = households_builder(20)
+        summaries = TaxHandler.compute_many(households, tax_year=2024, filing_status=SINGLE, state=GEORGIA, state_data=SUPPORTED_STATE_DATA, max_workers=2)
+        self.assertEqual(list(summaries), [TaxHandler(2024, SINGLE, GEORGIA, household, SUPPORTED_STATE_DATA).summary_json() for household in households])
+
+    def test_empty(self):
+        with ParallelTaxEngine(max_workers=1) as engine:
+            self.assertEqual(list(engine.compute_many([], tax_year=2024, filing_status=SINGLE, state=GEORGIA)), [])
+
+    def test_errors(self):
+        with self.assertRaisesRegex(ValueError, "chunk_size must be at least 1, recieved: 0"):
+            ParallelTaxEngine(max_workers=1, chunk_size=0)
+
+        # The households before an invalid one are returned first
+        households = households_builder(10) + [[{"salaries_and_wages": "1"}]]
+        with ParallelTaxEngine(max_workers=2, chunk_size=3) as engine:
+            summaries = engine.compute_many(households, tax_year=2024, filing_status=SINGLE, state=FLORIDA)
+            for _ in range(10):
+                next(summaries)
+            with self.assertRaisesRegex(TypeError, "Unsupported income type"):
+                next(summaries)
+
+        # Unordered, every household before the invalid one is returned, whichever chunks finish first
+        households = households_builder(30)
+        households[10] = [{"salaries_and_wages": "1"}]
+        with ParallelTaxEngine(max_workers=2, chunk_size=3) as engine:
+            results = []
+            with self.assertRaisesRegex(TypeError, "Unsupported income type"):
+                for result in engine.compute_many(households, tax_year=2024, filing_status=SINGLE, state=FLORIDA, ordered=False):
+                    results.append(result)
+        self.assertTrue(set(range(10)) <= {index for index, _ in results})
+        self.assertNotIn(10, {index for index, _ in results})
+
+        # As is every household read before the records fail
+        def records():
+            yield from households_builder(10)
+            raise ValueError("Invalid record")
+
+        for ordered in [True, False]:
+            with ParallelTaxEngine(max_workers=2, chunk_size=3) as engine:
+                results = []
+                with self.assertRaisesRegex(ValueError, "Invalid record"):
+                    for result in engine.compute_many(records(), tax_year=2024, filing_status=SINGLE, state=FLORIDA, ordered=ordered):
+                        results.append(result)
+            self.assertEqual(len(results), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,260 @@
+# Standard Library Imports
+import itertools
+import random
+import unittest
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+import src.easytax as easytax
+from src.easytax.handler.TaxEngine import TaxEngine, BATCH_COLUMNS, EXEMPTIONS_NOT_GIVEN
+from src.easytax.handler.TaxHandler import TaxHandler
+from src.easytax.handler.TaxResult import TaxResult
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+
+
+class TestTaxEngine(unittest.TestCase):
+
+    def test_matches_tax_handler(self):
+        # Every supported tax year, filing status and state, so a rule changed in the handlers alone is caught here
+        rng = random.Random(0)
+        engine = TaxEngine()
+        for tax_year, filing_status, state in itertools.product(sorted(SUPPORTED_TAX_YEARS), sorted(SUPPORTED_FILING_STATUSES), sorted(SUPPORTED_STATES)):
+            for earners, use_standard_deduction in itertools.product([1] if filing_status == SINGLE else [1, 2], [False, True]):
+                incomes = [{
+                    "salaries_and_wages": rng.uniform(0, 500000),
+                    "long_term_capital_gains": rng.uniform(0, 100000),
+                    "interest_income": rng.uniform(0, 20000),
+                    "taxes_paid": rng.uniform(0, 30000),
+                    "use_standard_deduction": use_standard_deduction,
+                } for _ in range(earners)]
+                state_data = {"exemptions": 2}
+
+                expected = TaxHandler(tax_year, filing_status, state, incomes, state_data).summary_json()
+                # repr compares the exact floats
+                self.assertEqual(repr(engine.compute(incomes, tax_year, filing_status, state, state_data)), repr(expected),
+                    (tax_year, filing_status, state, earners, use_standard_deduction))
+
+    def test_compute_many(self):
+        households = [
+            SUPPORTED_INCOMES,
+            {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 80000}], "filing_status": SINGLE, "state": FLORIDA},
+            {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 80000}], "tax_year": 2022, "filing_status": SINGLE, "state_data": {"exemptions": 1}},
+        ]
+        summaries = TaxHandler.compute_many(households, tax_year=SUPPORTED_TAX_YEAR, filing_status=SUPPORTED_FILING_STATUS, state=SUPPORTED_STATE, state_data=SUPPORTED_STATE_DATA)
+
+        # A generator, so nothing is calculated until it is consumed
+        self.assertEqual(iter(summaries), summaries)
+        self.assertEqual(list(summaries), [
+            TaxHandler(SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_INCOMES, SUPPORTED_STATE_DATA).summary_json(),
+            TaxHandler(SUPPORTED_TAX_YEAR, SINGLE, FLORIDA, [{"salaries_and_wages": 80000}], SUPPORTED_STATE_DATA).summary_json(),
+            TaxHandler(2022, SINGLE, SUPPORTED_STATE, [{"salaries_and_wages": 80000}], {"exemptions": 1}).summary_json(),
+        ])
+
+    def test_brackets_are_resolved_once(self):
+        engine = TaxEngine()
+        list(engine.compute_many([[{"salaries_and_wages": wages}] for wages in range(0, 100000, 1000)], tax_year=2024, filing_status=SINGLE, state=GEORGIA))
+        self.assertEqual(list(engine._brackets), [(2024, SINGLE, GEORGIA)])
+
+    def test_result(self):
+        result = TaxEngine().result(SUPPORTED_INCOMES, SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_STATE_DATA)
+        expected = TaxHandler(SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_INCOMES, SUPPORTED_STATE_DATA)
+        self.assertEqual(result.summary_json(), expected.summary_json())
+        self.assertEqual(result.total_tax_owed, expected.total_tax)
+        self.assertEqual(result.federal.income_tax_owed, tuple(expected.federal_tax_owed))
+
+        # Built without a summary dict
+        with mock.patch.object(TaxResult, "from_summary_json", side_effect=AssertionError), mock.patch.object(TaxEngine, "compute", side_effect=AssertionError):
+            self.assertEqual(TaxEngine().result(SUPPORTED_INCOMES, SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_STATE_DATA), result)
+
+    def test_result_many(self):
+        households = [SUPPORTED_INCOMES, {"incomes_adjustments_and_deductions": [{"salaries_and_wages": 80000}], "filing_status": SINGLE, "state": FLORIDA}]
+        results = TaxEngine().result_many(households, tax_year=SUPPORTED_TAX_YEAR, filing_status=SUPPORTED_FILING_STATUS, state=SUPPORTED_STATE, state_data=SUPPORTED_STATE_DATA)
+        self.assertEqual(list(results), [
+            TaxHandler(SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_INCOMES, SUPPORTED_STATE_DATA).result(),
+            TaxHandler(SUPPORTED_TAX_YEAR, SINGLE, FLORIDA, [{"salaries_and_wages": 80000}], SUPPORTED_STATE_DATA).result(),
+        ])
+
+    def test_compute_from_threads(self):
+        rng = random.Random(0)
+        households = [[{"salaries_and_wages": rng.uniform(0, 400000), "long_term_capital_gains": rng.uniform(0, 50000)}] for _ in range(200)]
+        expected = [TaxHandler(2024, SINGLE, GEORGIA, household, SUPPORTED_STATE_DATA).summary_json() for household in households]
+
+        # Every thread shares the one engine behind easytax.compute
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda household: easytax.compute(household, 2024, SINGLE, GEORGIA, SUPPORTED_STATE_DATA), households))
+        self.assertEqual([result.summary_json() for result in results], expected)
+        # The inputs are only read
+        self.assertEqual(list(households[0][0]), ["salaries_and_wages", "long_term_capital_gains"])
+
+    def test_errors(self):
+        engine = TaxEngine()
+        with self.assertRaisesRegex(ValueError, "tax_year must be in SUPPORTED_TAX_YEARS"):
+            engine.compute([{"salaries_and_wages": 1}], 2019, SINGLE, GEORGIA)
+        with self.assertRaisesRegex(ValueError, "state must be in SUPPORTED_STATES"):
+            engine.compute([{"salaries_and_wages": 1}], 2024, SINGLE, "Atlantis")
+        with self.assertRaisesRegex(ValueError, "Unsupported number of incomes for MARRIED_FILING_JOINTLY"):
+            engine.compute([{"salaries_and_wages": 1}] * 3, 2024, MARRIED_FILING_JOINTLY, GEORGIA)
+        with self.assertRaisesRegex(ValueError, "Unsupported key income"):
+            list(engine.compute_many([{"income": []}], tax_year=2024, filing_status=SINGLE, state=GEORGIA))
+        # Only valid combinations are cached
+        self.assertEqual(list(engine._brackets), [(2024, MARRIED_FILING_JOINTLY, GEORGIA)])
+
+
+
+def batch_taxes_builder(summary: dict):
+    # The taxes compute_batch returns for a household, from its summary_json
+    taxes = [sum(summary[tax][amount]) for tax, amount in [
+        ("federal", "income_tax_owed"), ("federal", "long_term_capital_gains_tax_owed"),
+        ("state", "income_tax_owed"), ("state", "long_term_capital_gains_tax_owed"),
+        ("social_security", "income_tax_owed"), ("medicare", "income_tax_owed"), ("niit", "income_tax_owed")]]
+    return taxes + [summary["total_tax_owed"]]
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestTaxEngineBatch(unittest.TestCase):
+
+    def test_matches_compute(self):
+        rng = random.Random(0)
+        engine = TaxEngine()
+        for tax_year in sorted(SUPPORTED_TAX_YEARS):
+            for filing_status in sorted(SUPPORTED_FILING_STATUSES):
+                for state in [GEORGIA, FLORIDA]:
+                    households = []
+                    for household in range(50):
+                        use_standard_deduction = rng.random() < 0.5
+                        households.append(([{
+                            "salaries_and_wages": rng.uniform(0, 500000),
+                            "long_term_capital_gains": rng.uniform(0, 100000),
+                            "interest_income": rng.uniform(0, 20000),
+                            "taxes_paid": rng.uniform(0, 30000),
+                            "use_standard_deduction": use_standard_deduction,
+                        } for _ in range(rng.choice([1, 2]))], household % 4))
+
+                    people = [(household, person, exemptions) for household, (incomes, exemptions) in enumerate(households) for person in incomes]
+                    columns = {key: numpy.array([person[key] for _, person, _ in people]) for key in people[0][1]}
+                    taxes = engine.compute_batch(tax_year, filing_status, state,
+                        household=[household for household, _, _ in people], exemptions=[exemptions for _, _, exemptions in people], **columns)
+
+                    self.assertEqual(list(taxes), list(BATCH_COLUMNS))
+                    for household, (incomes, exemptions) in enumerate(households):
+                        expected = batch_taxes_builder(engine.compute(incomes, tax_year, filing_status, state, {"exemptions": exemptions}))
+                        numpy.testing.assert_allclose([taxes[name][household] for name in BATCH_COLUMNS], expected, rtol=1e-12, atol=1e-6)
+
+    def test_defaults(self):
+        engine = TaxEngine()
+        # Without household, every row is a household. Scalar columns are shared by every row.
+        taxes = engine.compute_batch(2023, SINGLE, GEORGIA, salaries_and_wages=[50000, 80000], taxes_paid=1000)
+        for household, wages in enumerate([50000, 80000]):
+            expected = batch_taxes_builder(engine.compute([{"salaries_and_wages": wages, "taxes_paid": 1000}], 2023, SINGLE, GEORGIA))
+            numpy.testing.assert_allclose([taxes[name][household] for name in BATCH_COLUMNS], expected)
+
+        self.assertEqual(len(engine.compute_batch(2024, SINGLE, FLORIDA, salaries_and_wages=[])["total_tax_owed"]), 0)
+
+    def test_exemptions_match_tax_handler(self):
+        # Negative exemptions are passed to Georgia's deduction as TaxHandler passes them, rather than taken as not given
+        engine = TaxEngine()
+        exemptions = [EXEMPTIONS_NOT_GIVEN, -2, 0, 3]
+        for tax_year in [2023, 2024]:
+            taxes = engine.compute_batch(tax_year, SINGLE, GEORGIA, exemptions=exemptions, salaries_and_wages=80000)
+            for household, exemption in enumerate(exemptions):
+                state_data = None if exemption == EXEMPTIONS_NOT_GIVEN else {"exemptions": exemption}
+                expected = TaxHandler(tax_year, SINGLE, GEORGIA, [{"salaries_and_wages": 80000}], state_data).summary_json()
+                self.assertAlmostEqual(taxes["state_income_tax_owed"][household], sum(expected["state"]["income_tax_owed"]), places=6)
+        # From 2024 there is no deduction, so TaxHandler does not read exemptions at all
+        engine.compute_batch(2024, SINGLE, GEORGIA, exemptions=[1.5], salaries_and_wages=[1])
+
+    def test_errors(self):
+        engine = TaxEngine()
+        with self.assertRaisesRegex(ValueError, "tax_year must be in SUPPORTED_TAX_YEARS"):
+            engine.compute_batch(2019, SINGLE, GEORGIA, salaries_and_wages=[1])
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key income"):
+            engine.compute_batch(2024, SINGLE, GEORGIA, income=[1])
+        with self.assertRaisesRegex(ValueError, "household must never decrease"):
+            engine.compute_batch(2024, SINGLE, GEORGIA, household=[1, 0], salaries_and_wages=[1, 2])
+        with self.assertRaisesRegex(ValueError, "Unsupported number of incomes for MARRIED_FILING_JOINTLY. Got '3', expected: '1' or '2'"):
+            engine.compute_batch(2024, MARRIED_FILING_JOINTLY, GEORGIA, household=[0, 0, 0], salaries_and_wages=[1, 2, 3])
+        with self.assertRaisesRegex(ValueError, "Cannot have differing use_standard_deduction when filing status is Married_Filing_Jointly, as in household 1"):
+            engine.compute_batch(2024, MARRIED_FILING_JOINTLY, GEORGIA, household=[0, 1, 1], use_standard_deduction=[True, True, False], salaries_and_wages=[1, 2, 3])
+        with self.assertRaisesRegex(TypeError, "state_data specified invalid type for 'exemptions'"):
+            engine.compute_batch(2022, SINGLE, GEORGIA, exemptions=[1.5], salaries_and_wages=[1])
+        with self.assertRaisesRegex(ValueError, "columns must be one-dimensional"):
+            engine.compute_batch(2024, SINGLE, GEORGIA, salaries_and_wages=[[1]])
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestTaxEngineSweep(unittest.TestCase):
+
+    def test_matches_compute(self):
+        engine = TaxEngine()
+        incomes = [
+            {"salaries_and_wages": 150000, "long_term_capital_gains": 20000, "taxes_paid": 12000, "use_standard_deduction": False},
+            {"salaries_and_wages": 90000, "long_term_capital_gains": 0, "taxes_paid": 3000, "use_standard_deduction": False},
+        ]
+        ira_deductions = [0, 3500, 7000]
+        charitable_contributions = [0, 10000, 50000]
+        exemptions = [0, 2]
+        for filing_status in [MARRIED_FILING_JOINTLY, MARRIED_FILING_SEPARATELY]:
+            axes = {
+                "ira_deductions": ira_deductions,
+                (1, "charitable_contributions"): charitable_contributions,
+                "tax_year": [2023, 2024],
+                ("state_data", "exemptions"): exemptions,
+            }
+            taxes = engine.sweep(incomes, axes, 2024, filing_status, GEORGIA)
+            self.assertEqual(list(taxes), list(BATCH_COLUMNS))
+            self.assertEqual(taxes["total_tax_owed"].shape, (3, 3, 2, 2))
+
+            for (i, ira), (j, charity), (k, tax_year), (l, exemption) in itertools.product(enumerate(ira_deductions),
+                    enumerate(charitable_contributions), enumerate([2023, 2024]), enumerate(exemptions)):
+                # TaxHandler combines married people field by field, so both are given every swept field
+                household = [dict(incomes[0], ira_deductions=ira, charitable_contributions=0), dict(incomes[1], ira_deductions=0, charitable_contributions=charity)]
+                expected = batch_taxes_builder(engine.compute(household, tax_year, filing_status, GEORGIA, {"exemptions": exemption}))
+                numpy.testing.assert_allclose([taxes[name][i, j, k, l] for name in BATCH_COLUMNS], expected, rtol=1e-12, atol=1e-6)
+
+    def test_unswept_fields_are_not_copied(self):
+        engine = TaxEngine()
+        incomes = [{"salaries_and_wages": 150000, "taxes_paid": 12000}, {"salaries_and_wages": 90000, "taxes_paid": 12000}]
+        compute_batch = engine.compute_batch
+        with mock.patch.object(engine, "compute_batch", wraps=compute_batch) as batch:
+            engine.sweep(incomes, {"ira_deductions": numpy.arange(1000.0)}, 2024, MARRIED_FILING_SEPARATELY, FLORIDA)
+        columns = batch.call_args.kwargs
+        # Fields the people share are one value broadcast to every row; fields they differ in are repeated per point
+        self.assertEqual(columns["taxes_paid"].strides, (0,))
+        self.assertEqual(columns["taxes_paid"].shape, (2000,))
+        self.assertEqual(list(columns["salaries_and_wages"][:4]), [150000, 90000, 150000, 90000])
+
+    def test_without_axes(self):
+        engine = TaxEngine()
+        incomes = [{"salaries_and_wages": 80000}]
+        taxes = engine.sweep(incomes, {}, 2024, SINGLE, FLORIDA)
+        self.assertEqual(taxes["total_tax_owed"].shape, ())
+        self.assertAlmostEqual(float(taxes["total_tax_owed"]), engine.compute(incomes, 2024, SINGLE, FLORIDA)["total_tax_owed"])
+        self.assertEqual(engine.sweep(incomes, {"salaries_and_wages": [], "state": [FLORIDA]}, 2024, SINGLE, FLORIDA)["total_tax_owed"].shape, (0, 1))
+
+    def test_errors(self):
+        engine = TaxEngine()
+        incomes = [{"salaries_and_wages": 80000}]
+        with self.assertRaisesRegex(ValueError, "Unsupported sweep axis \\(1, 'ira_deductions'\\)"):
+            engine.sweep(incomes, {(1, "ira_deductions"): [0]}, 2024, SINGLE, FLORIDA)
+        with self.assertRaisesRegex(ValueError, "Unsupported sweep axis \\(0, 'income'\\)"):
+            engine.sweep(incomes, {"income": [0]}, 2024, SINGLE, FLORIDA)
+        with self.assertRaisesRegex(ValueError, "Axis \\(0, 'ira_deductions'\\) is given more than once"):
+            engine.sweep(incomes, {"ira_deductions": [0], (0, "ira_deductions"): [1]}, 2024, SINGLE, FLORIDA)
+        with self.assertRaisesRegex(ValueError, "must be one-dimensional"):
+            engine.sweep(incomes, {"ira_deductions": [[0]]}, 2024, SINGLE, FLORIDA)
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key income"):
+            engine.sweep([{"income": 1}], {}, 2024, SINGLE, FLORIDA)
+        with self.assertRaisesRegex(ValueError, "state must be in SUPPORTED_STATES"):
+            engine.sweep(incomes, {"state": ["Atlantis"]}, 2024, SINGLE, FLORIDA)
+
+
+if __name__ == '__main__':
+    unittest.main()
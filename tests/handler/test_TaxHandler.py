@@ -1,4 +1,5 @@
 # Standard Library Imports
+import pickle
 import unittest
 
 # Local Imports
@@ -108,6 +109,73 @@ class TestTaxHandler(unittest.TestCase):
         self.assertEqual(taxHandler.medicare_tax_owed, [2175, 1450])
 
 
+    def test_marginal_rates_married_filling_jointly(self):
+        taxHandler = tax_handler_builder()
+
+        self.assertEqual(taxHandler.marginal_rates(), {
+            'federal': [0.24],  # 2023 brackets, $250,000 taxable
+            'federal_long_term_capital_gains': [0.15],  # $350,000 with gains stacked on top
+            'state': [0.0575],
+            'state_long_term_capital_gains': [0.0575],
+            'social_security': [0.062, 0.062],  # Both earners under the wage base
+            'medicare': [0.0145, 0.0145],
+            'niit': [0.038],
+        })
+
+    def test_marginal_rates_above_social_security_wage_base(self):
+        taxHandler = tax_handler_builder(filing_status=SINGLE, incomes=[{'salaries_and_wages': 300000}])
+
+        rates = taxHandler.marginal_rates()
+        self.assertEqual(rates['social_security'], [0])
+        self.assertEqual(rates['medicare'], [0.0235])
+
+
+    def test_taxes_are_calculated_lazily(self):
+        taxHandler = tax_handler_builder()
+
+        # Only the federal tax is calculated for the federal tax owed
+        self.assertEqual(taxHandler.federal_tax_owed, [46800])
+        self.assertIn('federalHander', vars(taxHandler))
+        for name in ['stateTaxHandler', 'socialSecurityTaxHandler', 'medicareTaxHandler', 'netInvestmentIncomeTaxHandler', 'total_tax']:
+            self.assertNotIn(name, vars(taxHandler))
+
+        # Results are cached, so calculating again does not rebuild any handler
+        federalHander = taxHandler.federalHander
+        total_tax = taxHandler.total_tax
+        taxHandler.calculate_taxes()
+        taxHandler.compute_total_tax()
+        self.assertIs(taxHandler.federalHander, federalHander)
+        self.assertEqual(taxHandler.total_tax, total_tax)
+        self.assertEqual(taxHandler.summary_json()['total_tax_owed'], total_tax)
+
+
+    def test_invalidate(self):
+        taxHandler = tax_handler_builder(filing_status=SINGLE, incomes=[{'salaries_and_wages': 100000}])
+        total_tax = taxHandler.total_tax
+
+        taxHandler.incomes_adjustments_and_deductions = [{'salaries_and_wages': 200000}]
+        self.assertEqual(taxHandler.total_tax, total_tax)
+
+        taxHandler.invalidate()
+        self.assertEqual(taxHandler.payroll_income_handlers[0].salaries_and_wages, 200000)
+        self.assertGreater(taxHandler.total_tax, total_tax)
+        self.assertEqual(taxHandler.total_tax, tax_handler_builder(filing_status=SINGLE, incomes=[{'salaries_and_wages': 200000}]).total_tax)
+
+        taxHandler.state = "Unsupported"
+        with self.assertRaises(ValueError):
+            taxHandler.invalidate()
+
+
+    def test_pickle(self):
+        taxHandler = tax_handler_builder()
+        summary = taxHandler.summary_json()
+
+        # Pickled as its arguments, without the handlers it has calculated, which are recalculated on access
+        pickled = pickle.dumps(taxHandler)
+        self.assertNotIn(b"federalHander", pickled)
+        self.assertEqual(pickle.loads(pickled).summary_json(), summary)
+
+
     def test_display_tax_summary_success(self):
 
         # This test should simply not throw errors
@@ -0,0 +1,93 @@
+# Standard Library Imports
+import pickle
+import unittest
+from unittest import mock
+
+# Local Imports
+import src.easytax as easytax
+from src.easytax.handler.IndividualTaxResult import IndividualTaxResult
+from src.easytax.handler.RegionalTaxResult import RegionalTaxResult
+from src.easytax.handler.TaxEngine import TaxEngine
+from src.easytax.handler.TaxResult import TaxResult
+from src.easytax.handler.TaxHandler import TaxHandler
+from tests.utils.TestContants import *
+
+
+def tax_handler_builder():
+    return TaxHandler(SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_INCOMES, SUPPORTED_STATE_DATA)
+
+
+class TestTaxResult(unittest.TestCase):
+
+    def test_from_summary_json(self):
+        summary = tax_handler_builder().summary_json()
+        result = TaxResult.from_summary_json(summary)
+
+        self.assertIsInstance(result.federal, RegionalTaxResult)
+        self.assertIsInstance(result.niit, IndividualTaxResult)
+        self.assertEqual(result.state.income_tax_owed, tuple(summary['state']['income_tax_owed']))
+        self.assertEqual(result.to_dict(), summary)
+        self.assertEqual(result.summary_json(), summary)
+
+    def test_tax_handler_result(self):
+        taxHandler = tax_handler_builder()
+        result = taxHandler.result()
+
+        self.assertIs(taxHandler.result(), result)
+        self.assertEqual(result, TaxResult.from_summary_json(taxHandler.summary_json()))
+        self.assertEqual(result.total_tax_owed, taxHandler.total_tax)
+        self.assertEqual(result.federal.income_tax_owed, tuple(taxHandler.federal_tax_owed))
+
+    def test_compute(self):
+        # easytax.compute builds its TaxResult from the calculated taxes, not by copying a summary dict
+        with mock.patch.object(TaxResult, "from_summary_json", side_effect=AssertionError), mock.patch.object(TaxEngine, "compute", side_effect=AssertionError):
+            result = easytax.compute(SUPPORTED_INCOMES, SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, SUPPORTED_STATE, SUPPORTED_STATE_DATA)
+        self.assertIsInstance(result, TaxResult)
+        self.assertEqual(result, tax_handler_builder().result())
+
+    def test_to_tuple(self):
+        result = tax_handler_builder().result()
+        federal, social_security, medicare, state, niit, total_tax_owed = result.to_tuple()
+
+        # The result's own tuples, not copies
+        self.assertIs(federal[2], result.federal.income_tax_owed)
+        self.assertIs(niit[0], result.niit.taxable_incomes)
+        self.assertEqual(social_security, (result.social_security.taxable_incomes, result.social_security.income_tax_owed))
+        self.assertEqual(state, result.state.to_tuple())
+        self.assertEqual(total_tax_owed, result.total_tax_owed)
+
+    def test_immutable(self):
+        result = tax_handler_builder().result()
+
+        with self.assertRaisesRegex(AttributeError, "TaxResult is immutable, cannot set 'total_tax_owed'"):
+            result.total_tax_owed = 0
+        with self.assertRaises(AttributeError):
+            result.not_a_field = 0
+        with self.assertRaisesRegex(AttributeError, "RegionalTaxResult is immutable"):
+            del result.federal.income_tax_owed
+        with self.assertRaises(TypeError):
+            result.federal.income_tax_owed[0] = 0
+        self.assertFalse(hasattr(result, '__dict__'))
+
+    def test_summaries_are_copies(self):
+        taxHandler = tax_handler_builder()
+        summary = taxHandler.summary_json()
+
+        # Changing a summary changes neither the handlers nor later summaries
+        taxHandler.summary_json()['federal']['income_tax_owed'][0] = 0
+        taxHandler.federalHander.summary_json()['taxable_incomes'].append(0)
+        self.assertEqual(taxHandler.summary_json(), summary)
+
+    def test_equal_hash_and_pickle(self):
+        result = tax_handler_builder().result()
+        copy = TaxResult.from_summary_json(result.to_dict())
+
+        self.assertEqual(copy, result)
+        self.assertEqual(hash(copy), hash(result))
+        self.assertNotEqual(result.federal, result.state.to_tuple())
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+        self.assertIn("RegionalTaxResult(taxable_incomes=", repr(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from src.easytax.handler import TaxHandler
+from src.easytax.handler import TotalTaxCurve
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+from src.easytax.utils.InputValidator import InputValidator
+
+
+WAGES = [-1000, 0, 5000, 13850, 27700, 50000, 100000, 160200, 168600, 176100, 200000, 250000, 500000, 750000, 2000000]
+
+
+class TestTotalTaxCurve(unittest.TestCase):
+
+    def assert_matches_tax_handler(self, tax_year, filing_status, state, state_data=None):
+        curve = TotalTaxCurve.TotalTaxCurve(tax_year, filing_status, state, state_data)
+        for wages in WAGES:
+            taxHandler = TaxHandler.TaxHandler(
+                tax_year=tax_year,
+                filing_status=filing_status,
+                state=state,
+                incomes_adjustments_and_deductions=[{'salaries_and_wages': wages}],
+                state_data=state_data,
+            )
+            self.assertAlmostEqual(curve.calculate_taxes(wages), taxHandler.total_tax, places=6, msg=f"{tax_year} {filing_status} {state} {wages}")
+
+    def test_matches_tax_handler_georgia(self):
+        for tax_year in SUPPORTED_TAX_YEARS:
+            for filing_status in SUPPORTED_FILING_STATUSES:
+                self.assert_matches_tax_handler(tax_year, filing_status, GEORGIA)
+
+    def test_matches_tax_handler_georgia_exemptions(self):
+        self.assert_matches_tax_handler(2023, SINGLE, GEORGIA, state_data={'exemptions': 2})
+
+    def test_matches_tax_handler_state_without_income_tax(self):
+        for tax_year in SUPPORTED_TAX_YEARS:
+            for filing_status in SUPPORTED_FILING_STATUSES:
+                self.assert_matches_tax_handler(tax_year, filing_status, SUPPORTED_STATE_WITHOUT_INCOME_TAX)
+
+    def test_components(self):
+        curve = TotalTaxCurve.TotalTaxCurve(2024, SINGLE, SUPPORTED_STATE_WITHOUT_INCOME_TAX)
+        # Nothing federal is owed within the standard deduction, but FICA is
+        self.assertEqual(curve.federal_tax_curve.calculate_taxes(14600), 0)
+        self.assertEqual(curve.state_tax_curve.calculate_taxes(100000), 0)
+        self.assertAlmostEqual(curve.calculate_taxes(14600), 14600 * (0.062 + 0.0145))
+
+    def test_gross_up(self):
+        curve = TotalTaxCurve.TotalTaxCurve(2025, MARRIED_FILING_JOINTLY, GEORGIA)
+        for net_income in [10000, 75000, 150000, 400000]:
+            wages = curve.gross_up(net_income)
+            taxHandler = TaxHandler.TaxHandler(
+                tax_year=2025,
+                filing_status=MARRIED_FILING_JOINTLY,
+                state=GEORGIA,
+                incomes_adjustments_and_deductions=[{'salaries_and_wages': wages}],
+            )
+            self.assertAlmostEqual(wages - taxHandler.total_tax, net_income, places=6)
+
+    def test_inverse(self):
+        curve = TotalTaxCurve.TotalTaxCurve(2024, SINGLE, SUPPORTED_STATE_WITHOUT_INCOME_TAX)
+        for wages in [1000, 50000, 180000, 900000]:
+            self.assertAlmostEqual(curve.inverse(curve.calculate_taxes(wages)), wages, places=6)
+
+    def test_init_failure_unsupported_state(self):
+        state = "Unsupported"
+
+        with self.assertRaises(ValueError) as cm:
+            _ = TotalTaxCurve.TotalTaxCurve(SUPPORTED_TAX_YEAR, SUPPORTED_FILING_STATUS, state)
+
+        expected_message = f"state must be in SUPPORTED_STATES: {InputValidator.alphabetize_set(SUPPORTED_STATES)}, got: {state}"
+        self.assertEqual(str(cm.exception), expected_message)
+
+
+if __name__ == '__main__':
+    unittest.main()
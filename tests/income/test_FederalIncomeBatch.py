@@ -0,0 +1,105 @@
+# Standard Library Imports
+import random
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.utils.Constants import *
+from src.easytax.income.FederalIncomeHandler import FederalIncomeHandler
+from src.easytax.income.FederalIncomeBatch import FederalIncomeBatch
+
+
+COMPUTED_FIELDS = [
+    "total_income",
+    "total_adjustments",
+    "adjusted_gross_income",
+    "allowable_itemized_deductions",
+    "deduction_taken",
+    "taxable_income_before_qbid",
+    "taxable_income",
+    "niit_income",
+]
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestFederalIncomeBatch(unittest.TestCase):
+
+    def assertMatchesScalar(self, batch, rows, use_standard_deduction):
+        for i, row in enumerate(rows):
+            handler = FederalIncomeHandler(filing_status=str(batch.filing_status[i]), tax_year=int(batch.tax_year[i]), use_standard_deduction=use_standard_deduction[i], **row)
+            for field in COMPUTED_FIELDS:
+                # Compare bits, not just values
+                self.assertEqual(float(getattr(batch, field)[i]).hex(), float(getattr(handler, field)).hex(), f"{field} of row {i}")
+
+    def test_matches_scalar(self):
+        rng = random.Random(0)
+        rows = [{field: round(rng.uniform(-50000, 400000), rng.randint(0, 2)) for field in rng.sample(FederalIncomeBatch.COLUMN_FIELDS, 12)} for _ in range(300)]
+        use_standard_deduction = [rng.random() < 0.5 for _ in rows]
+        columns = {field: [row.get(field, 0.0) for row in rows] for field in FederalIncomeBatch.COLUMN_FIELDS}
+
+        for tax_year in [2022, 2025]:
+            for filing_status in [MARRIED_FILING_JOINTLY, SINGLE]:
+                batch = FederalIncomeBatch(filing_status, tax_year, use_standard_deduction=use_standard_deduction, **columns)
+                self.assertEqual(len(batch), len(rows))
+                self.assertMatchesScalar(batch, rows, use_standard_deduction)
+
+    def test_per_row_tax_year_and_filing_status(self):
+        rng = random.Random(1)
+        rows = [{"salaries_and_wages": rng.uniform(0, 600000), "interest_income": rng.uniform(0, 50000), "taxes_paid": rng.uniform(0, 40000)} for _ in range(200)]
+        use_standard_deduction = [rng.random() < 0.5 for _ in rows]
+        tax_years = [rng.choice(sorted(SUPPORTED_TAX_YEARS)) for _ in rows]
+        filing_statuses = [rng.choice(sorted(SUPPORTED_FILING_STATUSES)) for _ in rows]
+        columns = {field: [row[field] for row in rows] for field in rows[0]}
+
+        batch = FederalIncomeBatch(filing_statuses, tax_years, use_standard_deduction=use_standard_deduction, **columns)
+        self.assertMatchesScalar(batch, rows, use_standard_deduction)
+
+    def test_unsupported_per_row_filing_status(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported combination of status: Head_Of_Household, year 2024"):
+            FederalIncomeBatch([SINGLE, HEAD_OF_HOUSEHOLD], 2024, salaries_and_wages=[1, 2])
+        with self.assertRaisesRegex(ValueError, "Unsupported combination of status: Single, year 2019"):
+            FederalIncomeBatch(SINGLE, [2024, 2019], salaries_and_wages=[1, 2])
+
+    def test_from_records(self):
+        rng = random.Random(2)
+        rows = [{field: rng.uniform(0, 200000) for field in rng.sample(FederalIncomeBatch.COLUMN_FIELDS, 3)} for _ in range(100)]
+        records = [row | {"tax_year": rng.choice(sorted(SUPPORTED_TAX_YEARS))} for row in rows]
+
+        batch = FederalIncomeBatch.from_records(records, filing_status=SINGLE)
+        self.assertEqual(len(batch), len(rows))
+        self.assertMatchesScalar(batch, rows, [True] * len(rows))
+
+        with self.assertRaisesRegex(ValueError, "records cannot be empty"):
+            FederalIncomeBatch.from_records([], filing_status=SINGLE, tax_year=2024)
+
+    def test_omitted_fields_are_zero(self):
+        batch = FederalIncomeBatch(SINGLE, 2024, salaries_and_wages=[50000, 300000], long_term_capital_gains=[0, 100000])
+        self.assertEqual(batch.taxes_paid.tolist(), [0, 0])
+        self.assertEqual(batch.taxable_income.tolist(), [50000 - 14600, 300000 - 14600])
+        self.assertEqual(batch.niit_income.tolist(), [0, 300000 - 14600 - 200000])
+
+    def test_scalars_broadcast(self):
+        batch = FederalIncomeBatch(SINGLE, 2024, use_standard_deduction=False, salaries_and_wages=[50000, 60000], taxes_paid=10000)
+        self.assertEqual(batch.deduction_taken.tolist(), [10000, 10000])
+        self.assertEqual(len(FederalIncomeBatch(SINGLE, 2024, salaries_and_wages=50000)), 1)
+
+    def test_invalid_columns(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key wages"):
+            FederalIncomeBatch(SINGLE, 2024, wages=[1])
+        with self.assertRaises(TypeError):
+            FederalIncomeBatch(SINGLE, 2024, salaries_and_wages=["1"])
+        with self.assertRaises(ValueError):
+            FederalIncomeBatch(SINGLE, 2024, salaries_and_wages=[[1, 2]])
+        with self.assertRaises(ValueError):
+            FederalIncomeBatch(SINGLE, 2024, salaries_and_wages=[1, 2], taxes_paid=[1, 2, 3])
+        with self.assertRaises(ValueError):
+            FederalIncomeBatch(SINGLE, 1999, salaries_and_wages=[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
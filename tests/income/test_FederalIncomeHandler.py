@@ -1,4 +1,5 @@
 # Standard Library Imports
+import pickle
 import unittest
 
 # Local Imports
@@ -148,6 +149,68 @@ class TestFederalIncomeHandler(unittest.TestCase):
         self.assertEqual(federalIncomeHandler1, federalIncomeHandler2)
 
 
+    def test_not_equal(self):
+        federalIncomeHandler1 = federal_income_handler_builder()
+        federalIncomeHandler2 = federal_income_handler_builder(taxes_paid=1)
+
+        self.assertNotEqual(federalIncomeHandler1, federalIncomeHandler2)
+        self.assertNotEqual(federalIncomeHandler1, "Not a handler")
+
+
+    def test_key(self):
+        federalIncomeHandler1 = federal_income_handler_builder()
+        federalIncomeHandler2 = federal_income_handler_builder()
+
+        # Handlers are mutable, so they are not hashable, but their keys are
+        with self.assertRaises(TypeError):
+            hash(federalIncomeHandler1)
+        self.assertEqual(federalIncomeHandler1.key, federalIncomeHandler2.key)
+        self.assertEqual(len({federalIncomeHandler1.key, federalIncomeHandler2.key}), 1)
+
+        # A key taken before the handler is changed keeps its value
+        key = federalIncomeHandler1.key
+        federalIncomeHandler1.taxes_paid = 1
+        self.assertEqual(key, federalIncomeHandler2.key)
+        self.assertNotEqual(federalIncomeHandler1.key, key)
+
+
+    def test_slots(self):
+        federalIncomeHandler = federal_income_handler_builder()
+
+        self.assertFalse(hasattr(federalIncomeHandler, '__dict__'))
+        with self.assertRaises(AttributeError):
+            federalIncomeHandler.not_a_field = 0
+
+
+    def test_pickle(self):
+        federalIncomeHandler = federal_income_handler_builder(interest_income=0.1, taxes_paid=SUPPORTED_TAXES_PAID)
+        unpickled = pickle.loads(pickle.dumps(federalIncomeHandler))
+
+        self.assertEqual(unpickled, federalIncomeHandler)
+        for field in FederalIncomeHandler.__slots__:
+            self.assertEqual(getattr(unpickled, field), getattr(federalIncomeHandler, field))
+        # Only the values are pickled, not the name of every field
+        self.assertNotIn(b"salaries_and_wages", pickle.dumps(federalIncomeHandler))
+
+
+    def test_sources(self):
+        federalIncomeHandler = federal_income_handler_builder(
+            interest_income=0.1,
+            other_income=0.2,
+            taxes_paid=SUPPORTED_TAXES_PAID,
+            other_adjustments=300,
+        )
+        income_sources = federalIncomeHandler.income_sources
+        self.assertEqual(len(income_sources), len(FederalIncomeHandler.INCOME_FIELDS))
+        self.assertEqual(income_sources[0], SUPPORTED_SALARY_AND_WAGES_1)
+        self.assertEqual(federalIncomeHandler.adjustment_sources[-1], 300)
+        self.assertEqual(federalIncomeHandler.deduction_sources[1], SUPPORTED_TAXES_PAID)
+
+        # Totals sum the fields in layout order, exactly as a left-to-right sum would
+        self.assertEqual(federalIncomeHandler.total_income, SUPPORTED_SALARY_AND_WAGES_1 + 0.1 + 0.2)
+        self.assertEqual(federalIncomeHandler.total_adjustments, 300)
+
+
     def test_from_dict(self):
         # Instantiate using the __init__ method with unique values for each field
         federalIncomeHandler1 = FederalIncomeHandler(
@@ -240,6 +303,25 @@ class TestFederalIncomeHandler(unittest.TestCase):
         self.assertEqual(federalIncomeHandler1, federalIncomeHandler2)
 
 
+    def test_from_dict_errors(self):
+        with self.assertRaisesRegex(ValueError, "filing_status and tax_year are required fields"):
+            FederalIncomeHandler.from_dict({"tax_year": SUPPORTED_TAX_YEAR})
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key lottery_winnings"):
+            FederalIncomeHandler.from_dict({"tax_year": SUPPORTED_TAX_YEAR, "filing_status": SUPPORTED_FILING_STATUS, "lottery_winnings": 1})
+
+
+    def test_from_records(self):
+        records = [
+            {"salaries_and_wages": SUPPORTED_SALARY_AND_WAGES_1, "taxes_paid": SUPPORTED_TAXES_PAID},
+            {"taxes_paid": SUPPORTED_TAXES_PAID, "use_standard_deduction": False},
+            {"tax_year": 2022, "interest_income": 100},
+        ]
+        handlers = FederalIncomeHandler.from_records(records, tax_year=SUPPORTED_TAX_YEAR, filing_status=SUPPORTED_FILING_STATUS)
+        expected = [FederalIncomeHandler.from_dict(record | {"tax_year": SUPPORTED_TAX_YEAR, "filing_status": SUPPORTED_FILING_STATUS}) for record in records]
+        self.assertEqual(handlers, expected)
+        self.assertEqual(handlers[2].tax_year, SUPPORTED_TAX_YEAR)
+
+
 
 if __name__ == '__main__':
     unittest.main()
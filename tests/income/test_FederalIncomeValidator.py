@@ -0,0 +1,104 @@
+# Standard Library Imports
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax.utils.Constants import *
+from src.easytax.income.FederalIncomeBatch import FederalIncomeBatch
+from src.easytax.income.FederalIncomeValidator import *
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestFederalIncomeValidator(unittest.TestCase):
+
+    def assertErrors(self, errors, expected):
+        self.assertEqual([(int(row), field, code) for row, field, code in errors], expected)
+
+    def test_valid(self):
+        errors = FederalIncomeValidator.validate_columns(SINGLE, 2024, salaries_and_wages=[1, 2.5, 3], taxes_paid=numpy.zeros(3))
+        self.assertEqual(len(errors), 0)
+        self.assertEqual(FederalIncomeValidator.valid_rows(errors, 3).tolist(), [True, True, True])
+
+    def test_reports_every_problem(self):
+        errors = FederalIncomeValidator.validate_columns(
+            filing_status=[SINGLE, "Not a status", MARRIED_FILING_JOINTLY, SINGLE],
+            tax_year=numpy.array([2024, 2024, 2019, 2024]),
+            state=[GEORGIA, GEORGIA, GEORGIA, "Atlantis"],
+            salaries_and_wages=[1, "2", True, None],
+            taxes_paid=[1.0, 2.0, 3.0, [4]],
+        )
+        self.assertErrors(errors, [
+            (1, "filing_status", UNSUPPORTED_FILING_STATUS),
+            (1, "salaries_and_wages", UNSUPPORTED_TYPE),
+            (2, "tax_year", UNSUPPORTED_TAX_YEAR),
+            (2, "salaries_and_wages", UNSUPPORTED_TYPE),
+            (3, "state", UNSUPPORTED_STATE),
+            (3, "salaries_and_wages", UNSUPPORTED_TYPE),
+            (3, "taxes_paid", UNSUPPORTED_TYPE),
+        ])
+        self.assertEqual(FederalIncomeValidator.valid_rows(errors, 4).tolist(), [True, False, False, False])
+
+    def test_scalars_apply_to_every_row(self):
+        errors = FederalIncomeValidator.validate_columns(SINGLE, 2019, salaries_and_wages=[1, 2])
+        self.assertErrors(errors, [(0, "tax_year", UNSUPPORTED_TAX_YEAR), (1, "tax_year", UNSUPPORTED_TAX_YEAR)])
+
+    def test_numpy_columns(self):
+        errors = FederalIncomeValidator.validate_columns(numpy.array([SINGLE, MARRIED_FILING_SEPARATELY]), numpy.array([2025, 2021]),
+            salaries_and_wages=numpy.array([1.0, 2.0]), taxes_paid=numpy.array([True, False]))
+        self.assertErrors(errors, [
+            (0, "taxes_paid", UNSUPPORTED_TYPE),
+            (1, "tax_year", UNSUPPORTED_TAX_YEAR),
+            (1, "taxes_paid", UNSUPPORTED_TYPE),
+        ])
+
+    def test_married_filing_jointly_households(self):
+        errors = FederalIncomeValidator.validate_columns(
+            filing_status=[MARRIED_FILING_JOINTLY, MARRIED_FILING_JOINTLY, SINGLE, SINGLE, MARRIED_FILING_JOINTLY, MARRIED_FILING_JOINTLY],
+            tax_year=2024,
+            household=[7, 3, 7, 2, 3, 7],
+            dependents=[1, 2, 0, 5, 2, 0],
+            use_standard_deduction=[True, True, True, False, False, True],
+        )
+        # Single filers in a household are not combined, so only the Married Filing Jointly rows must agree
+        self.assertErrors(errors, [
+            (4, "use_standard_deduction", MISMATCHED_STANDARD_DEDUCTION),
+            (5, "dependents", MISMATCHED_DEPENDENTS),
+        ])
+
+    def test_unsupported_column(self):
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key lottery_winnings"):
+            FederalIncomeValidator.validate_columns(SINGLE, 2024, lottery_winnings=[1])
+        with self.assertRaisesRegex(ValueError, "columns must all be the same length"):
+            FederalIncomeValidator.validate_columns(SINGLE, 2024, salaries_and_wages=[1], taxes_paid=[1, 2])
+
+    def test_validate_records(self):
+        records = [
+            {"tax_year": 2024, "salaries_and_wages": 100000},
+            {"tax_year": 2024, "lottery_winnings": 1},
+            {"salaries_and_wages": 1},
+            {"tax_year": [2024], "salaries_and_wages": "100"},
+            {"tax_year": 2023, "salaries_and_wages": 50000.5},
+        ]
+        rows, columns, errors = FederalIncomeValidator.validate_records(records, filing_status=SINGLE)
+        self.assertEqual(rows, 5)
+        self.assertErrors(errors, [
+            (1, "lottery_winnings", UNSUPPORTED_FIELD),
+            (2, "tax_year", MISSING_FIELD),
+            (3, "tax_year", UNSUPPORTED_TAX_YEAR),
+            (3, "salaries_and_wages", UNSUPPORTED_TYPE),
+        ])
+
+        # The valid rows continue into a batch
+        valid = FederalIncomeValidator.select_rows(columns, FederalIncomeValidator.valid_rows(errors, rows))
+        batch = FederalIncomeBatch(**valid)
+        self.assertEqual(batch.salaries_and_wages.tolist(), [100000, 50000.5])
+        self.assertEqual(batch.tax_year.tolist(), [2024, 2023])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 # Standard Library Imports
+import pickle
 import unittest
 
 # Local Imports
@@ -51,6 +52,15 @@ class TestPayrollTaxIncomeHandler(unittest.TestCase):
         self.assertEqual(payrollTaxIncomeHandler1, payrollTaxIncomeHandler2)
 
 
+    def test_pickle(self):
+        payrollTaxIncomeHandler = PayrollTaxIncomeHandler(
+            salaries_and_wages=SUPPORTED_SALARY_AND_WAGES_1
+        )
+        unpickled = pickle.loads(pickle.dumps(payrollTaxIncomeHandler))
+        self.assertEqual(unpickled, payrollTaxIncomeHandler)
+        self.assertEqual(unpickled.taxable_income, payrollTaxIncomeHandler.taxable_income)
+
+
     def test_from_dict(self):
         # Instantiate using the __init__ method with unique values for each field
         payrollTaxIncomeHandler1 = PayrollTaxIncomeHandler(
@@ -64,6 +74,14 @@ class TestPayrollTaxIncomeHandler(unittest.TestCase):
         payrollTaxIncomeHandler2 = PayrollTaxIncomeHandler.from_dict(data)
         self.assertEqual(payrollTaxIncomeHandler1, payrollTaxIncomeHandler2)
 
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key interest_income"):
+            PayrollTaxIncomeHandler.from_dict({"interest_income": 1})
+
+
+    def test_from_records(self):
+        payrollTaxIncomeHandlers = PayrollTaxIncomeHandler.from_records([{"salaries_and_wages": 100000}, {}])
+        self.assertEqual(payrollTaxIncomeHandlers, [PayrollTaxIncomeHandler(100000), PayrollTaxIncomeHandler(0)])
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,167 @@
+# Standard Library Imports
+import http.client
+import json
+import threading
+import unittest
+from unittest import mock
+
+# Local Imports
+from src.easytax.handler.TaxHandler import TaxHandler
+from src.easytax.server.TaxServer import TaxServer
+from src.easytax.utils.Constants import *
+from tests.utils.TestContants import *
+
+
+def record_builder(wages: float, **overrides):
+    return dict({
+        "tax_year": SUPPORTED_TAX_YEAR,
+        "filing_status": SINGLE,
+        "state": SUPPORTED_STATE,
+        "state_data": SUPPORTED_STATE_DATA,
+        "incomes_adjustments_and_deductions": [{"salaries_and_wages": wages, "long_term_capital_gains": wages / 10}],
+    }, **overrides)
+
+
+def summary_builder(record: dict):
+    # Through JSON, as the server's summaries are
+    return json.loads(json.dumps(TaxHandler(**record).summary_json()))
+
+
+class TestTaxServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = TaxServer(("127.0.0.1", 0))
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def connect(self):
+        connection = http.client.HTTPConnection(*self.server.server_address[:2], timeout=10)
+        self.addCleanup(connection.close)
+        return connection
+
+    def post(self, connection, path: str, body: bytes, content_type: str = "application/json"):
+        connection.request("POST", path, body=body, headers={"Content-Type": content_type})
+        response = connection.getresponse()
+        return response.status, response.read()
+
+    def test_brackets_are_preloaded(self):
+        self.assertIn((SUPPORTED_TAX_YEAR, SINGLE, SUPPORTED_STATE), self.server.engine._brackets)
+
+    def test_tax(self):
+        connection = self.connect()
+        # One connection is kept alive for every request
+        for wages in [0, 50000, 250000]:
+            record = record_builder(wages)
+            status, body = self.post(connection, "/v1/tax", json.dumps(record).encode())
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(body), summary_builder(record))
+
+    def test_tax_errors(self):
+        connection = self.connect()
+        status, body = self.post(connection, "/v1/tax", json.dumps(record_builder(1000, tax_year=2019)).encode())
+        self.assertEqual(status, 400)
+        self.assertIn("tax_year must be in SUPPORTED_TAX_YEARS", json.loads(body)["error"])
+
+        status, body = self.post(connection, "/v1/tax", b"[]")
+        self.assertEqual((status, json.loads(body)), (400, {"error": "Expected a JSON object of TaxHandler arguments, recieved: list"}))
+
+        status, body = self.post(connection, "/v1/tax", json.dumps({"tax_year": 2024}).encode())
+        self.assertEqual((status, json.loads(body)), (400, {"error": "Missing key 'incomes_adjustments_and_deductions'"}))
+
+        # Households of the wrong shape are refused, and the connection is still usable
+        for record, error in [
+            (record_builder(1000, tax_year=2023, state=GEORGIA, state_data=[1]), "state_data must be a dict, got: list"),
+            (record_builder(1000, incomes_adjustments_and_deductions=[["salaries_and_wages"]]), "incomes_adjustments_and_deductions must be a list of dicts, got an item of type: list"),
+        ]:
+            status, body = self.post(connection, "/v1/tax", json.dumps(record).encode())
+            self.assertEqual((status, json.loads(body)), (400, {"error": error}))
+
+        # An empty household, and incomes that are not finite, are refused rather than calculated
+        status, body = self.post(connection, "/v1/tax", json.dumps(record_builder(1000, tax_year=2023, state=GEORGIA, incomes_adjustments_and_deductions=[])).encode())
+        self.assertEqual((status, json.loads(body)), (400, {"error": "incomes_adjustments_and_deductions must have at least one person"}))
+        status, body = self.post(connection, "/v1/tax", json.dumps(record_builder(0)).encode().replace(b'"salaries_and_wages": 0', b'"salaries_and_wages": 1e400'))
+        self.assertEqual((status, json.loads(body)), (400, {"error": "salaries_and_wages must be a finite number, got: inf"}))
+
+        # Any other failure to calculate a household is still answered
+        with mock.patch.object(self.server, "compute", side_effect=ZeroDivisionError("division by zero")):
+            status, body = self.post(connection, "/v1/tax", json.dumps(record_builder(1000)).encode())
+        self.assertEqual((status, json.loads(body)), (400, {"error": "division by zero"}))
+        with mock.patch.object(self.server, "compute", return_value={"total_tax_owed": float("nan")}):
+            status, body = self.post(connection, "/v1/tax", json.dumps(record_builder(1000)).encode())
+        self.assertEqual(status, 400)
+
+        status, body = self.post(self.connect(), "/v1/unknown", b"{}")
+        self.assertEqual(status, 404)
+
+    def test_batch(self):
+        records = [record_builder(wages) for wages in range(0, 300000, 1000)]
+        expected = [summary_builder(record) for record in records]
+
+        status, body = self.post(self.connect(), "/v1/tax:batch", json.dumps(records).encode())
+        self.assertEqual(status, 200)
+        self.assertEqual([json.loads(line) for line in body.splitlines()], expected)
+
+        ndjson = b"\n".join(json.dumps(record).encode() for record in records)
+        status, body = self.post(self.connect(), "/v1/tax:batch", ndjson, content_type="application/x-ndjson")
+        self.assertEqual(status, 200)
+        self.assertEqual([json.loads(line) for line in body.splitlines()], expected)
+
+    def test_batch_errors(self):
+        records = [record_builder(1000), record_builder(1000, state="Atlantis"), "not a record", record_builder(2000)]
+        connection = self.connect()
+        status, body = self.post(connection, "/v1/tax:batch", json.dumps(records).encode())
+        lines = [json.loads(line) for line in body.splitlines()]
+
+        # Every household gets a line, in order, so one bad household does not fail the batch
+        self.assertEqual(status, 200)
+        self.assertEqual(lines[0], summary_builder(records[0]))
+        self.assertEqual(lines[1]["index"], 1)
+        self.assertIn("state must be in SUPPORTED_STATES", lines[1]["error"])
+        self.assertEqual(lines[2], {"index": 2, "error": "Expected a JSON object of TaxHandler arguments, recieved: str"})
+        self.assertEqual(lines[3], summary_builder(records[3]))
+
+        # A household of the wrong shape does not cut the stream short
+        records = [record_builder(1000, tax_year=2023, state=GEORGIA, state_data=[1]),
+            record_builder(1000, incomes_adjustments_and_deductions=[["salaries_and_wages"]]), record_builder(2000)]
+        status, body = self.post(connection, "/v1/tax:batch", json.dumps(records).encode())
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(status, 200)
+        self.assertEqual(lines[:2], [{"index": 0, "error": "state_data must be a dict, got: list"},
+            {"index": 1, "error": "incomes_adjustments_and_deductions must be a list of dicts, got an item of type: list"}])
+        self.assertEqual(lines[2], summary_builder(records[2]))
+
+        # Nor does a household that cannot be calculated
+        records = [record_builder(1000, tax_year=2023, state=GEORGIA, incomes_adjustments_and_deductions=[]), record_builder(0), record_builder(2000)]
+        body = json.dumps(records).encode().replace(b'"salaries_and_wages": 0', b'"salaries_and_wages": 1e400')
+        status, body = self.post(connection, "/v1/tax:batch", body)
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(status, 200)
+        self.assertEqual(lines[:2], [{"index": 0, "error": "incomes_adjustments_and_deductions must have at least one person"},
+            {"index": 1, "error": "salaries_and_wages must be a finite number, got: inf"}])
+        self.assertEqual(lines[2], summary_builder(records[2]))
+
+        compute = self.server.compute
+        with mock.patch.object(self.server, "compute", side_effect=[ZeroDivisionError("division by zero"), {"total_tax_owed": float("nan")}, compute(records[2])]):
+            status, body = self.post(connection, "/v1/tax:batch", json.dumps([records[2]] * 3).encode())
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(status, 200)
+        self.assertEqual(lines[0], {"index": 0, "error": "division by zero"})
+        self.assertEqual(lines[1]["index"], 1)
+        self.assertEqual(lines[2], summary_builder(records[2]))
+
+        status, body = self.post(connection, "/v1/tax:batch", b"{not json", content_type="application/x-ndjson")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["index"], 0)
+
+        status, body = self.post(connection, "/v1/tax:batch", b"{}")
+        self.assertEqual((status, json.loads(body)), (400, {"error": "Expected a JSON array of households, recieved: dict"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+# Standard Library Imports
+from contextlib import redirect_stderr
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+# Third Party Imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Local Imports
+from src.easytax import cli
+from src.easytax.files.ResultWriter import CSV_COLUMNS
+from src.easytax.handler.TaxHandler import TaxHandler
+from src.easytax.utils.Constants import *
+
+
+HOUSEHOLDS_CSV = (
+    "household_id,tax_year,filing_status,state,state_data.exemptions,salaries_and_wages,long_term_capital_gains,use_standard_deduction\n"
+    "a,2024,Married_Filing_Jointly,Georgia,0,150000,60000,false\n"
+    "a,,,,,100000,40000,false\n"
+    "b,,Single,Florida,,50000,,\n"
+    "c,2023,Single,Georgia,1,80000,1000,true\n"
+)
+
+# The same households as the CSV, with its tax_year default of 2024 for household b
+HOUSEHOLDS = [
+    TaxHandler(2024, MARRIED_FILING_JOINTLY, GEORGIA, [
+        {"salaries_and_wages": 150000.0, "long_term_capital_gains": 60000.0, "use_standard_deduction": False},
+        {"salaries_and_wages": 100000.0, "long_term_capital_gains": 40000.0, "use_standard_deduction": False}], {"exemptions": 0}),
+    TaxHandler(2024, SINGLE, FLORIDA, [{"salaries_and_wages": 50000.0, "long_term_capital_gains": 0, "use_standard_deduction": True}]),
+    TaxHandler(2023, SINGLE, GEORGIA, [{"salaries_and_wages": 80000.0, "long_term_capital_gains": 1000.0, "use_standard_deduction": True}], {"exemptions": 1}),
+]
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.households = self.path("households.csv")
+        with open(self.households, "w", newline="") as file:
+            file.write(HOUSEHOLDS_CSV)
+
+    def path(self, name: str):
+        return os.path.join(self.directory, name)
+
+    def run_cli(self, *argv):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            cli.main(list(argv))
+        return stderr.getvalue()
+
+    def test_compute_ndjson(self):
+        output = self.path("taxes.ndjson")
+        stderr = self.run_cli("compute", self.households, "--output", output, "--tax-year", "2024")
+        self.assertEqual(stderr, "Calculated 3 household(s)\n")
+
+        with open(output) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual([line.pop("household_id") for line in lines], ["a", "b", "c"])
+        self.assertEqual(lines, [json.loads(json.dumps(household.summary_json())) for household in HOUSEHOLDS])
+
+    def test_compute_csv_in_processes(self):
+        output = self.path("taxes.csv")
+        self.run_cli("compute", self.households, "-o", output, "--tax-year", "2024", "--processes", "2", "--chunk-size", "1")
+
+        with open(output, newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([(row["index"], row["household_id"]) for row in rows], [("0", "a"), ("1", "b"), ("2", "c")])
+        self.assertEqual([float(row["total_tax_owed"]) for row in rows], [household.summary_json()["total_tax_owed"] for household in HOUSEHOLDS])
+
+    def test_compute_jsonl(self):
+        households = self.path("households.jsonl")
+        with open(households, "w") as file:
+            file.write(json.dumps({"tax_year": 2024, "filing_status": SINGLE, "state": FLORIDA, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 50000.0}]}))
+        output = self.path("taxes")
+        self.run_cli("compute", households, "--output", output)
+
+        with open(output) as file:
+            self.assertEqual(json.loads(file.read()), json.loads(json.dumps(TaxHandler(2024, SINGLE, FLORIDA, [{"salaries_and_wages": 50000.0}]).summary_json())))
+
+    @unittest.skipUnless(numpy, "numpy is not installed")
+    def test_convert(self):
+        columns = self.path("households.columns")
+        stderr = self.run_cli("convert", self.households, columns, "--tax-year", "2024")
+        self.assertEqual(stderr, f"Wrote 3 household(s) to {columns}\n")
+
+        for processes in ["1", "2"]:
+            output = self.path(f"taxes-{processes}.csv")
+            self.run_cli("compute", columns, "-o", output, "--processes", processes, "--chunk-size", "2")
+            with open(output, newline="") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual([(row["index"], row["household_id"]) for row in rows], [("0", "a"), ("1", "b"), ("2", "c")])
+            for row, household in zip(rows, HOUSEHOLDS):
+                self.assertAlmostEqual(float(row["total_tax_owed"]), household.summary_json()["total_tax_owed"], places=6)
+
+        # From columns, an NDJSON line holds the columns of the CSV, as there is no per-person summary to write
+        output = self.path("taxes.ndjson")
+        self.run_cli("compute", columns, "-o", output)
+        with open(output) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual(list(lines[0]), ["index", "household_id"] + list(CSV_COLUMNS) + ["total_tax_owed"])
+        self.assertEqual([line["household_id"] for line in lines], ["a", "b", "c"])
+
+        with self.assertRaisesRegex(SystemExit, "tax_year must be in SUPPORTED_TAX_YEARS: .*, got: None, in household 1"):
+            self.run_cli("convert", self.households, columns)
+
+    def test_compute_errors(self):
+        output = self.path("taxes.csv")
+        # Household b has no tax year, and the households before it are still written
+        with self.assertRaisesRegex(SystemExit, "household 1: tax_year must be in SUPPORTED_TAX_YEARS"):
+            self.run_cli("compute", self.households, "-o", output)
+        with open(output, newline="") as file:
+            self.assertEqual(len(list(csv.DictReader(file))), 1)
+
+        # A household of the wrong shape is reported, rather than crashing the command
+        households = self.path("households.jsonl")
+        with open(households, "w") as file:
+            file.write(json.dumps({"tax_year": 2023, "filing_status": SINGLE, "state": GEORGIA, "state_data": [1], "incomes_adjustments_and_deductions": [{"salaries_and_wages": 1}]}))
+        with self.assertRaisesRegex(SystemExit, f"easytax: {households}: household 0: state_data must be a dict, got: list, on line 1"):
+            self.run_cli("compute", households, "-o", output)
+        if numpy is not None:
+            with self.assertRaisesRegex(SystemExit, f"easytax: {households}: state_data must be a dict, got: list, on line 1"):
+                self.run_cli("convert", households, self.path("households.columns"))
+
+        # So is an empty household, and the households before it are still written
+        with open(households, "w") as file:
+            file.write(json.dumps({"tax_year": 2023, "filing_status": SINGLE, "state": GEORGIA, "incomes_adjustments_and_deductions": [{"salaries_and_wages": 1}]}) + "\n")
+            file.write(json.dumps({"tax_year": 2023, "filing_status": SINGLE, "state": GEORGIA, "incomes_adjustments_and_deductions": []}) + "\n")
+        for processes in ["1", "2"]:
+            with self.assertRaisesRegex(SystemExit, f"easytax: {households}: household 1: incomes_adjustments_and_deductions must have at least one person, on line 2"):
+                self.run_cli("compute", households, "-o", output, "--processes", processes)
+            with open(output, newline="") as file:
+                self.assertEqual(len(list(csv.DictReader(file))), 1)
+
+        with open(self.households, "w", newline="") as file:
+            file.write("wages\n1\n")
+        with self.assertRaisesRegex(SystemExit, "Unsupported column wages"):
+            self.run_cli("compute", self.households, "-o", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+# Standard Library Imports
+import subprocess
+import sys
+import unittest
+
+
+def imported_modules(code: str):
+    # A fresh interpreter, so modules imported by other tests do not count
+    result = subprocess.run([sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_package_import_loads_no_submodules(self):
+        modules = imported_modules("import src.easytax.handler, src.easytax.brackets, src.easytax.deductions")
+        self.assertNotIn("src.easytax.handler.TaxHandler", modules)
+        self.assertNotIn("src.easytax.brackets.FederalIncomeTaxBrackets", modules)
+        self.assertNotIn("src.easytax.deductions.FederalStandardDeductions", modules)
+
+    def test_handler_import_does_not_load_logging(self):
+        modules = imported_modules("from src.easytax.handler import FederalTaxHandler")
+        self.assertIn("src.easytax.handler.FederalTaxHandler", modules)
+        self.assertNotIn("src.easytax.handler.TaxHandler", modules)
+        self.assertNotIn("logging", modules)
+
+    def test_attribute_access_imports_submodule(self):
+        import src.easytax as easytax
+        self.assertEqual(easytax.brackets.FederalIncomeTaxBrackets.JURISDICTION, "FederalIncome")
+        self.assertIn("TaxHandler", dir(easytax.handler))
+        with self.assertRaises(AttributeError):
+            easytax.handler.NotAHandler
+
+
+if __name__ == '__main__':
+    unittest.main()
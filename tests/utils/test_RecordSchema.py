@@ -0,0 +1,77 @@
+# Standard Library Imports
+import unittest
+
+# Local Imports
+from src.easytax.utils.RecordSchema import RecordSchema, MISSING_FIELD, UNSUPPORTED_FIELD
+
+
+class Example:
+
+    def __init__(self, name: str, year: int, first: float = 0, second: float = 1):
+        self.arguments = (name, year, first, second)
+
+
+class TestRecordSchema(unittest.TestCase):
+
+    def test_fields(self):
+        schema = RecordSchema(Example)
+        self.assertEqual(schema.fields, ("name", "year", "first", "second"))
+        self.assertEqual(schema.required, ("name", "year"))
+        self.assertEqual(schema.defaults, {"first": 0, "second": 1})
+
+    def test_from_dict(self):
+        schema = RecordSchema(Example)
+        self.assertEqual(schema.from_dict({"year": 2024, "name": "a"}).arguments, ("a", 2024, 0, 1))
+        self.assertEqual(schema.from_dict({"second": 5, "name": "a", "year": 2023, "first": 3}).arguments, ("a", 2023, 3, 5))
+
+    def test_fixed(self):
+        schema = RecordSchema(Example)
+        self.assertEqual(schema.from_dict({"first": 3}, name="a", year=2024).arguments, ("a", 2024, 3, 1))
+        # Fixed arguments override the record's
+        self.assertEqual(schema.from_dict({"year": 2022, "name": "b"}, year=2024).arguments, ("b", 2024, 0, 1))
+
+    def test_errors(self):
+        schema = RecordSchema(Example)
+        with self.assertRaisesRegex(ValueError, "name and year are required fields"):
+            schema.from_dict({"name": "a"})
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key third"):
+            schema.from_dict({"name": "a", "year": 2024, "third": 1})
+        with self.assertRaisesRegex(ValueError, "Unsupported income for key third"):
+            schema.from_dict({"name": "a"}, year=2024, third=1)
+
+    def test_signature_cache(self):
+        schema = RecordSchema(Example)
+        schema.from_records([{"name": "a", "year": 2024}, {"name": "b", "year": 2025}, {"year": 2025, "name": "c"}])
+        self.assertEqual(len(schema._plans), 2)
+
+        schema.MAX_SIGNATURES = 1
+        self.assertEqual(schema.from_dict({"name": "a", "year": 2024, "first": 2}).arguments, ("a", 2024, 2, 1))
+        self.assertEqual(len(schema._plans), 1)
+
+    def test_from_records(self):
+        schema = RecordSchema(Example)
+        records = [{"name": "a", "first": 1}, {"first": 2, "name": "b", "second": 3}]
+        self.assertEqual([example.arguments for example in schema.from_records(records, year=2024)], [("a", 2024, 1, 1), ("b", 2024, 2, 3)])
+        self.assertEqual(schema.from_records([], year=2024), [])
+
+    def test_columns(self):
+        schema = RecordSchema(Example)
+        records = [{"name": "a", "first": 1}, {"name": "b", "first": 2}, {"first": 3, "name": "c"}, {"name": "d"}]
+        self.assertEqual(schema.columns(records, year=2024), (4, {"name": ["a", "b", "c", "d"], "year": 2024, "first": [1, 2, 3, 0]}))
+        self.assertEqual(schema.columns([{"name": "a", "year": 2024}, {"name": "b", "year": 2025, "second": 2}]),
+            (2, {"name": ["a", "b"], "year": [2024, 2025], "second": [1, 2]}))
+        self.assertEqual(schema.columns([], year=2024), (0, {"name": [], "year": 2024}))
+
+    def test_columns_invalid(self):
+        schema = RecordSchema(Example)
+        records = [{"first": 1}, {"name": "a", "first": 2}, {"name": "b", "third": 3}, {"name": "c", "second": 4}]
+        invalid = []
+        self.assertEqual(schema.columns(records, invalid=invalid, year=2024), (4, {"name": [None, "a", None, "c"], "year": 2024, "first": [0, 2, 0, 0], "second": [1, 1, 1, 4]}))
+        self.assertEqual(invalid, [(0, "name", MISSING_FIELD), (2, "third", UNSUPPORTED_FIELD)])
+
+        with self.assertRaisesRegex(ValueError, "name and year are required fields"):
+            schema.columns(records, year=2024)
+
+
+if __name__ == '__main__':
+    unittest.main()